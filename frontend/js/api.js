@@ -3,6 +3,8 @@ class APIClient {
   constructor() {
     // Try to detect if we're running locally or in production
     this.baseURL = this.detectBaseURL();
+    // Last ETag and body per GET endpoint, for If-None-Match revalidation
+    this.etagCache = new Map();
   }
 
   detectBaseURL() {
@@ -39,9 +41,18 @@ class APIClient {
       config.method = 'GET';
     }
 
+    const cached = config.method === "GET" ? this.etagCache.get(endpoint) : undefined;
+    if (cached) {
+      config.headers = { ...config.headers, "If-None-Match": cached.etag };
+    }
+
     try {
       const response = await fetch(url, config);
 
+      if (response.status === 304 && cached) {
+        return cached.data;
+      }
+
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
         throw new Error(
@@ -49,7 +60,12 @@ class APIClient {
         );
       }
 
-      return await response.json();
+      const data = await response.json();
+      const etag = response.headers.get("ETag");
+      if (config.method === "GET" && etag) {
+        this.etagCache.set(endpoint, { etag, data });
+      }
+      return data;
     } catch (error) {
       console.error(`API request failed: ${endpoint}`, error);
       throw error;
@@ -108,8 +124,34 @@ class APIClient {
     return await this.request(endpoint);
   }
 
-  async getStats() {
-    return await this.request("/stats");
+  async getStats(params = {}) {
+    const queryString = new URLSearchParams();
+
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) {
+        queryString.append(key, value.toString());
+      }
+    });
+
+    const endpoint = `/stats${
+      queryString.toString() ? "?" + queryString.toString() : ""
+    }`;
+    return await this.request(endpoint);
+  }
+
+  async getTop(params = {}) {
+    const queryString = new URLSearchParams();
+
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) {
+        queryString.append(key, value.toString());
+      }
+    });
+
+    const endpoint = `/top${
+      queryString.toString() ? "?" + queryString.toString() : ""
+    }`;
+    return await this.request(endpoint);
   }
 
   // NLP endpoints
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+QuickLedger Storage Benchmark
+Compares serializer and compression combinations for the ledger file
+against the default pretty-printed, uncompressed JSON.
+
+Usage:
+    python scripts/benchmark_storage.py [--expenses 100000] [--repeat 3]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.ledger.config import Settings  # noqa: E402
+from src.ledger.domain import new_expense_id  # noqa: E402
+from src.ledger.repositories import FileManager  # noqa: E402
+from src.ledger.repositories.compression import CODECS, get_codec  # noqa: E402
+from src.ledger.repositories.serializers import SERIALIZERS, get_serializer  # noqa: E402
+
+NAMES = ["Rice", "Beans", "Fuel", "Transport", "Data", "Lunch", "Rent", "Electricity"]
+
+
+def make_ledger(expenses: int) -> dict:
+    """Build a synthetic ledger with a few expenses per day."""
+    rng = random.Random(42)
+    data = {}
+    day = date(2020, 1, 1)
+    while expenses > 0:
+        key = day.isoformat()
+        count = min(expenses, rng.randint(1, 8))
+        data[key] = [
+            {
+                "expense": rng.choice(NAMES),
+                "amount": round(rng.uniform(100, 50000), 2),
+                "id": new_expense_id(key),
+            }
+            for _ in range(count)
+        ]
+        expenses -= count
+        day += timedelta(days=1)
+    return data
+
+
+def available(names, getter):
+    """Filter out formats whose optional library is not installed."""
+    result = []
+    for name in names:
+        try:
+            getter(name)
+            result.append(name)
+        except ValueError:
+            pass
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--expenses", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = make_ledger(args.expenses)
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings = Settings(base_dir=Path(tmp))
+        settings.auto_backup = False
+        path = Path(tmp) / "ledger.json"
+
+        for serializer in available(SERIALIZERS, get_serializer):
+            for compression in available(CODECS, get_codec):
+                settings.serializer = serializer
+                settings.compression = compression
+                manager = FileManager(settings)
+
+                write_time = read_time = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    manager.save_json(path, data)
+                    write_time = min(write_time, time.perf_counter() - start)
+
+                    # Bypass the read cache so every read parses the file.
+                    FileManager.read_cache.clear()
+                    start = time.perf_counter()
+                    manager.load_json(path, readonly=True)
+                    read_time = min(read_time, time.perf_counter() - start)
+
+                rows.append((serializer, compression, path.stat().st_size, write_time, read_time))
+
+    baseline_size = rows[0][2]
+    print(f"{args.expenses} expenses, best of {args.repeat}\n")
+    print(f"{'serializer':<14}{'compression':<13}{'size':>12}{'ratio':>8}"
+          f"{'write MB/s':>12}{'read MB/s':>11}")
+    for serializer, compression, size, write_time, read_time in rows:
+        # Throughput is measured in baseline (plain JSON) bytes per second.
+        mb = baseline_size / 1_000_000
+        print(f"{serializer:<14}{compression:<13}{size:>12,}{size / baseline_size:>8.2f}"
+              f"{mb / write_time:>12.1f}{mb / read_time:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
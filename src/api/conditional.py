@@ -0,0 +1,59 @@
+"""Conditional GET support (ETag / If-None-Match)."""
+
+import hashlib
+import json
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from JSON-compatible version parts.
+
+    The current date is always mixed in, so responses that default to
+    "today" or "this month" are revalidated when the day changes.
+
+    Args:
+        parts: Version stamps the response depends on
+
+    Returns:
+        Quoted ETag value
+    """
+    raw = json.dumps([date.today().isoformat(), *parts], default=str, separators=(",", ":"))
+    return '"' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest() + '"'
+
+
+def _matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def not_modified(request: Request, response: Response, *parts: Any) -> Optional[Response]:
+    """
+    Answer a conditional GET from version stamps alone.
+
+    Call this before loading or computing anything. When the client's
+    ``If-None-Match`` matches, the returned 304 response should be returned
+    as is; otherwise the ETag is set on ``response`` and None is returned.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers the route's result is sent with
+        parts: Version stamps the response depends on
+
+    Returns:
+        A 304 response, or None if the route should compute its result
+    """
+    etag = make_etag(*parts)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    header = request.headers.get("if-none-match")
+    if header is not None and _matches(header, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -2,7 +2,10 @@
 
 from functools import lru_cache
 
+from fastapi import Depends
+
 from ..ledger.repositories.expense_repository import ExpenseRepository
+from ..ledger.repositories.factory import create_expense_repository
 from ..ledger.repositories.category_repository import CategoryRepository
 from ..ledger.repositories.budget_repository import BudgetRepository
 from ..ledger.repositories.user_repository import UserRepository
@@ -11,12 +14,13 @@ from ..ledger.services.category_service import CategoryService
 from ..ledger.services.budget_service import BudgetService
 from ..ledger.services.analytics_service import AnalyticsService
 from ..ledger.services.user_service import UserService
+from ..ledger.services.async_facade import AsyncFacade
 
 
 @lru_cache()
 def get_expense_repository() -> ExpenseRepository:
-    """Get expense repository instance."""
-    return ExpenseRepository()
+    """Get expense repository instance for the configured storage backend."""
+    return create_expense_repository()
 
 
 @lru_cache()
@@ -66,3 +70,30 @@ def get_user_service() -> UserService:
     """Get user service instance."""
     return UserService(get_user_repository())
 
+
+def get_async_expense_service(
+    service: ExpenseService = Depends(get_expense_service),
+) -> AsyncFacade[ExpenseService]:
+    """Get the expense service with methods run off the event loop."""
+    return AsyncFacade(service)
+
+
+def get_async_category_service(
+    service: CategoryService = Depends(get_category_service),
+) -> AsyncFacade[CategoryService]:
+    """Get the category service with methods run off the event loop."""
+    return AsyncFacade(service)
+
+
+def get_async_budget_service(
+    service: BudgetService = Depends(get_budget_service),
+) -> AsyncFacade[BudgetService]:
+    """Get the budget service with methods run off the event loop."""
+    return AsyncFacade(service)
+
+
+def get_async_analytics_service(
+    service: AnalyticsService = Depends(get_analytics_service),
+) -> AsyncFacade[AnalyticsService]:
+    """Get the analytics service with methods run off the event loop."""
+    return AsyncFacade(service)
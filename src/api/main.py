@@ -9,6 +9,7 @@ from .routes.analytics import router as analytics_router
 from .routes.utility import router as utility_router
 from .routes.nlp import router as nlp_router
 from .routes.budget import router as budget_router
+from .routes.export import router as export_router
 
 # Create FastAPI app
 app = FastAPI(
@@ -27,6 +28,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 # Include routers
@@ -35,4 +37,5 @@ app.include_router(analytics_router)
 app.include_router(utility_router)
 app.include_router(nlp_router)
 app.include_router(budget_router)
+app.include_router(export_router)
 
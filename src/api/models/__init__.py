@@ -1,12 +1,19 @@
 """API models (Pydantic) for request/response validation."""
 
-from .expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse, PaginatedExpensesResponse
+from .expense import (
+    ExpenseCreate,
+    ExpenseBatchCreate,
+    ExpenseUpdate,
+    ExpenseResponse,
+    PaginatedExpensesResponse,
+)
 from .analytics import SummaryResponse, StatsResponse
 from .budget import BudgetResponse, BudgetHistoryResponse
 from .utility import HealthResponse, APIInfoResponse
 
 __all__ = [
     "ExpenseCreate",
+    "ExpenseBatchCreate",
     "ExpenseUpdate",
     "ExpenseResponse",
     "PaginatedExpensesResponse",
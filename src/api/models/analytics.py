@@ -29,4 +29,7 @@ class StatsResponse(BaseModel):
     category_breakdown: Dict[str, float]
     monthly_spending: Optional[Dict[str, float]] = None
     current_month_spent: Optional[float] = None
+    granularity: Optional[str] = None
+    spending_by_period: Optional[Dict[str, float]] = None
+    approximate: Optional[Dict[str, Any]] = None
 
@@ -1,7 +1,7 @@
 """Budget API models."""
 
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
 
 class BudgetResponse(BaseModel):
@@ -22,6 +22,9 @@ class BudgetHistoryResponse(BaseModel):
     """Response model for budget history."""
 
     history: List[Dict[str, Any]]
+    total: int = 0
+    limit: Optional[int] = None
+    offset: int = 0
     auto_reset: bool
     current_month: str
 
@@ -12,6 +12,12 @@ class ExpenseCreate(BaseModel):
     date: Optional[str] = None  # Optional: defaults to current date if not provided
 
 
+class ExpenseBatchCreate(BaseModel):
+    """Request model for creating several expenses at once."""
+
+    expenses: List[ExpenseCreate]
+
+
 class ExpenseUpdate(BaseModel):
     """Request model for updating an expense."""
 
@@ -26,6 +32,7 @@ class ExpenseResponse(BaseModel):
     expense: str
     amount: float
     index: int
+    id: Optional[str] = None
 
 
 class PaginatedExpensesResponse(BaseModel):
@@ -37,4 +44,5 @@ class PaginatedExpensesResponse(BaseModel):
     offset: int
     has_more: bool
     returned: int
+    next_cursor: Optional[str] = None
 
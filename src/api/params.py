@@ -0,0 +1,72 @@
+"""Shared parsing of date filter query parameters."""
+
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+
+def validate_date_format(date_str: str) -> bool:
+    """Validate date string format (YYYY-MM-DD)."""
+    try:
+        datetime.strptime(date_str, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+def parse_date_range(range: str) -> Tuple[str, str]:
+    """
+    Parse a ``start_date,end_date`` range parameter.
+
+    Args:
+        range: Range parameter value
+
+    Returns:
+        Tuple of (start_date, end_date)
+
+    Raises:
+        HTTPException: 400 if the range is malformed or reversed
+    """
+    try:
+        start_date, end_date = (part.strip() for part in range.split(","))
+        if not validate_date_format(start_date) or not validate_date_format(end_date):
+            raise ValueError("Invalid date format")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="Start date cannot be after end date")
+    return start_date, end_date
+
+
+def resolve_period(
+    date: Optional[str], week: Optional[bool], range: Optional[str]
+) -> Tuple[Optional[str], Optional[str], str]:
+    """
+    Resolve the date/week/range filters to a date range.
+
+    Args:
+        date: Specific date (YYYY-MM-DD)
+        week: Whether to use the current week (last 7 days)
+        range: Date range (start_date,end_date)
+
+    Returns:
+        Tuple of (start_date, end_date, period description); both dates
+        are None for all time
+
+    Raises:
+        HTTPException: 400 if a date or range is malformed
+    """
+    if date:
+        if not validate_date_format(date):
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        return date, date, f"Date: {date}"
+    if week:
+        today = datetime.today()
+        week_start = (today + timedelta(days=-6)).strftime("%Y-%m-%d")
+        week_end = today.strftime("%Y-%m-%d")
+        return week_start, week_end, f"Week: {week_start} to {week_end}"
+    if range:
+        start_date, end_date = parse_date_range(range)
+        return start_date, end_date, f"Range: {start_date} to {end_date}"
+    return None, None, "All time"
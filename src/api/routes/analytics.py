@@ -1,65 +1,79 @@
 """Analytics and summary routes."""
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 from ..models.analytics import SummaryResponse, StatsResponse
-from ..dependencies import get_analytics_service, get_expense_service
+from ..conditional import not_modified
+from ..params import resolve_period, validate_date_format
+from ..dependencies import get_async_analytics_service, get_async_expense_service
 from ...ledger.services import AnalyticsService, ExpenseService
+from ...ledger.services.async_facade import AsyncFacade
+from ...ledger.services.pagination import MAX_PAGE_SIZE
 
-
-router = APIRouter(tags=["analytics"])
+DEFAULT_PAGE_SIZE = 100
 
 
-def validate_date_format(date_str: str) -> bool:
-    """Validate date string format (YYYY-MM-DD)."""
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
+router = APIRouter(tags=["analytics"])
 
 
 @router.get("/summary", response_model=Dict[str, Any])
 async def get_summary_endpoint(
+    request: Request,
+    response: Response,
     date: Optional[str] = Query(None, description="Specific date (YYYY-MM-DD)"),
     week: Optional[bool] = Query(False, description="Get summary for current week"),
     range: Optional[str] = Query(None, description="Date range (start_date,end_date)"),
-    analytics_service: AnalyticsService = Depends(get_analytics_service),
-    expense_service: ExpenseService = Depends(get_expense_service),
+    totals_only: bool = Query(False, description="Return totals without the expense list"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=MAX_PAGE_SIZE, description="Page size; returns totals plus one page of expenses"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    analytics_service: AsyncFacade[AnalyticsService] = Depends(get_async_analytics_service),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
-    """Get expense summary with optional filtering."""
+    """
+    Get expense summary with optional filtering.
+
+    With ``totals_only`` only the totals are returned. With ``limit`` (or a
+    ``cursor``) the totals come with one page of expenses and a
+    ``next_cursor``, so the response size does not grow with the ledger.
+    """
     try:
+        cached = not_modified(request, response, await analytics_service.get_version())
+        if cached is not None:
+            return cached
+
+        if totals_only or limit is not None or cursor is not None:
+            start_date, end_date, period_description = resolve_period(date, week, range)
+            try:
+                summary = {
+                    "period": period_description,
+                    **await expense_service.get_range_totals(start_date, end_date),
+                }
+                if not totals_only:
+                    summary.update(
+                        await expense_service.get_expenses_page(
+                            start_date, end_date, cursor, limit or DEFAULT_PAGE_SIZE
+                        )
+                    )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return summary
+
         # Get filtered expenses
+        start_date, end_date, period_description = resolve_period(date, week, range)
         if date:
-            if not validate_date_format(date):
-                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-            expenses_dict = {date: expense_service.get_expenses_by_date(date)}
-            period_description = f"Date: {date}"
+            expenses_dict = {date: await expense_service.get_expenses_by_date(date)}
         elif week:
-            expenses_dict = expense_service.get_expenses_by_week()
-            from datetime import timedelta
-            today = datetime.today()
-            week_start = (today + timedelta(days=-6)).strftime("%Y-%m-%d")
-            week_end = today.strftime("%Y-%m-%d")
-            period_description = f"Week: {week_start} to {week_end}"
+            expenses_dict = await expense_service.get_expenses_by_week()
         elif range:
-            try:
-                start_date, end_date = range.split(",")
-                start_date = start_date.strip()
-                end_date = end_date.strip()
-                if not validate_date_format(start_date) or not validate_date_format(end_date):
-                    raise ValueError("Invalid date format")
-                expenses_dict = expense_service.get_expenses_by_range(start_date, end_date)
-                period_description = f"Range: {start_date} to {end_date}"
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=str(e))
+            expenses_dict = await expense_service.get_expenses_by_range(start_date, end_date)
         else:
-            expenses_dict = expense_service.get_all_expenses()
-            period_description = "All time"
+            expenses_dict = await expense_service.get_all_expenses()
 
-        return analytics_service.calculate_summary_stats(expenses_dict, period_description)
+        return await analytics_service.calculate_summary_stats(expenses_dict, period_description)
 
     except HTTPException:
         raise
@@ -70,7 +84,9 @@ async def get_summary_endpoint(
 @router.get("/monthly/{month}", response_model=Dict[str, Any])
 async def get_monthly_stats(
     month: str,
-    analytics_service: AnalyticsService = Depends(get_analytics_service),
+    request: Request,
+    response: Response,
+    analytics_service: AsyncFacade[AnalyticsService] = Depends(get_async_analytics_service),
 ):
     """Get statistics for a specific month (YYYY-MM format)."""
     try:
@@ -80,7 +96,11 @@ async def get_monthly_stats(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM")
 
-        return analytics_service.get_monthly_stats(month)
+        cached = not_modified(request, response, await analytics_service.get_version())
+        if cached is not None:
+            return cached
+
+        return await analytics_service.get_monthly_stats(month)
 
     except HTTPException:
         raise
@@ -90,11 +110,56 @@ async def get_monthly_stats(
 
 @router.get("/stats", response_model=Dict[str, Any])
 async def get_stats_endpoint(
-    analytics_service: AnalyticsService = Depends(get_analytics_service),
+    request: Request,
+    response: Response,
+    start: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    granularity: str = Query("month", description="Period bucket size: day, week or month"),
+    approximate: bool = Query(
+        False, description="Add sketch-based quantiles, distinct counts and frequent expenses"
+    ),
+    analytics_service: AsyncFacade[AnalyticsService] = Depends(get_async_analytics_service),
 ):
-    """Get comprehensive analytics and statistics."""
+    """Get comprehensive analytics and statistics, optionally for a date range."""
     try:
-        return analytics_service.calculate_comprehensive_stats()
+        for value in (start, end):
+            if value is not None and not validate_date_format(value):
+                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        cached = not_modified(request, response, await analytics_service.get_version())
+        if cached is not None:
+            return cached
+        return await analytics_service.calculate_comprehensive_stats(start, end, granularity, approximate)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting stats: {str(e)}")
 
+
+@router.get("/top", response_model=Dict[str, Any])
+async def get_top_endpoint(
+    request: Request,
+    response: Response,
+    by: str = Query("amount", description="Rank by amount or count"),
+    dimension: str = Query("name", description="Rank expense names, categories or days"),
+    k: int = Query(10, ge=1, le=100, description="Number of entries"),
+    start: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    analytics_service: AsyncFacade[AnalyticsService] = Depends(get_async_analytics_service),
+):
+    """Get the top k expense names, categories or days by amount or count."""
+    try:
+        for value in (start, end):
+            if value is not None and not validate_date_format(value):
+                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        cached = not_modified(request, response, await analytics_service.get_version())
+        if cached is not None:
+            return cached
+        return await analytics_service.get_top(by, dimension, k, start, end)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting top entries: {str(e)}")
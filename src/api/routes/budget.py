@@ -1,10 +1,12 @@
 """Budget management routes."""
 
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from typing import Dict, Any, Optional
 
 from ..models.budget import BudgetResponse, BudgetHistoryResponse
-from ..dependencies import get_budget_service
+from ..conditional import not_modified
+from ..dependencies import get_async_budget_service
+from ...ledger.services.async_facade import AsyncFacade
 from ...ledger.services.budget_service import BudgetService
 
 
@@ -13,11 +15,18 @@ router = APIRouter(prefix="/budget", tags=["budget"])
 
 @router.get("", response_model=Dict[str, Any])
 async def get_budget(
-    budget_service: BudgetService = Depends(get_budget_service),
+    request: Request,
+    response: Response,
+    budget_service: AsyncFacade[BudgetService] = Depends(get_async_budget_service),
 ):
     """Get current month's budget information."""
     try:
-        monthly_budget = budget_service.get_budget_status()
+        cached = not_modified(request, response, await budget_service.get_version())
+        if cached is not None:
+            return cached
+
+        monthly_budget = await budget_service.get_budget_status()
+        budget = await budget_service.run(budget_service.budget_repo.load)
 
         return {
             "month": monthly_budget.month,
@@ -26,7 +35,7 @@ async def get_budget(
             "remaining": monthly_budget.remaining,
             "percentage": monthly_budget.percentage_used,
             "over_budget": monthly_budget.is_over_budget,
-            "auto_reset": budget_service.budget_repo.load().auto_reset,
+            "auto_reset": budget.auto_reset,
             "created_at": monthly_budget.created_at,
             "reset_from_previous": monthly_budget.reset_from_previous,
         }
@@ -38,14 +47,14 @@ async def get_budget(
 @router.post("", response_model=Dict[str, Any])
 async def set_budget(
     amount: float = Query(..., description="Monthly budget amount"),
-    budget_service: BudgetService = Depends(get_budget_service),
+    budget_service: AsyncFacade[BudgetService] = Depends(get_async_budget_service),
 ):
     """Set budget for current month."""
     try:
         if amount < 0:
             raise HTTPException(status_code=400, detail="Budget amount must be positive")
 
-        monthly_budget = budget_service.set_monthly_budget(amount)
+        monthly_budget = await budget_service.set_monthly_budget(amount)
 
         return {
             "message": "Budget set successfully",
@@ -64,11 +73,11 @@ async def set_budget(
 @router.put("/auto-reset", response_model=Dict[str, Any])
 async def toggle_auto_reset(
     enabled: bool = Query(..., description="Enable/disable automatic monthly budget reset"),
-    budget_service: BudgetService = Depends(get_budget_service),
+    budget_service: AsyncFacade[BudgetService] = Depends(get_async_budget_service),
 ):
     """Toggle automatic monthly budget reset."""
     try:
-        budget_service.toggle_auto_reset(enabled)
+        await budget_service.toggle_auto_reset(enabled)
 
         return {
             "message": f"Auto-reset {'enabled' if enabled else 'disabled'} successfully",
@@ -81,12 +90,20 @@ async def toggle_auto_reset(
 
 @router.get("/history", response_model=Dict[str, Any])
 async def get_budget_history(
-    budget_service: BudgetService = Depends(get_budget_service),
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Number of months to return (1-1000)"),
+    offset: int = Query(0, ge=0, description="Number of months to skip"),
+    budget_service: AsyncFacade[BudgetService] = Depends(get_async_budget_service),
 ):
-    """Get budget history for all months."""
+    """Get budget history, newest month first."""
     try:
-        history = budget_service.get_budget_history()
-        budget = budget_service.budget_repo.load()
+        cached = not_modified(request, response, await budget_service.get_version())
+        if cached is not None:
+            return cached
+
+        history = await budget_service.get_budget_history(limit=limit, offset=offset)
+        budget = await budget_service.run(budget_service.budget_repo.load)
 
         history_dicts = []
         for monthly_budget in history:
@@ -103,21 +120,26 @@ async def get_budget_history(
 
         return {
             "history": history_dicts,
+            "total": len(budget.monthly_budgets),
+            "limit": limit,
+            "offset": offset,
             "auto_reset": budget.auto_reset,
-            "current_month": budget_service.get_current_month(),
+            "current_month": await budget_service.get_current_month(),
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting budget history: {str(e)}")
 
 
 @router.delete("", response_model=Dict[str, str])
 async def delete_current_budget(
-    budget_service: BudgetService = Depends(get_budget_service),
+    budget_service: AsyncFacade[BudgetService] = Depends(get_async_budget_service),
 ):
     """Delete current month's budget."""
     try:
-        budget_service.delete_current_budget()
+        await budget_service.delete_current_budget()
         return {"message": "Current month's budget deleted successfully"}
 
     except Exception as e:
@@ -1,30 +1,29 @@
 """Expense management routes."""
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
-from ..models.expense import ExpenseCreate, ExpenseUpdate, ExpenseResponse, PaginatedExpensesResponse
-from ..dependencies import get_expense_service
+from ..models.expense import (
+    ExpenseCreate,
+    ExpenseBatchCreate,
+    ExpenseUpdate,
+    ExpenseResponse,
+    PaginatedExpensesResponse,
+)
+from ..conditional import not_modified
+from ..params import resolve_period, validate_date_format
+from ..dependencies import get_async_expense_service
+from ...ledger.services.async_facade import AsyncFacade
 from ...ledger.services.expense_service import ExpenseService
 
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
 
-def validate_date_format(date_str: str) -> bool:
-    """Validate date string format (YYYY-MM-DD)."""
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
-
-
 @router.post("", response_model=Dict[str, Any])
 async def create_expense(
     expense_data: ExpenseCreate,
-    expense_service: ExpenseService = Depends(get_expense_service),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
     """Add a new expense (date defaults to current date)."""
     try:
@@ -32,13 +31,14 @@ async def create_expense(
         if expense_data.date and not validate_date_format(expense_data.date):
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-        expense = expense_service.add_expense(
+        expense = await expense_service.add_expense(
             expense_data.expense, expense_data.amount, expense_data.date
         )
 
         return {
             "message": "Expense added successfully",
             "expense": {
+                "id": expense.id,
                 "date": expense.date,
                 "expense": expense.expense,
                 "amount": expense.amount,
@@ -50,67 +50,99 @@ async def create_expense(
         raise HTTPException(status_code=500, detail=f"Error adding expense: {str(e)}")
 
 
+@router.post("/batch", response_model=Dict[str, Any])
+async def create_expenses_batch(
+    batch: ExpenseBatchCreate,
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+):
+    """Add several expenses in a single write (dates default to current date)."""
+    try:
+        if not batch.expenses:
+            raise HTTPException(status_code=400, detail="At least one expense must be provided")
+
+        for expense_data in batch.expenses:
+            if expense_data.date and not validate_date_format(expense_data.date):
+                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+        expenses = await expense_service.add_expenses(
+            [expense_data.model_dump() for expense_data in batch.expenses]
+        )
+
+        return {
+            "message": f"Successfully added {len(expenses)} expense(s)",
+            "count": len(expenses),
+            "expenses": [
+                {
+                    "id": expense.id,
+                    "date": expense.date,
+                    "expense": expense.expense,
+                    "amount": expense.amount,
+                }
+                for expense in expenses
+            ],
+        }
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error adding expenses: {str(e)}")
+
+
 @router.get("", response_model=PaginatedExpensesResponse)
 async def get_expenses(
+    request: Request,
+    response: Response,
     date: Optional[str] = Query(None, description="Specific date (YYYY-MM-DD)"),
     week: Optional[bool] = Query(False, description="Get expenses for current week"),
     range: Optional[str] = Query(None, description="Date range (start_date,end_date)"),
     limit: int = Query(50, ge=1, le=1000, description="Number of expenses to return (1-1000)"),
     offset: int = Query(0, ge=0, description="Number of expenses to skip"),
-    expense_service: ExpenseService = Depends(get_expense_service),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
-    """Get expenses with optional filtering and pagination."""
+    """
+    Get expenses with optional filtering and pagination, newest first.
+
+    Follow ``next_cursor`` to page through the ledger; only the dates a page
+    covers are read. ``offset`` still works but reads the skipped rows.
+    """
     try:
-        # Filter expenses
-        if date:
-            if not validate_date_format(date):
-                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-            expenses_dict = {date: expense_service.get_expenses_by_date(date)}
-        elif week:
-            expenses_dict = expense_service.get_expenses_by_week()
-        elif range:
-            try:
-                start_date, end_date = range.split(",")
-                start_date = start_date.strip()
-                end_date = end_date.strip()
-                if not validate_date_format(start_date) or not validate_date_format(end_date):
-                    raise ValueError("Invalid date format")
-                expenses_dict = expense_service.get_expenses_by_range(start_date, end_date)
-            except ValueError as e:
-                raise HTTPException(status_code=400, detail=str(e))
-        else:
-            expenses_dict = expense_service.get_all_expenses()
-
-        # Format expenses
-        all_expenses = []
-        for date_key, date_expenses in expenses_dict.items():
-            for index, expense in enumerate(date_expenses):
-                all_expenses.append(
-                    ExpenseResponse(
-                        date=date_key,
-                        expense=expense["expense"],
-                        amount=float(expense["amount"]),
-                        index=index,
-                    )
-                )
-
-        # Sort by date (newest first)
-        all_expenses.sort(key=lambda x: x.date, reverse=True)
-
-        # Apply pagination
-        total = len(all_expenses)
-        start_idx = offset
-        end_idx = offset + limit
-        paginated_expenses = all_expenses[start_idx:end_idx]
-        has_more = end_idx < total
+        cached = not_modified(request, response, await expense_service.get_version())
+        if cached is not None:
+            return cached
+
+        start_date, end_date, _ = resolve_period(date, week, range)
+        if cursor is not None and offset:
+            raise HTTPException(status_code=400, detail="Use either cursor or offset, not both")
+
+        try:
+            page = await expense_service.get_expenses_page(
+                start_date, end_date, cursor, limit, newest_first=True, offset=offset
+            )
+            totals = await expense_service.get_range_totals(start_date, end_date)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        expenses = [
+            ExpenseResponse(
+                date=expense["date"],
+                expense=expense["expense"],
+                amount=float(expense["amount"]),
+                index=expense["index"],
+                id=expense.get("id"),
+            )
+            for expense in page["expenses"]
+        ]
 
         return PaginatedExpensesResponse(
-            expenses=paginated_expenses,
-            total=total,
+            expenses=expenses,
+            total=totals["transaction_count"],
             limit=limit,
             offset=offset,
-            has_more=has_more,
-            returned=len(paginated_expenses),
+            has_more=page["next_cursor"] is not None,
+            returned=len(expenses),
+            next_cursor=page["next_cursor"],
         )
 
     except HTTPException:
@@ -119,12 +151,74 @@ async def get_expenses(
         raise HTTPException(status_code=500, detail=f"Error retrieving expenses: {str(e)}")
 
 
+# ID routes are registered before the /{date}/{index} routes they would
+# otherwise be shadowed by.
+@router.get("/id/{expense_id}", response_model=ExpenseResponse)
+async def get_expense_by_id(
+    expense_id: str,
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+):
+    """Get an expense by its stable ID."""
+    try:
+        return ExpenseResponse(**await expense_service.get_expense_by_id(expense_id))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving expense: {str(e)}")
+
+
+@router.put("/id/{expense_id}", response_model=Dict[str, Any])
+async def update_expense_by_id(
+    expense_id: str,
+    expense_update: ExpenseUpdate,
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+):
+    """Edit an expense by its stable ID."""
+    try:
+        if expense_update.expense is None and expense_update.amount is None:
+            raise HTTPException(
+                status_code=400, detail="At least one field (expense or amount) must be provided"
+            )
+
+        updated_expense = await expense_service.update_expense_by_id(
+            expense_id, expense_update.expense, expense_update.amount
+        )
+
+        return {
+            "message": "Expense updated successfully",
+            "expense": updated_expense,
+        }
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error updating expense: {str(e)}")
+
+
+@router.delete("/id/{expense_id}", response_model=Dict[str, str])
+async def delete_expense_by_id(
+    expense_id: str,
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+):
+    """Delete an expense by its stable ID."""
+    try:
+        await expense_service.delete_expense_by_id(expense_id)
+        return {"message": "Expense deleted successfully"}
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error deleting expense: {str(e)}")
+
+
 @router.put("/{date}/{index}", response_model=Dict[str, Any])
 async def update_expense(
     date: str,
     index: int,
     expense_update: ExpenseUpdate,
-    expense_service: ExpenseService = Depends(get_expense_service),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
     """Edit an expense on a specific date by index."""
     try:
@@ -136,10 +230,10 @@ async def update_expense(
                 status_code=400, detail="At least one field (expense or amount) must be provided"
             )
 
-        expense_service.update_expense(date, index, expense_update.expense, expense_update.amount)
+        await expense_service.update_expense(date, index, expense_update.expense, expense_update.amount)
 
         # Get updated expense
-        expenses = expense_service.get_expenses_by_date(date)
+        expenses = await expense_service.get_expenses_by_date(date)
         if index >= len(expenses):
             raise HTTPException(status_code=404, detail="Expense not found")
 
@@ -167,14 +261,14 @@ async def update_expense(
 async def delete_expense_endpoint(
     date: str,
     index: int,
-    expense_service: ExpenseService = Depends(get_expense_service),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
     """Delete an expense on a specific date by index."""
     try:
         if not validate_date_format(date):
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-        expense_service.delete_expense(date, index)
+        await expense_service.delete_expense(date, index)
 
         return {"message": "Expense deleted successfully"}
 
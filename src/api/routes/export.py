@@ -0,0 +1,145 @@
+"""Streaming export routes."""
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from ..dependencies import get_async_category_service, get_async_expense_service
+from ..params import parse_date_range
+from ...ledger.services.async_facade import AsyncFacade
+from ...ledger.services.category_service import CategoryService
+from ...ledger.services.expense_service import ExpenseService
+from ...ledger.services.pagination import MAX_PAGE_SIZE
+
+CSV_COLUMNS = ["Date", "Expense", "Amount", "Category"]
+
+
+router = APIRouter(tags=["export"])
+
+
+async def _categorized_pages(
+    expense_service: AsyncFacade[ExpenseService],
+    category_service: AsyncFacade[CategoryService],
+    start_date: Optional[str],
+    end_date: Optional[str],
+) -> AsyncIterator[List[Dict]]:
+    """
+    Yield the ledger in date order, one categorized page at a time.
+
+    Each page is read and categorized on the service executor, so only one
+    page is held in memory and the event loop is never blocked.
+    """
+    cursor = None
+    while True:
+        page = await expense_service.get_expenses_page(
+            start_date, end_date, cursor, MAX_PAGE_SIZE
+        )
+        expenses = page["expenses"]
+        categories = await category_service.categorize_many(
+            [expense["expense"] for expense in expenses]
+        )
+        yield [
+            {**expense, "category": category}
+            for expense, category in zip(expenses, categories)
+        ]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return
+
+
+def _csv_chunk(expenses: List[Dict], header: bool = False) -> str:
+    """Format a page of categorized expenses as CSV rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    writer.writerows(
+        [
+            expense["date"],
+            expense["expense"],
+            float(expense["amount"]),
+            expense["category"].title(),
+        ]
+        for expense in expenses
+    )
+    return buffer.getvalue()
+
+
+def _ndjson_chunk(expenses: List[Dict], header: bool = False) -> str:
+    """Format a page of categorized expenses as newline-delimited JSON (no header)."""
+    return "".join(
+        json.dumps(
+            {
+                "id": expense.get("id"),
+                "date": expense["date"],
+                "expense": expense["expense"],
+                "amount": float(expense["amount"]),
+                "category": expense["category"],
+            }
+        )
+        + "\n"
+        for expense in expenses
+    )
+
+
+def _stream(
+    pages: AsyncIterator[List[Dict]],
+    format_page: Callable[[List[Dict], bool], str],
+    media_type: str,
+    extension: str,
+) -> StreamingResponse:
+    """Stream formatted pages as a downloadable file."""
+
+    async def body() -> AsyncIterator[str]:
+        first = True
+        async for expenses in pages:
+            chunk = format_page(expenses, first)
+            first = False
+            if chunk:
+                yield chunk
+
+    filename = f"ledger_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export.csv")
+async def export_csv(
+    range: Optional[str] = Query(None, description="Date range (start_date,end_date)"),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+    category_service: AsyncFacade[CategoryService] = Depends(get_async_category_service),
+):
+    """
+    Stream the ledger as CSV with categories attached.
+
+    Uses the same columns as the CLI ``export`` command. Rows are read a
+    page at a time, so memory use does not grow with the ledger.
+    """
+    start_date, end_date = parse_date_range(range) if range else (None, None)
+    pages = _categorized_pages(expense_service, category_service, start_date, end_date)
+    return _stream(pages, _csv_chunk, "text/csv; charset=utf-8", "csv")
+
+
+@router.get("/export.ndjson")
+async def export_ndjson(
+    range: Optional[str] = Query(None, description="Date range (start_date,end_date)"),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
+    category_service: AsyncFacade[CategoryService] = Depends(get_async_category_service),
+):
+    """
+    Stream the ledger as newline-delimited JSON with categories attached.
+
+    One object per expense (id, date, expense, amount, category), read a
+    page at a time, so memory use does not grow with the ledger.
+    """
+    start_date, end_date = parse_date_range(range) if range else (None, None)
+    pages = _categorized_pages(expense_service, category_service, start_date, end_date)
+    return _stream(pages, _ndjson_chunk, "application/x-ndjson", "ndjson")
@@ -5,7 +5,8 @@ from typing import List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel
 
-from ..dependencies import get_expense_service
+from ..dependencies import get_async_expense_service
+from ...ledger.services.async_facade import AsyncFacade
 from ...ledger.services.expense_service import ExpenseService
 from ...ledger.parsers.nlp_parser import parse_and_enhance
 
@@ -46,7 +47,7 @@ async def parse_natural_language(input_data: NaturalLanguageInput):
 @router.post("/say", response_model=Dict[str, Any])
 async def say_expenses(
     input_data: NaturalLanguageInput,
-    expense_service: ExpenseService = Depends(get_expense_service),
+    expense_service: AsyncFacade[ExpenseService] = Depends(get_async_expense_service),
 ):
     """
     Parse natural language and add expenses to the ledger.
@@ -63,15 +64,11 @@ async def say_expenses(
             )
 
         # Add expenses
-        added_expenses = []
-        for expense_data in parsed_expenses:
-            expense = expense_service.add_expense(
-                expense_data["expense"], expense_data["amount"]
-            )
-            added_expenses.append({
-                "expense": expense.expense,
-                "amount": expense.amount,
-            })
+        expenses = await expense_service.add_expenses(parsed_expenses)
+        added_expenses = [
+            {"expense": expense.expense, "amount": expense.amount}
+            for expense in expenses
+        ]
 
         return {
             "message": f"Successfully added {len(added_expenses)} expense(s)",
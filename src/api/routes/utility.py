@@ -1,9 +1,21 @@
 """Utility routes (health check, API info, etc.)."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from typing import Any, Dict
 from ..models.utility import HealthResponse, APIInfoResponse
-from ..dependencies import get_category_service
+from ..conditional import not_modified
+from ..dependencies import (
+    get_analytics_service,
+    get_async_category_service,
+    get_budget_service,
+    get_category_service,
+    get_expense_service,
+)
+from ...ledger.services.analytics_service import AnalyticsService
+from ...ledger.services.async_facade import AsyncFacade
+from ...ledger.services.budget_service import BudgetService
 from ...ledger.services.category_service import CategoryService
+from ...ledger.services.expense_service import ExpenseService
 
 
 router = APIRouter(tags=["utility"])
@@ -17,13 +29,37 @@ async def health_check():
 
 @router.get("/categories")
 async def get_categories(
-    category_service: CategoryService = Depends(get_category_service),
+    request: Request,
+    response: Response,
+    category_service: AsyncFacade[CategoryService] = Depends(get_async_category_service),
 ):
     """Get all categories."""
-    categories = category_service.get_all_categories()
+    cached = not_modified(request, response, await category_service.get_version())
+    if cached is not None:
+        return cached
+    categories = await category_service.get_all_categories()
     return {name: cat.keywords for name, cat in categories.items()}
 
 
+@router.get("/metrics", response_model=Dict[str, Any])
+async def get_metrics(
+    analytics_service: AnalyticsService = Depends(get_analytics_service),
+    budget_service: BudgetService = Depends(get_budget_service),
+    category_service: CategoryService = Depends(get_category_service),
+    expense_service: ExpenseService = Depends(get_expense_service),
+):
+    """Get cache hit ratios and write counters."""
+    return {
+        "caches": {
+            "analytics_results": analytics_service.cache_stats(),
+            "budget_results": budget_service.cache_stats(),
+            "categorization": category_service.cache_stats(),
+            "file_reads": expense_service.repository.file_manager.cache_stats(),
+        },
+        "budget_writes": budget_service.budget_repo.writes,
+    }
+
+
 @router.get("/", response_model=APIInfoResponse)
 async def root():
     """API information and available endpoints."""
@@ -33,20 +69,29 @@ async def root():
         endpoints={
             "expenses": {
                 "POST /expenses": "Add a new expense",
+                "POST /expenses/batch": "Add several expenses in one write",
                 "GET /expenses": "Get all expenses (with optional filters)",
                 "PUT /expenses/{date}/{index}": "Edit an expense",
                 "DELETE /expenses/{date}/{index}": "Delete an expense",
+                "GET /expenses/id/{id}": "Get an expense by ID",
+                "PUT /expenses/id/{id}": "Edit an expense by ID",
+                "DELETE /expenses/id/{id}": "Delete an expense by ID",
             },
             "analytics": {
                 "GET /summary": "Get expense summary (with optional filters)",
                 "GET /stats": "Get comprehensive analytics",
             },
+            "export": {
+                "GET /export.csv": "Stream the ledger as CSV with categories",
+                "GET /export.ndjson": "Stream the ledger as NDJSON with categories",
+            },
             "nlp": {
                 "POST /nlp/parse": "Parse natural language to extract expenses",
                 "POST /nlp/say": "Parse natural language and add expenses",
             },
             "utility": {
                 "GET /health": "Health check",
+                "GET /metrics": "Cache hit ratios and write counters",
                 "GET /": "API information",
             },
         },
@@ -1,17 +1,17 @@
 """CLI commands for analytics and statistics."""
 
 import typer
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from rich import print as rprint
-import pandas as pd
 from datetime import datetime
 
-from ...ledger.services.analytics_service import AnalyticsService
-from ...ledger.services.expense_service import ExpenseService
 from ..presenters import TableFormatter
 
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
-def register_analytics_commands(app: typer.Typer, analytics_service: AnalyticsService, expense_service: ExpenseService):
+
+def register_analytics_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register analytics-related CLI commands."""
 
     formatter = TableFormatter()
@@ -35,10 +35,10 @@ def register_analytics_commands(app: typer.Typer, analytics_service: AnalyticsSe
                 if not start or not end:
                     rprint("[red]Both start and end dates are required for range summary.[/red]")
                     return
-                expenses_dict = expense_service.get_expenses_by_range(start, end)
+                expenses_dict = services.expense_service.get_expenses_by_range(start, end)
                 period = f"from {start} to {end}"
             else:
-                expenses_dict = expense_service.get_all_expenses()
+                expenses_dict = services.expense_service.get_all_expenses()
                 period = "All time"
 
             total = sum(
@@ -55,10 +55,13 @@ def register_analytics_commands(app: typer.Typer, analytics_service: AnalyticsSe
             rprint(f"[red]Error getting summary: {e}[/red]")
 
     @app.command()
-    def stats():
+    def stats(
+        start: Optional[str] = typer.Option(None, help="Start date (YYYY-MM-DD)"),
+        end: Optional[str] = typer.Option(None, help="End date (YYYY-MM-DD)"),
+    ):
         """Display comprehensive statistics about expenses."""
         try:
-            stats_data = analytics_service.calculate_comprehensive_stats()
+            stats_data = services.analytics_service.calculate_comprehensive_stats(start, end)
 
             highlights_table, overview_table, categories_table, expenses_table = formatter.format_stats_table(stats_data)
 
@@ -90,25 +93,26 @@ def register_analytics_commands(app: typer.Typer, analytics_service: AnalyticsSe
             return
 
         try:
-            from ...ledger.services.category_service import CategoryService
-            category_service = CategoryService()
+            import pandas as pd
 
-            expenses_dict = expense_service.get_all_expenses()
+            expenses_dict = services.expense_service.get_all_expenses()
 
-            # Flatten the data with categories
+            # Flatten the data
             flattened_data = []
             for date, expenses in expenses_dict.items():
                 for expense in expenses:
-                    category = category_service.categorize_expense(expense["expense"])
                     flattened_data.append({
                         "Date": date,
                         "Expense": expense["expense"],
                         "Amount": expense["amount"],
-                        "Category": category.title(),
                     })
 
-            # Convert to DataFrame
-            df = pd.DataFrame(flattened_data)
+            # Convert to DataFrame and categorize the whole column at once
+            df = pd.DataFrame(flattened_data, columns=["Date", "Expense", "Amount"])
+            df["Category"] = [
+                category.title()
+                for category in services.category_service.categorize_many(df["Expense"])
+            ]
 
             # Generate filename if not provided
             if not output:
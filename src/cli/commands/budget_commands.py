@@ -1,14 +1,16 @@
 """CLI commands for budget management."""
 
 import typer
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from rich import print as rprint
 
-from ...ledger.services.budget_service import BudgetService
 from ..presenters import TableFormatter
 
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
-def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
+
+def register_budget_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register budget-related CLI commands."""
 
     formatter = TableFormatter()
@@ -20,7 +22,7 @@ def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
     def set_budget(amount: float = typer.Argument(..., help="Monthly budget amount")):
         """Set monthly budget amount"""
         try:
-            monthly_budget = budget_service.set_monthly_budget(amount)
+            monthly_budget = services.budget_service.set_monthly_budget(amount)
             rprint(f"[green]Budget set for {monthly_budget.month}: ₦{amount:,.2f}[/green]")
             rprint(f"Current spending: ₦{monthly_budget.spent:,.2f}")
             rprint(f"Remaining: ₦{monthly_budget.remaining:,.2f}")
@@ -33,8 +35,8 @@ def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
     def budget_status():
         """Show current month's budget status"""
         try:
-            monthly_budget = budget_service.get_budget_status()
-            budget = budget_service.budget_repo.load()
+            monthly_budget = services.budget_service.get_budget_status()
+            budget = services.budget_service.budget_repo.load()
 
             if monthly_budget.amount == 0:
                 rprint(f"\n[yellow]No budget set for {monthly_budget.month}[/yellow]")
@@ -68,11 +70,14 @@ def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
             rprint(f"[red]Error getting budget status: {e}[/red]")
 
     @budget.command("history")
-    def budget_history():
-        """Show budget history for all months"""
+    def budget_history(
+        limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Number of months to show"),
+        offset: int = typer.Option(0, "--offset", help="Number of months to skip"),
+    ):
+        """Show budget history, newest month first"""
         try:
-            history = budget_service.get_budget_history()
-            budget = budget_service.budget_repo.load()
+            history = services.budget_service.get_budget_history(limit=limit, offset=offset)
+            budget = services.budget_service.budget_repo.load()
 
             if not history:
                 rprint("[yellow]No budget history found[/yellow]")
@@ -93,6 +98,10 @@ def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
             table = formatter.format_budget_history_table(history_dicts)
             formatter.print_table(table)
 
+            shown_to = offset + len(history)
+            if offset or shown_to < len(budget.monthly_budgets):
+                rprint(f"[dim]Months {offset + 1}-{shown_to} of {len(budget.monthly_budgets)}[/dim]")
+
             auto_reset_status = "Enabled" if budget.auto_reset else "Disabled"
             rprint(f"\n[dim]Auto-reset: {auto_reset_status}[/dim]")
 
@@ -105,7 +114,7 @@ def register_budget_commands(app: typer.Typer, budget_service: BudgetService):
     ):
         """Toggle automatic monthly budget reset"""
         try:
-            enabled = budget_service.toggle_auto_reset(enable)
+            enabled = services.budget_service.toggle_auto_reset(enable)
             status = "enabled" if enabled else "disabled"
             rprint(f"[green]Auto-reset {status} successfully[/green]")
 
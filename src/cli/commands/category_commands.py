@@ -1,14 +1,16 @@
 """CLI commands for category management."""
 
 import typer
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from rich import print as rprint
 
-from ...ledger.services.category_service import CategoryService
 from ..presenters import TableFormatter
 
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
-def register_category_commands(app: typer.Typer, category_service: CategoryService):
+
+def register_category_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register category-related CLI commands."""
 
     formatter = TableFormatter()
@@ -31,10 +33,8 @@ def register_category_commands(app: typer.Typer, category_service: CategoryServi
         """
         try:
             if action == "summary":
-                from ...ledger.services import ExpenseService
-                expense_service = ExpenseService()
-                expenses_dict = expense_service.get_all_expenses()
-                category_totals = category_service.get_category_summary(expenses_dict)
+                expenses_dict = services.expense_service.get_all_expenses()
+                category_totals = services.category_service.get_category_summary(expenses_dict)
 
                 rprint("\n[bold blue]💰 Spending by Category[/bold blue]")
                 table = formatter.format_category_table(category_totals)
@@ -50,23 +50,23 @@ def register_category_commands(app: typer.Typer, category_service: CategoryServi
                     keyword_list = [k.strip() for k in keywords.split(",")]
 
                 if action == "add":
-                    category_service.add_category(category, keyword_list)
+                    services.category_service.add_category(category, keyword_list)
                     rprint(f"[green]Added category '{category}' with keywords: {keyword_list or 'none'}[/green]")
 
                 elif action == "remove":
-                    category_service.remove_category(category)
+                    services.category_service.remove_category(category)
                     rprint(f"[green]Removed category '{category}'[/green]")
 
                 elif action == "update":
                     if not keyword_list:
                         rprint("[red]Keywords are required for update action.[/red]")
                         return
-                    category_service.update_category(category, keyword_list)
+                    services.category_service.update_category(category, keyword_list)
                     rprint(f"[green]Updated category '{category}' with keywords: {keyword_list}[/green]")
 
             else:
                 # List categories
-                categories = category_service.get_all_categories()
+                categories = services.category_service.get_all_categories()
                 rprint("\n[bold blue]📂 Expense Categories[/bold blue]")
                 categories_dict = {name: cat.keywords for name, cat in categories.items()}
                 table = formatter.format_categories_list_table(categories_dict)
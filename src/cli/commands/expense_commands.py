@@ -1,15 +1,17 @@
 """CLI commands for expense management."""
 
 import typer
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from rich import print as rprint
 
-from ...ledger.services.expense_service import ExpenseService
 from ...ledger.parsers.nlp_parser import parse_and_enhance
 from ..presenters import TableFormatter
 
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
-def register_expense_commands(app: typer.Typer, expense_service: ExpenseService):
+
+def register_expense_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register expense-related CLI commands."""
 
     formatter = TableFormatter()
@@ -35,7 +37,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
                 amount = None
                 continue
 
-            expense_service.add_expense(expense, amount)
+            services.expense_service.add_expense(expense, amount)
             rprint("✅ Expense saved successfully.")
 
             expense = None
@@ -66,8 +68,8 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
             rprint(f"[blue]Parsed {len(parsed_expenses)} expense(s) from:[/blue] \"{input_text}\"")
             rprint()
 
+            services.expense_service.add_expenses(parsed_expenses)
             for expense_data in parsed_expenses:
-                expense_service.add_expense(expense_data["expense"], expense_data["amount"])
                 rprint(f"✅ Added: {expense_data['expense']} - ₦{expense_data['amount']}")
 
             rprint(f"\n[bold green]Successfully added {len(parsed_expenses)} expense(s)![/bold green]")
@@ -102,24 +104,15 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
                 return
 
             try:
-                expenses_dict = expense_service.get_expenses_by_range(start, end)
-                total = expense_service.calculate_range_total(start, end)
+                expenses_dict = services.expense_service.get_expenses_by_range(start, end)
+                stats = services.expense_service.get_range_totals(start, end)
+                total = stats["total"]
+                days_with_expenses = stats["days_with_expenses"]
+                stats["avg_daily"] = total / days_with_expenses if days_with_expenses > 0 else 0
 
                 rprint(f"\n[bold blue]📅 Expenses from {start} to {end}[/bold blue]")
                 rprint("=" * 60)
 
-                # Calculate stats
-                days_with_expenses = len(expenses_dict)
-                transaction_count = sum(len(exp) for exp in expenses_dict.values())
-                avg_daily = total / days_with_expenses if days_with_expenses > 0 else 0
-
-                stats = {
-                    "total": total,
-                    "days_with_expenses": days_with_expenses,
-                    "transaction_count": transaction_count,
-                    "avg_daily": avg_daily,
-                }
-
                 stats_table, expenses_table = formatter.format_range_table(
                     expenses_dict, start, end, total, stats
                 )
@@ -135,7 +128,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
             date = datetime.today().strftime("%Y-%m-%d")
 
         if week:
-            expenses_dict = expense_service.get_expenses_by_week()
+            expenses_dict = services.expense_service.get_expenses_by_week()
             total = 0.0
             for day, expenses in expenses_dict.items():
                 day_total = sum(float(e["amount"]) for e in expenses)
@@ -146,7 +139,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
                     rprint("_____________________________")
             rprint(f'[bold green]Final Total:[/bold green] [bold purple]{total:,.2f}[/bold purple]')
         else:
-            expenses = expense_service.get_expenses_by_date(date)
+            expenses = services.expense_service.get_expenses_by_date(date)
             table = formatter.format_expenses_table(expenses, date)
             formatter.print_table(table)
 
@@ -175,7 +168,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
             except ValueError:
                 pass  # Keep as string
 
-            expense_service.update_expense(date, identifier, expense, amount)
+            services.expense_service.update_expense(date, identifier, expense, amount)
             rprint("[bold green]Expense edited successfully.[/bold green]")
 
         except ValueError as e:
@@ -204,7 +197,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
 
             confirm = typer.confirm(f"Are you sure you want to delete the expense on {date}?")
             if confirm:
-                expense_service.delete_expense(date, identifier)
+                services.expense_service.delete_expense(date, identifier)
                 rprint("[bold green]Expense deleted successfully.[/bold green]")
             else:
                 rprint("[yellow]Deletion cancelled.[/yellow]")
@@ -219,7 +212,7 @@ def register_expense_commands(app: typer.Typer, expense_service: ExpenseService)
         """Clear all expenses from the ledger."""
         confirm = typer.confirm("Are you sure you want to clear all expenses? This cannot be undone.")
         if confirm:
-            expense_service.delete_all()
+            services.expense_service.delete_all()
             rprint("[green]Ledger cleared successfully.[/green]")
         else:
             rprint("[yellow]Clear operation cancelled.[/yellow]")
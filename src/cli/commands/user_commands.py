@@ -1,12 +1,15 @@
 """CLI commands for user management."""
 
 import typer
+from typing import TYPE_CHECKING
 from rich import print as rprint
 
-from ...ledger.services.user_service import UserService
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
 
-def register_user_commands(app: typer.Typer, user_service: UserService):
+
+def register_user_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register user-related CLI commands."""
 
     user = typer.Typer()
@@ -18,7 +21,7 @@ def register_user_commands(app: typer.Typer, user_service: UserService):
         sure = typer.confirm("Are you sure you want to delete user?")
         if sure:
             try:
-                user_service.delete_user()
+                services.user_service.delete_user()
                 rprint("[green]User deleted successfully[/green]")
             except Exception as e:
                 rprint(f"[red]Error deleting user: {e}[/red]")
@@ -1,6 +1,7 @@
 """CLI commands for utility functions."""
 
 import typer
+from typing import TYPE_CHECKING
 from rich import print as rprint
 from datetime import datetime
 
@@ -8,8 +9,11 @@ from ...ledger.config import get_settings
 from ...ledger.repositories.file_manager import FileManager
 from ..presenters import TableFormatter
 
+if TYPE_CHECKING:
+    from ..container import ServiceContainer
 
-def register_utility_commands(app: typer.Typer):
+
+def register_utility_commands(app: typer.Typer, services: "ServiceContainer"):
     """Register utility CLI commands."""
 
     formatter = TableFormatter()
@@ -102,3 +106,14 @@ def register_utility_commands(app: typer.Typer):
         except Exception as e:
             rprint(f"[red]Error getting ledger info: {e}[/red]")
 
+    @app.command()
+    def rebuild_aggregates():
+        """Recompute the materialized statistics from the full ledger."""
+        try:
+            aggregates = services.expense_service.repository.rebuild_aggregates()
+            rprint(
+                f"[green]✅ Rebuilt aggregates for {aggregates.transaction_count} expenses "
+                f"over {len(aggregates.days)} days.[/green]"
+            )
+        except Exception as e:
+            rprint(f"[red]Error rebuilding aggregates: {e}[/red]")
@@ -0,0 +1,57 @@
+"""Lazily constructed services for CLI commands."""
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..ledger.services import (
+        AnalyticsService,
+        BudgetService,
+        CategoryService,
+        ExpenseService,
+        UserService,
+    )
+
+
+class ServiceContainer:
+    """
+    Builds each service (and imports its module) on first use.
+
+    A command such as ``ledger add`` only pays for the expense service; the
+    analytics stack and its dependencies are never imported.
+    """
+
+    @cached_property
+    def expense_service(self) -> "ExpenseService":
+        """Expense service."""
+        from ..ledger.services.expense_service import ExpenseService
+
+        return ExpenseService()
+
+    @cached_property
+    def category_service(self) -> "CategoryService":
+        """Category service."""
+        from ..ledger.services.category_service import CategoryService
+
+        return CategoryService()
+
+    @cached_property
+    def budget_service(self) -> "BudgetService":
+        """Budget service sharing the expense repository."""
+        from ..ledger.services.budget_service import BudgetService
+
+        return BudgetService(expense_repository=self.expense_service.repository)
+
+    @cached_property
+    def analytics_service(self) -> "AnalyticsService":
+        """Analytics service sharing the expense repository and categories."""
+        from ..ledger.services.analytics_service import AnalyticsService
+
+        return AnalyticsService(self.expense_service.repository, self.category_service)
+
+    @cached_property
+    def user_service(self) -> "UserService":
+        """User service."""
+        from ..ledger.services.user_service import UserService
+
+        return UserService()
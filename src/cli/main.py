@@ -2,16 +2,9 @@
 
 import typer
 from rich import print as rprint
-import json
-
-from ..ledger.services import (
-    ExpenseService,
-    CategoryService,
-    BudgetService,
-    AnalyticsService,
-    UserService,
-)
+
 from ..ledger.config import get_settings
+from .container import ServiceContainer
 from .commands.expense_commands import register_expense_commands
 from .commands.analytics_commands import register_analytics_commands
 from .commands.budget_commands import register_budget_commands
@@ -24,20 +17,16 @@ def create_app() -> typer.Typer:
     """Create and configure the Typer CLI app."""
     app = typer.Typer(rich_markup_mode="rich")
 
-    # Initialize services
-    expense_service = ExpenseService()
-    category_service = CategoryService()
-    budget_service = BudgetService()
-    analytics_service = AnalyticsService()
-    user_service = UserService()
+    # Services are built on first use by the command that needs them
+    services = ServiceContainer()
 
     # Register command groups
-    register_expense_commands(app, expense_service)
-    register_analytics_commands(app, analytics_service, expense_service)
-    register_budget_commands(app, budget_service)
-    register_category_commands(app, category_service)
-    register_utility_commands(app)
-    register_user_commands(app, user_service)
+    register_expense_commands(app, services)
+    register_analytics_commands(app, services)
+    register_budget_commands(app, services)
+    register_category_commands(app, services)
+    register_utility_commands(app, services)
+    register_user_commands(app, services)
 
     @app.callback(invoke_without_command=True)
     def main(ctx: typer.Context):
@@ -79,8 +68,9 @@ def create_app() -> typer.Typer:
             settings = get_settings()
             if settings.ledger_file.exists():
                 try:
-                    with open(settings.ledger_file, "r") as f:
-                        data = json.load(f)
+                    from ..ledger.repositories import FileManager
+
+                    data = FileManager(settings).load_json(settings.ledger_file, readonly=True)
                     if data:
                         total_expenses = sum(len(expenses) for expenses in data.values())
                         rprint(
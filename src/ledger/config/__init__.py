@@ -1,7 +1,13 @@
 """Configuration module for ledger application."""
 
-from .settings import Settings, get_settings
-from .paths import Paths, get_paths
-
-__all__ = ["Settings", "get_settings", "Paths", "get_paths"]
+from .settings import Settings, get_settings, reset_settings
+from .paths import Paths, get_paths, reset_paths
 
+__all__ = [
+    "Settings",
+    "get_settings",
+    "reset_settings",
+    "Paths",
+    "get_paths",
+    "reset_paths",
+]
@@ -26,6 +26,41 @@ class Paths:
         """Path to the main ledger JSON file."""
         return self.base_dir / "ledger.json"
 
+    @property
+    def journal_file(self) -> Path:
+        """Path to the append-only ledger journal."""
+        return self.base_dir / "ledger.journal"
+
+    @property
+    def ledger_version_file(self) -> Path:
+        """Path to the ledger write counter."""
+        return self.base_dir / "ledger.version"
+
+    @property
+    def ledger_partition_dir(self) -> Path:
+        """Directory holding month-partitioned ledger files."""
+        return self.base_dir / "ledger"
+
+    @property
+    def ledger_db_file(self) -> Path:
+        """Path to the SQLite ledger database."""
+        return self.base_dir / "ledger.db"
+
+    @property
+    def aggregates_file(self) -> Path:
+        """Path to the materialized ledger aggregates index."""
+        return self.base_dir / "aggregates.json"
+
+    @property
+    def aggregates_dir(self) -> Path:
+        """Directory holding per-month materialized aggregates."""
+        return self.base_dir / "aggregates"
+
+    @property
+    def sketches_file(self) -> Path:
+        """Path to the per-month analytics sketches."""
+        return self.base_dir / "sketches.json"
+
     @property
     def categories_file(self) -> Path:
         """Path to the categories JSON file."""
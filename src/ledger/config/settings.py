@@ -19,12 +19,60 @@ class Settings:
         self.paths = get_paths(base_dir)
         self.max_backups = int(os.getenv("LEDGER_MAX_BACKUPS", "10"))
         self.auto_backup = os.getenv("LEDGER_AUTO_BACKUP", "true").lower() == "true"
+        self.storage_backend = os.getenv("LEDGER_STORAGE", "json").lower()
+        self.serializer = os.getenv("LEDGER_SERIALIZER", "json").lower()
+        self.compression = os.getenv("LEDGER_COMPRESSION", "none").lower()
+        self.journal_enabled = os.getenv("LEDGER_JOURNAL", "false").lower() == "true"
+        self.journal_compact_threshold = int(
+            os.getenv("LEDGER_JOURNAL_COMPACT_THRESHOLD", "500")
+        )
+        self.aggregates_enabled = os.getenv("LEDGER_AGGREGATES", "true").lower() == "true"
+        self.read_cache_size = int(os.getenv("LEDGER_READ_CACHE_SIZE", "256"))
+        self.category_cache_size = int(os.getenv("LEDGER_CATEGORY_CACHE_SIZE", "4096"))
+        self.result_cache_size = int(os.getenv("LEDGER_RESULT_CACHE_SIZE", "128"))
+        self.result_cache_ttl = float(os.getenv("LEDGER_RESULT_CACHE_TTL", "300"))
+        self.api_workers = int(os.getenv("LEDGER_API_WORKERS", "4"))
 
     @property
     def ledger_file(self) -> Path:
         """Path to ledger file."""
         return self.paths.ledger_file
 
+    @property
+    def journal_file(self) -> Path:
+        """Path to ledger journal file."""
+        return self.paths.journal_file
+
+    @property
+    def ledger_version_file(self) -> Path:
+        """Path to ledger write counter file."""
+        return self.paths.ledger_version_file
+
+    @property
+    def ledger_partition_dir(self) -> Path:
+        """Path to month-partitioned ledger directory."""
+        return self.paths.ledger_partition_dir
+
+    @property
+    def ledger_db_file(self) -> Path:
+        """Path to SQLite ledger database."""
+        return self.paths.ledger_db_file
+
+    @property
+    def aggregates_file(self) -> Path:
+        """Path to materialized ledger aggregates index."""
+        return self.paths.aggregates_file
+
+    @property
+    def aggregates_dir(self) -> Path:
+        """Path to per-month materialized aggregates directory."""
+        return self.paths.aggregates_dir
+
+    @property
+    def sketches_file(self) -> Path:
+        """Path to per-month analytics sketches."""
+        return self.paths.sketches_file
+
     @property
     def categories_file(self) -> Path:
         """Path to categories file."""
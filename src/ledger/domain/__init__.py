@@ -1,9 +1,22 @@
 """Domain models for ledger application."""
 
-from .expense import Expense
+from .expense import Expense, new_expense_id, expense_id_date
 from .category import Category
+from .category_matcher import CategoryMatcher
 from .budget import Budget, MonthlyBudget
+from .sketches import CountMinSketch, HyperLogLog, KLLSketch
 from .user import User
 
-__all__ = ["Expense", "Category", "Budget", "MonthlyBudget", "User"]
-
+__all__ = [
+    "Expense",
+    "new_expense_id",
+    "expense_id_date",
+    "Category",
+    "CategoryMatcher",
+    "Budget",
+    "MonthlyBudget",
+    "KLLSketch",
+    "HyperLogLog",
+    "CountMinSketch",
+    "User",
+]
@@ -1,6 +1,6 @@
 """Budget domain models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional
 
@@ -78,11 +78,13 @@ class Budget:
         monthly_budgets: Dictionary mapping month (YYYY-MM) to MonthlyBudget
         current_month: Current month in YYYY-MM format
         auto_reset: Whether to auto-reset budget each month
+        dirty: Whether there are changes not yet persisted (not stored)
     """
 
     monthly_budgets: Dict[str, MonthlyBudget]
     current_month: str
     auto_reset: bool = True
+    dirty: bool = field(default=False, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         """Set current month if not provided."""
@@ -106,6 +108,7 @@ class Budget:
         """
         budget = MonthlyBudget(month=month, amount=amount)
         self.monthly_budgets[month] = budget
+        self.dirty = True
         return budget
 
     def to_dict(self) -> dict:
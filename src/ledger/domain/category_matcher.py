@@ -0,0 +1,113 @@
+"""Compiled keyword matcher for categorizing expenses."""
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+from .category import Category
+
+
+_NO_MATCH = float("inf")
+
+
+class CategoryMatcher:
+    """
+    Aho-Corasick automaton over the keywords of an ordered set of categories.
+
+    Gives the same answer as checking ``Category.matches`` on each category
+    in order, but scans the expense name once regardless of how many
+    keywords there are. Each automaton state records the best (lowest)
+    category rank of any keyword ending there.
+    """
+
+    def __init__(self, categories: Iterable[Category], default: str = "miscellaneous"):
+        """
+        Compile categories into a matcher.
+
+        Args:
+            categories: Categories in priority order
+            default: Category returned when nothing matches
+        """
+        self.default = default
+        self._names: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._rank: List[float] = [_NO_MATCH]
+
+        for rank, category in enumerate(categories):
+            self._names.append(category.name)
+            for keyword in category.keywords:
+                self._insert(keyword.lower(), rank)
+
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, rank: int) -> None:
+        """Add a keyword to the trie."""
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._rank.append(_NO_MATCH)
+            node = next_node
+        self._rank[node] = min(self._rank[node], rank)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and propagate match ranks."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._rank[child] = min(self._rank[child], self._rank[self._fail[child]])
+                queue.append(child)
+
+    def categorize(self, expense_name: str) -> str:
+        """
+        Determine the category for an expense name.
+
+        Args:
+            expense_name: Name of the expense
+
+        Returns:
+            Name of the first category with a keyword contained in the
+            expense name, or the default category
+        """
+        goto, fail, ranks = self._goto, self._fail, self._rank
+        best = ranks[0]  # An empty keyword matches every name
+        node = 0
+        for char in expense_name.lower().strip():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if ranks[node] < best:
+                best = ranks[node]
+                if best == 0:
+                    break
+        return self._names[int(best)] if best != _NO_MATCH else self.default
+
+    def categorize_many(self, expense_names: Iterable[str]) -> List[str]:
+        """
+        Categorize a list or column of expense names.
+
+        Each distinct name is matched once.
+
+        Args:
+            expense_names: Expense names
+
+        Returns:
+            Category names in the same order
+        """
+        seen: Dict[str, str] = {}
+        result = []
+        for name in expense_names:
+            category = seen.get(name)
+            if category is None:
+                category = seen[name] = self.categorize(name)
+            result.append(category)
+        return result
@@ -1,10 +1,51 @@
 """Expense domain model."""
 
+import re
+import secrets
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_EXPENSE_ID_PATTERN = re.compile(r"^(\d{4})(\d{2})(\d{2})[0-9A-HJKMNP-TV-Z]{10}$")
+
+
+def new_expense_id(date: str) -> str:
+    """
+    Generate a stable, compact expense ID.
+
+    The ID is the expense date (YYYYMMDD) followed by 50 random bits in
+    Crockford base32. An expense never changes date, so the prefix doubles
+    as the location index used to find the expense without a scan.
+
+    Args:
+        date: Expense date (YYYY-MM-DD)
+
+    Returns:
+        18-character expense ID
+    """
+    bits = secrets.randbits(50)
+    suffix = "".join(_CROCKFORD_BASE32[(bits >> shift) & 31] for shift in range(45, -1, -5))
+    return date.replace("-", "") + suffix
+
+
+def expense_id_date(expense_id: str) -> Optional[str]:
+    """
+    Get the date encoded in an expense ID.
+
+    Args:
+        expense_id: Expense ID
+
+    Returns:
+        Date (YYYY-MM-DD), or None if the ID is malformed
+    """
+    match = _EXPENSE_ID_PATTERN.match(expense_id)
+    if not match:
+        return None
+    return "-".join(match.groups())
+
+
 @dataclass(frozen=True)
 class Expense:
     """
@@ -14,11 +55,13 @@ class Expense:
         expense: Name/description of the expense
         amount: Amount spent
         date: Date of the expense (YYYY-MM-DD format)
+        id: Stable expense ID (see ``new_expense_id``)
     """
 
     expense: str
     amount: float
     date: str
+    id: Optional[str] = None
 
     def __post_init__(self) -> None:
         """Validate expense data."""
@@ -55,9 +98,17 @@ class Expense:
         """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
-        return cls(expense=expense.strip().title(), amount=amount, date=date)
+        return cls(
+            expense=expense.strip().title(),
+            amount=amount,
+            date=date,
+            id=new_expense_id(date),
+        )
 
     def to_dict(self) -> dict:
         """Convert expense to dictionary."""
-        return {"expense": self.expense, "amount": self.amount}
+        data = {"expense": self.expense, "amount": self.amount}
+        if self.id is not None:
+            data["id"] = self.id
+        return data
 
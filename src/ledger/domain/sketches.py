@@ -0,0 +1,269 @@
+"""Mergeable streaming sketches for approximate analytics."""
+
+import base64
+import hashlib
+import math
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+def _hash64(value: str, salt: bytes = b"") -> int:
+    """Stable 64-bit hash of a string (independent of PYTHONHASHSEED)."""
+    digest = hashlib.blake2b(value.encode(), digest_size=8, salt=salt).digest()
+    return int.from_bytes(digest, "big")
+
+
+@lru_cache(maxsize=None)
+def _kll_capacities(k: int, height: int) -> Tuple[Tuple[int, ...], int]:
+    """Per-level compactor capacities (bottom first) and their sum."""
+    capacities = tuple(
+        max(2, math.ceil(k * (2 / 3) ** (height - level - 1))) for level in range(height)
+    )
+    return capacities, sum(capacities)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch over floats.
+
+    Keeps a stack of compactors whose capacities shrink geometrically
+    towards the bottom; once the sketch is over its total capacity, the
+    lowest full compactor sorts its items and promotes every other one to
+    the level above with doubled weight. Rank error is about
+    1.7 / k with high probability. Compaction alternates its offset
+    deterministically so results are reproducible.
+    """
+
+    def __init__(self, k: int = 128):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            k: Capacity of the top compactor (accuracy/size trade-off)
+        """
+        self.k = k
+        self.n = 0
+        self.levels: List[List[float]] = [[]]
+        self._flip = 0
+
+    def _capacities(self) -> Tuple[Tuple[int, ...], int]:
+        return _kll_capacities(self.k, len(self.levels))
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+    def _compress(self) -> None:
+        """Compact the lowest full levels until the sketch fits its capacity."""
+        while True:
+            capacities, limit = self._capacities()
+            if self._size() <= limit:
+                return
+            for level, items in enumerate(self.levels):
+                if len(items) >= capacities[level]:
+                    if level + 1 == len(self.levels):
+                        self.levels.append([])
+                    items.sort()
+                    # An odd item out stays behind so no weight is lost
+                    keep = [items.pop()] if len(items) % 2 else []
+                    self._flip ^= 1
+                    self.levels[level + 1].extend(items[self._flip :: 2])
+                    self.levels[level] = keep
+                    break
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.update((value,))
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add many values, compacting lazily once the sketch is full."""
+        values = iter(values)
+        while True:
+            room = self._capacities()[1] - self._size()
+            batch = [float(value) for value in islice(values, max(room, 0) + 1)]
+            if not batch:
+                return
+            self.levels[0].extend(batch)
+            self.n += len(batch)
+            self._compress()
+
+    def merge(self, *others: "KLLSketch") -> None:
+        """Fold other sketches into this one, compacting once at the end."""
+        for other in others:
+            while len(self.levels) < len(other.levels):
+                self.levels.append([])
+            for level, items in enumerate(other.levels):
+                self.levels[level].extend(items)
+            self.n += other.n
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self.levels) for value in items
+        )
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {"k": self.k, "n": self.n, "levels": self.levels, "flip": self._flip}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        """Deserialize from ``to_dict`` output."""
+        sketch = cls(data["k"])
+        sketch.n = data["n"]
+        sketch.levels = [list(items) for items in data["levels"]]
+        sketch._flip = data.get("flip", 0)
+        return sketch
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch (about 1.6% error at p=12)."""
+
+    def __init__(self, p: int = 12):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            p: Precision; uses 2**p one-byte registers
+        """
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add(self, value: str) -> None:
+        """Add one value."""
+        h = _hash64(value)
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, *others: "HyperLogLog") -> None:
+        """Fold other sketches (same precision) into this one."""
+        if any(other.p != self.p for other in others):
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self.registers = bytearray(
+            map(max, self.registers, *(other.registers for other in others))
+        )
+
+    def count(self) -> int:
+        """Estimate the number of distinct values added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {"p": self.p, "registers": base64.b64encode(bytes(self.registers)).decode()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HyperLogLog":
+        """Deserialize from ``to_dict`` output."""
+        sketch = cls(data["p"])
+        sketch.registers = bytearray(base64.b64decode(data["registers"]))
+        return sketch
+
+
+class CountMinSketch:
+    """
+    Count-min frequency sketch with a small heavy-hitter candidate list.
+
+    Estimates never undercount; they overcount by at most about
+    ``e / width`` of the total with high probability.
+    """
+
+    def __init__(self, width: int = 256, depth: int = 4, heavy: int = 20):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width: Counters per row
+            depth: Number of independent rows
+            heavy: Number of heavy-hitter candidates to keep
+        """
+        self.width = width
+        self.depth = depth
+        self.heavy = heavy
+        self.rows = [[0] * width for _ in range(depth)]
+        self.candidates: Dict[str, int] = {}
+
+    def _cells(self, value: str) -> List[int]:
+        return [_hash64(value, bytes([row])) % self.width for row in range(self.depth)]
+
+    def add(self, value: str, count: int = 1) -> None:
+        """Count an occurrence of a value."""
+        cells = self._cells(value)
+        for row, cell in zip(self.rows, cells):
+            row[cell] += count
+        self.candidates[value] = min(row[cell] for row, cell in zip(self.rows, cells))
+        # Trim in batches so adds stay O(1) amortized
+        if len(self.candidates) > 2 * self.heavy:
+            self._trim()
+
+    def estimate(self, value: str) -> int:
+        """Estimate how many times a value was added."""
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(value)))
+
+    def _trim(self) -> None:
+        if len(self.candidates) > self.heavy:
+            keep = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))
+            self.candidates = dict(keep[: self.heavy])
+
+    def merge(self, *others: "CountMinSketch") -> None:
+        """Fold other sketches (same shape) into this one."""
+        if any((other.width, other.depth) != (self.width, self.depth) for other in others):
+            raise ValueError("Cannot merge count-min sketches of different shapes")
+        self.rows = [
+            list(map(sum, zip(row, *(other.rows[index] for other in others))))
+            for index, row in enumerate(self.rows)
+        ]
+        names = set(self.candidates).union(*(other.candidates for other in others))
+        self.candidates = {name: self.estimate(name) for name in names}
+        self._trim()
+
+    def heavy_hitters(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Get up to k (value, estimated count) pairs, most frequent first."""
+        ranked = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[: min(k, self.heavy)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        self._trim()
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "heavy": self.heavy,
+            "rows": self.rows,
+            "candidates": self.candidates,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CountMinSketch":
+        """Deserialize from ``to_dict`` output."""
+        sketch = cls(data["width"], data["depth"], data["heavy"])
+        sketch.rows = [list(row) for row in data["rows"]]
+        sketch.candidates = dict(data["candidates"])
+        return sketch
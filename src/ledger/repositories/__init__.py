@@ -1,16 +1,32 @@
 """Repository layer for data access."""
 
 from .file_manager import FileManager
+from .aggregate_store import AggregateStore, LedgerAggregates
+from .journal import ExpenseJournal
 from .expense_repository import ExpenseRepository
+from .partitioned_expense_repository import PartitionedExpenseRepository
+from .sqlite_expense_repository import SqliteExpenseRepository
 from .category_repository import CategoryRepository
 from .budget_repository import BudgetRepository
+from .sketch_repository import SketchRepository
 from .user_repository import UserRepository
+from .factory import create_expense_repository
+from .serializers import Serializer, get_serializer
 
 __all__ = [
     "FileManager",
+    "AggregateStore",
+    "LedgerAggregates",
+    "ExpenseJournal",
     "ExpenseRepository",
+    "PartitionedExpenseRepository",
+    "SqliteExpenseRepository",
     "CategoryRepository",
     "BudgetRepository",
+    "SketchRepository",
     "UserRepository",
+    "create_expense_repository",
+    "Serializer",
+    "get_serializer",
 ]
 
@@ -0,0 +1,518 @@
+"""Materialized ledger aggregates maintained on write."""
+
+from datetime import date as Date
+from functools import cached_property
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import get_settings
+from .file_manager import FileManager
+
+
+AGGREGATES_VERSION = 3
+
+# Bucket layout shared by every backend: [total, count] (plus days for months)
+Bucket = List[float]
+ExpenseRow = Tuple[str, Dict]
+
+
+class DailyIndex:
+    """
+    Dense per-day prefix sums keyed by date ordinal.
+
+    Totals, transaction counts and active-day counts for any date range are
+    answered with two lookups per column.
+    """
+
+    def __init__(self, days: Dict[str, Bucket]):
+        """
+        Build the index from daily buckets.
+
+        Args:
+            days: Date (YYYY-MM-DD) -> [total, count]
+        """
+        if not days:
+            self.first = self.last = 0
+            self._totals, self._counts, self._active = [0.0], [0], [0]
+            return
+
+        self.first = Date.fromisoformat(min(days)).toordinal()
+        self.last = Date.fromisoformat(max(days)).toordinal()
+        span = self.last - self.first + 1
+        totals, counts = [0.0] * span, [0] * span
+        for day, (total, count) in days.items():
+            offset = Date.fromisoformat(day).toordinal() - self.first
+            totals[offset], counts[offset] = total, int(count)
+
+        self._totals = [0.0, *accumulate(totals)]
+        self._counts = [0, *accumulate(counts)]
+        self._active = [0, *accumulate(1 if count else 0 for count in counts)]
+
+    def range_totals(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Tuple[float, int, int]:
+        """
+        Get totals for an inclusive date range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+
+        Returns:
+            Tuple of (total, transaction count, days with expenses)
+        """
+        lo = self.first if start_date is None else Date.fromisoformat(start_date).toordinal()
+        hi = self.last if end_date is None else Date.fromisoformat(end_date).toordinal()
+        lo, hi = max(lo, self.first) - self.first, min(hi, self.last) - self.first
+        if len(self._totals) == 1 or lo > hi:
+            return 0.0, 0, 0
+        return (
+            self._totals[hi + 1] - self._totals[lo],
+            self._counts[hi + 1] - self._counts[lo],
+            self._active[hi + 1] - self._active[lo],
+        )
+
+
+class LedgerAggregates:
+    """
+    Read-only view over pre-computed ledger totals.
+
+    Holds daily and monthly buckets plus per-month expense-name buckets, so
+    statistics can be computed in time proportional to the number of
+    buckets instead of the number of transactions. Per-day name buckets are
+    only needed for partial months and are fetched a month at a time.
+    """
+
+    def __init__(
+        self,
+        days: Dict[str, Bucket],
+        months: Dict[str, Bucket],
+        names: Dict[str, Dict[str, Bucket]],
+        day_names: Optional[Dict[str, Dict[str, Bucket]]] = None,
+        month_day_names: Optional[Callable[[str], Dict[str, Dict[str, Bucket]]]] = None,
+    ):
+        """
+        Initialize aggregates view.
+
+        Args:
+            days: Date (YYYY-MM-DD) -> [total, count]
+            months: Month (YYYY-MM) -> [total, count, days with expenses]
+            names: Month -> expense name -> [total, count]
+            day_names: Date -> expense name -> [total, count], if precomputed
+            month_day_names: Loads a month's date -> expense name -> [total, count]
+                buckets on demand (used when ``day_names`` is None)
+        """
+        self.days = days
+        self.months = months
+        self.names = names
+        self.day_names = day_names
+        self._month_day_names = month_day_names
+
+    def day_name_buckets(self, month: str) -> Dict[str, Dict[str, Bucket]]:
+        """
+        Get per-day expense-name buckets for a month.
+
+        Args:
+            month: Month (YYYY-MM)
+
+        Returns:
+            Date -> expense name -> [total, count]
+        """
+        if self.day_names is not None:
+            return {date: by_name for date, by_name in self.day_names.items() if date[:7] == month}
+        if self._month_day_names is not None:
+            return self._month_day_names(month)
+        return {}
+
+    @property
+    def transaction_count(self) -> int:
+        """Number of expenses in the ledger."""
+        return int(sum(bucket[1] for bucket in self.months.values()))
+
+    @property
+    def total(self) -> float:
+        """Total amount spent."""
+        return sum(bucket[0] for bucket in self.months.values())
+
+    def daily_totals(self) -> Dict[str, float]:
+        """Total spent per date, in date order."""
+        return {date: self.days[date][0] for date in sorted(self.days)}
+
+    def monthly_totals(self) -> Dict[str, float]:
+        """Total spent per month, in month order."""
+        return {month: self.months[month][0] for month in sorted(self.months)}
+
+    @cached_property
+    def daily_index(self) -> DailyIndex:
+        """Prefix-sum index over the daily buckets, built on first use."""
+        return DailyIndex(self.days)
+
+    def month_total(self, month: str) -> float:
+        """Total spent in a month (YYYY-MM)."""
+        bucket = self.months.get(month)
+        return bucket[0] if bucket else 0.0
+
+    def month_bucket(self, month: str) -> Tuple[float, int, int]:
+        """Get (total, transaction count, days with expenses) for a month."""
+        total, count, days = self.months.get(month, (0.0, 0, 0))
+        return total, int(count), int(days)
+
+    def restrict(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> "LedgerAggregates":
+        """
+        Get the aggregates for an inclusive date range.
+
+        Months wholly inside the range reuse their month-level name buckets;
+        only the partial months at either edge (at most two) are rolled up
+        from day-level name buckets.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+
+        Returns:
+            LedgerAggregates view covering only the range
+        """
+        if start_date is None and end_date is None:
+            return self
+
+        days = {
+            date: bucket
+            for date, bucket in self.days.items()
+            if (start_date is None or date >= start_date) and (end_date is None or date <= end_date)
+        }
+        months: Dict[str, Bucket] = {}
+        for date, (total, count) in days.items():
+            bucket = months.setdefault(date[:7], [0.0, 0, 0])
+            bucket[0] += total
+            bucket[1] += count
+            bucket[2] += 1
+
+        # Whole months keep their name buckets; partial ones roll up their days
+        names: Dict[str, Dict[str, Bucket]] = {}
+        day_names: Dict[str, Dict[str, Bucket]] = {}
+        for month, bucket in months.items():
+            if bucket[2] == self.months[month][2]:
+                names[month] = self.names.get(month, {})
+                continue
+            rollup = names.setdefault(month, {})
+            for date, by_name in self.day_name_buckets(month).items():
+                if date not in days:
+                    continue
+                day_names[date] = by_name
+                for name, (total, count) in by_name.items():
+                    name_bucket = rollup.setdefault(name, [0.0, 0])
+                    name_bucket[0] += total
+                    name_bucket[1] += count
+
+        return LedgerAggregates(days, months, names, day_names)
+
+    def name_totals(self, month: Optional[str] = None) -> Dict[str, Tuple[float, int]]:
+        """
+        Get total and count per expense name.
+
+        Args:
+            month: Restrict to a month (YYYY-MM). All months if None.
+
+        Returns:
+            Dictionary mapping expense names to (total, count)
+        """
+        months = [month] if month is not None else sorted(self.names)
+        result: Dict[str, Tuple[float, int]] = {}
+        for key in months:
+            for name, (total, count) in self.names.get(key, {}).items():
+                prev_total, prev_count = result.get(name, (0.0, 0))
+                result[name] = (prev_total + total, prev_count + int(count))
+        return result
+
+
+def apply_rows(doc: Dict[str, Any], rows: Iterable[ExpenseRow], sign: int) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) expenses from aggregate buckets in place.
+
+    Args:
+        doc: Dictionary with "days", "months", "names" and "day_names" buckets
+        rows: (date, expense dict) pairs
+        sign: 1 to add, -1 to remove
+    """
+    days, months, names = doc["days"], doc["months"], doc["names"]
+    day_names = doc["day_names"]
+    for date, item in rows:
+        amount = float(item["amount"]) * sign
+        month = date[:7]
+
+        day = days.setdefault(date, [0.0, 0])
+        month_bucket = months.setdefault(month, [0.0, 0, 0])
+        name = names.setdefault(month, {}).setdefault(item["expense"], [0.0, 0])
+        day_name = day_names.setdefault(date, {}).setdefault(item["expense"], [0.0, 0])
+
+        if day[1] == 0:
+            month_bucket[2] += 1
+        for bucket in (day, month_bucket, name, day_name):
+            bucket[0] += amount
+            bucket[1] += sign
+
+        # Drop emptied buckets so removals leave no rounding residue behind
+        if name[1] <= 0:
+            del names[month][item["expense"]]
+        if day_name[1] <= 0:
+            del day_names[date][item["expense"]]
+        if day[1] <= 0:
+            del days[date]
+            day_names.pop(date, None)
+            month_bucket[2] -= 1
+        if month_bucket[1] <= 0:
+            del months[month]
+            names.pop(month, None)
+
+
+def split_months(doc: Dict[str, Any], months: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Cut a full aggregates document into per-month documents.
+
+    Per-day name buckets are not stored; they are recomputed from a month's
+    expenses when a range needs them.
+
+    Args:
+        doc: Dictionary with "days" and "names" buckets
+        months: Months (YYYY-MM) to extract
+
+    Returns:
+        Month -> {"days", "names"} document
+    """
+    result = {month: {"days": {}, "names": doc["names"].get(month, {})} for month in months}
+    for date, bucket in doc["days"].items():
+        if date[:7] in result:
+            result[date[:7]]["days"][date] = bucket
+    return result
+
+
+class AggregateStore:
+    """
+    File-backed aggregates for the JSON ledger backends.
+
+    Buckets are stored one file per month under ``aggregates/``, next to a
+    small index holding the monthly totals and a stamp of the ledger files
+    the aggregates were computed from. Per-day name buckets, which are about
+    as large as the ledger itself, are not stored: the few partial months a
+    range query needs are rolled up from that month's expenses. Repositories report every write
+    through ``record``, which rewrites only the touched months and then the
+    index, provided the stamp still matches the ledger as it was before the
+    write. Any mismatch (a crash between writes, an external edit, a backend
+    switch) makes the next ``get`` rebuild from a full scan.
+    """
+
+    def __init__(
+        self,
+        file_manager: FileManager,
+        stamp: Callable[[], List[Any]],
+        load_all: Callable[[], Dict[str, List[Dict]]],
+        load_month: Callable[[str], Dict[str, List[Dict]]],
+        file_path: Optional[Path] = None,
+        month_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize aggregate store.
+
+        Args:
+            file_manager: FileManager instance
+            stamp: Returns the current version stamp of the ledger files
+            load_all: Loads the full ledger, used for rebuilds
+            load_month: Loads one month of the ledger (YYYY-MM)
+            file_path: Aggregates index file. Defaults to settings.aggregates_file
+            month_dir: Per-month aggregates directory. Defaults to settings.aggregates_dir
+        """
+        self.settings = get_settings()
+        self.file_manager = file_manager
+        self.file_path = file_path or self.settings.aggregates_file
+        self.month_dir = month_dir or self.settings.aggregates_dir
+        self._stamp = stamp
+        self._load_all = load_all
+        self._load_ledger_month = load_month
+        self._index: Optional[Dict[str, Any]] = None
+        self._view: Optional[LedgerAggregates] = None
+
+    def stamp(self) -> List[Any]:
+        """Current version stamp of the ledger files."""
+        return self._stamp()
+
+    def _month_file(self, month: str) -> Path:
+        """Path to the aggregates of a month (YYYY-MM)."""
+        return self.month_dir / f"{month}.json"
+
+    def _load_month(self, month: str, readonly: bool = True) -> Dict[str, Any]:
+        """Load the aggregates of a month."""
+        return self.file_manager.load_json(
+            self._month_file(month),
+            default={"days": {}, "names": {}},
+            readonly=readonly,
+        )
+
+    def _save_month(self, month: str, doc: Dict[str, Any]) -> None:
+        """Write the aggregates of a month, removing the file once it is empty."""
+        if doc["days"]:
+            self.file_manager.save_json(self._month_file(month), doc, create_backup=False)
+        else:
+            self._month_file(month).unlink(missing_ok=True)
+
+    def _is_current(self, index: Dict[str, Any], stamp: List[Any]) -> bool:
+        """Whether an index was written by this version for the given ledger stamp."""
+        return index.get("version") == AGGREGATES_VERSION and index.get("stamp") == stamp
+
+    def get(self) -> LedgerAggregates:
+        """
+        Get current aggregates, rebuilding them if they are missing or stale.
+
+        Returns:
+            LedgerAggregates view (must not be mutated)
+        """
+        index = self.file_manager.load_json(self.file_path, default={}, readonly=True)
+        if not self._is_current(index, self.stamp()):
+            index = self.rebuild()
+
+        # Every write rewrites the index, so an unchanged index means unchanged months
+        if index is not self._index:
+            days: Dict[str, Bucket] = {}
+            names: Dict[str, Dict[str, Bucket]] = {}
+            for month in sorted(index["months"]):
+                doc = self._load_month(month)
+                days.update(doc["days"])
+                names[month] = doc["names"]
+            self._index, self._view = index, LedgerAggregates(
+                days, index["months"], names, month_day_names=self.month_day_names
+            )
+        return self._view
+
+    def has_date(self, date: str) -> Optional[bool]:
+        """
+        Check from the stored aggregates whether a date has any expenses.
+
+        Only the index and that month's aggregates are read; the ledger
+        itself is not.
+
+        Args:
+            date: Date (YYYY-MM-DD)
+
+        Returns:
+            Whether the date has expenses, or None if aggregates are
+            disabled or out of date
+        """
+        if not self.settings.aggregates_enabled:
+            return None
+        index = self.file_manager.load_json(self.file_path, default={}, readonly=True)
+        if not self._is_current(index, self.stamp()):
+            return None
+        return date[:7] in index["months"] and date in self._load_month(date[:7])["days"]
+
+    def month_day_names(self, month: str) -> Dict[str, Dict[str, Bucket]]:
+        """
+        Roll up per-day expense-name buckets for one month of the ledger.
+
+        Args:
+            month: Month (YYYY-MM)
+
+        Returns:
+            Date -> expense name -> [total, count]
+        """
+        doc: Dict[str, Any] = {"days": {}, "months": {}, "names": {}, "day_names": {}}
+        apply_rows(
+            doc,
+            (
+                (date, item)
+                for date, items in sorted(self._load_ledger_month(month).items())
+                for item in items
+            ),
+            1,
+        )
+        return doc["day_names"]
+
+    def rebuild(self, data: Optional[Dict[str, List[Dict]]] = None) -> Dict[str, Any]:
+        """
+        Recompute all aggregates from a full scan of the ledger.
+
+        Args:
+            data: Ledger data to aggregate. Loaded from the repository if None.
+
+        Returns:
+            The stored aggregates index
+        """
+        if data is None:
+            data = self._load_all()
+        doc: Dict[str, Any] = {"days": {}, "months": {}, "names": {}, "day_names": {}}
+        apply_rows(
+            doc, ((date, item) for date, items in sorted(data.items()) for item in items), 1
+        )
+
+        self.month_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.month_dir.glob("*.json"):
+            if path.stem not in doc["months"]:
+                path.unlink(missing_ok=True)
+        for month, month_doc in split_months(doc, doc["months"]).items():
+            self._save_month(month, month_doc)
+
+        index = {"version": AGGREGATES_VERSION, "stamp": self.stamp(), "months": doc["months"]}
+        self.file_manager.save_json(self.file_path, index, create_backup=False)
+        return index
+
+    def record(
+        self,
+        before: List[Any],
+        added: Iterable[ExpenseRow] = (),
+        removed: Iterable[ExpenseRow] = (),
+    ) -> None:
+        """
+        Apply the effect of a ledger write to the stored aggregates.
+
+        Only the months the write touched are read and rewritten.
+
+        Args:
+            before: Ledger stamp taken before the write
+            added: (date, expense dict) pairs that were added
+            removed: (date, expense dict) pairs that were removed
+        """
+        if not self.settings.aggregates_enabled:
+            return
+
+        index = self.file_manager.load_json(self.file_path, default={})
+        if not self._is_current(index, before):
+            # Stale or missing: leave it for the next read to rebuild
+            return
+
+        added, removed = list(added), list(removed)
+        touched = sorted({date[:7] for date, _ in added + removed})
+        doc: Dict[str, Any] = {"days": {}, "months": index["months"], "names": {}, "day_names": {}}
+        for month in touched:
+            month_doc = self._load_month(month, readonly=False)
+            doc["days"].update(month_doc["days"])
+            doc["names"][month] = month_doc["names"]
+
+        apply_rows(doc, removed, -1)
+        apply_rows(doc, added, 1)
+
+        # Month files first: the index is the commit point that marks them current
+        if touched:
+            self.month_dir.mkdir(parents=True, exist_ok=True)
+        for month, month_doc in split_months(doc, touched).items():
+            self._save_month(month, month_doc)
+        index["stamp"] = self.stamp()
+        self.file_manager.save_json(self.file_path, index, create_backup=False)
+
+
+def file_stamp(file_manager: FileManager, *paths: Path) -> List[Any]:
+    """
+    Build a JSON-compatible version stamp from file versions.
+
+    Args:
+        file_manager: FileManager instance
+        paths: Files whose versions make up the stamp
+
+    Returns:
+        List with one [mtime_ns, size, inode] (or None) entry per file
+    """
+    stamp = []
+    for path in paths:
+        version = file_manager.get_file_version(path)
+        stamp.append(list(version) if version is not None else None)
+    return stamp
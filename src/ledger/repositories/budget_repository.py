@@ -4,11 +4,17 @@ from typing import Optional
 
 from ..config import get_settings
 from ..domain.budget import Budget, MonthlyBudget
-from .file_manager import FileManager
+from .file_manager import FileManager, FileVersion
+from .locking import lock_for, read_locked, write_locked
 
 
 class BudgetRepository:
-    """Repository for budget CRUD operations."""
+    """
+    Repository for budget CRUD operations.
+
+    ``writes`` counts how many times the budget file has been saved, so
+    callers can check that read paths never write.
+    """
 
     def __init__(self, file_manager: Optional[FileManager] = None):
         """
@@ -19,7 +25,10 @@ class BudgetRepository:
         """
         self.settings = get_settings()
         self.file_manager = file_manager or FileManager(self.settings)
+        self.lock = lock_for(self.settings.budget_file)
+        self.writes = 0
 
+    @read_locked
     def load(self) -> Budget:
         """
         Load budget data from file.
@@ -27,11 +36,24 @@ class BudgetRepository:
         Returns:
             Budget instance
         """
-        data = self.file_manager.load_json(self.settings.budget_file, default={})
+        data = self.file_manager.load_json(
+            self.settings.budget_file, default={}, readonly=True
+        )
         if not data:
             return Budget.create_default()
         return Budget.from_dict(data)
 
+    @read_locked
+    def get_version(self) -> Optional[FileVersion]:
+        """
+        Get a version stamp of the budget file.
+
+        Returns:
+            File version, or None while no budget has been saved
+        """
+        return self.file_manager.get_file_version(self.settings.budget_file)
+
+    @write_locked
     def save(self, budget: Budget) -> None:
         """
         Save budget data to file.
@@ -40,7 +62,26 @@ class BudgetRepository:
             budget: Budget instance to save
         """
         self.file_manager.save_json(self.settings.budget_file, budget.to_dict())
+        budget.dirty = False
+        self.writes += 1
+
+    @write_locked
+    def save_if_dirty(self, budget: Budget) -> bool:
+        """
+        Save budget data only if it has unsaved changes.
+
+        Args:
+            budget: Budget instance to save
+
+        Returns:
+            True if the budget was written
+        """
+        if not budget.dirty:
+            return False
+        self.save(budget)
+        return True
 
+    @read_locked
     def get_monthly_budget(self, month: str) -> Optional[MonthlyBudget]:
         """
         Get budget for a specific month.
@@ -54,6 +95,7 @@ class BudgetRepository:
         budget = self.load()
         return budget.monthly_budgets.get(month)
 
+    @write_locked
     def set_monthly_budget(self, month: str, amount: float) -> MonthlyBudget:
         """
         Set budget for a specific month.
@@ -70,6 +112,7 @@ class BudgetRepository:
         self.save(budget)
         return monthly_budget
 
+    @write_locked
     def update_monthly_spending(self, month: str, spent: float) -> None:
         """
         Update spending amount for a month.
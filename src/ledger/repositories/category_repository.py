@@ -4,7 +4,8 @@ from typing import Dict, List, Optional
 
 from ..config import get_settings
 from ..domain.category import Category
-from .file_manager import FileManager
+from .file_manager import FileManager, FileVersion
+from .locking import lock_for, read_locked, write_locked
 
 
 class CategoryRepository:
@@ -19,7 +20,9 @@ class CategoryRepository:
         """
         self.settings = get_settings()
         self.file_manager = file_manager or FileManager(self.settings)
+        self.lock = lock_for(self.settings.categories_file)
 
+    @read_locked
     def load_all(self) -> Dict[str, Category]:
         """
         Load all categories from file.
@@ -35,6 +38,17 @@ class CategoryRepository:
             return Category.get_default_categories()
         return Category.from_dict(data)
 
+    @read_locked
+    def get_version(self) -> Optional[FileVersion]:
+        """
+        Get a version stamp of the categories file.
+
+        Returns:
+            File version, or None while the default categories are in use
+        """
+        return self.file_manager.get_file_version(self.settings.categories_file)
+
+    @write_locked
     def save_all(self, categories: Dict[str, Category]) -> None:
         """
         Save all categories to file.
@@ -45,6 +59,7 @@ class CategoryRepository:
         data = {name: cat.keywords for name, cat in categories.items()}
         self.file_manager.save_json(self.settings.categories_file, data)
 
+    @read_locked
     def get_category(self, name: str) -> Optional[Category]:
         """
         Get a category by name.
@@ -58,6 +73,7 @@ class CategoryRepository:
         categories = self.load_all()
         return categories.get(name.lower())
 
+    @write_locked
     def add_category(self, category: Category) -> None:
         """
         Add a new category.
@@ -71,6 +87,7 @@ class CategoryRepository:
         categories[category.name] = category
         self.save_all(categories)
 
+    @write_locked
     def remove_category(self, name: str) -> None:
         """
         Remove a category.
@@ -85,6 +102,7 @@ class CategoryRepository:
         del categories[name_lower]
         self.save_all(categories)
 
+    @write_locked
     def update_category(self, category: Category) -> None:
         """
         Update an existing category.
@@ -0,0 +1,108 @@
+"""Streaming compression codecs for on-disk data files."""
+
+import gzip
+import io
+from typing import BinaryIO, Dict
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class Codec:
+    """
+    Wraps binary file objects in streaming (de)compressors.
+
+    The base class is the identity codec used for uncompressed files.
+    Closing a wrapper flushes the compressed stream; the underlying file
+    is closed by its owner.
+    """
+
+    name = "none"
+    suffix = ""
+    magic = b""
+
+    def writer(self, fh: BinaryIO) -> BinaryIO:
+        """Wrap a file opened for writing."""
+        return fh
+
+    def reader(self, fh: BinaryIO) -> BinaryIO:
+        """Wrap a file opened for reading."""
+        return fh
+
+
+class GzipCodec(Codec):
+    """gzip compression from the standard library."""
+
+    name = "gzip"
+    suffix = ".gz"
+    magic = b"\x1f\x8b"
+
+    def writer(self, fh: BinaryIO) -> BinaryIO:
+        """Stream gzip-compressed output."""
+        return gzip.GzipFile(fileobj=fh, mode="wb", compresslevel=6, mtime=0)
+
+    def reader(self, fh: BinaryIO) -> BinaryIO:
+        """Stream gzip-decompressed input."""
+        return gzip.GzipFile(fileobj=fh, mode="rb")
+
+
+class ZstdCodec(Codec):
+    """Zstandard compression (requires the ``zstandard`` package)."""
+
+    name = "zstd"
+    suffix = ".zst"
+    magic = b"\x28\xb5\x2f\xfd"
+
+    def writer(self, fh: BinaryIO) -> BinaryIO:
+        """Stream zstd-compressed output."""
+        return zstandard.ZstdCompressor(level=3).stream_writer(fh, closefd=False)
+
+    def reader(self, fh: BinaryIO) -> BinaryIO:
+        """Stream zstd-decompressed input."""
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(fh, closefd=False)
+        )
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec for codec in (Codec(), GzipCodec(), ZstdCodec())
+}
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Get a compression codec by name.
+
+    Args:
+        name: One of "none", "gzip" or "zstd"
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the codec is unknown or its library is not installed
+    """
+    codec = CODECS.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown compression: {name}. Use one of: {', '.join(CODECS)}")
+    if name == "zstd" and zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+    return codec
+
+
+def detect_codec(head: bytes) -> Codec:
+    """
+    Pick the codec able to read a file from its first bytes.
+
+    Args:
+        head: Leading bytes of the file (at least 4)
+
+    Returns:
+        Codec instance ("none" for uncompressed files)
+    """
+    for codec in CODECS.values():
+        if codec.magic and head.startswith(codec.magic):
+            return get_codec(codec.name)
+    return CODECS["none"]
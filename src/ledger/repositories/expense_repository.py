@@ -1,15 +1,106 @@
 """Repository for expense data access."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from ..config import get_settings
-from ..domain.expense import Expense
+from ..domain.expense import Expense, expense_id_date, new_expense_id
+from .aggregate_store import AggregateStore, LedgerAggregates, file_stamp
 from .file_manager import FileManager
+from .journal import ExpenseJournal
+from .locking import lock_for, read_locked, write_locked
+from .write_counter import WriteCounter
+
+
+def assign_missing_ids(data: Dict[str, List[Dict]]) -> int:
+    """
+    Give stored expenses created before IDs existed a stable ID, in place.
+
+    Args:
+        data: Dictionary mapping dates to expense lists
+
+    Returns:
+        Number of expenses that received an ID
+    """
+    assigned = 0
+    for date, expenses in data.items():
+        for item in expenses:
+            if "id" not in item:
+                item["id"] = new_expense_id(date)
+                assigned += 1
+    return assigned
+
+
+def resume_position(expenses: List[Dict], after: Tuple[str, Optional[str], int]) -> int:
+    """
+    Find where a page resumes on its cursor's date.
+
+    Args:
+        expenses: Expenses stored on the cursor's date
+        after: Cursor position (date, expense ID, index)
+
+    Returns:
+        Index of the first expense after the cursor
+    """
+    _, expense_id, index = after
+    if expense_id is not None:
+        for position, item in enumerate(expenses):
+            if item.get("id") == expense_id:
+                return position + 1
+    # The cursor's expense was deleted; the one after it moved into its slot
+    return max(index, 0)
+
+
+def page_expenses(
+    data: Dict[str, List[Dict]],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    after: Optional[Tuple[str, Optional[str], int]] = None,
+    limit: int = 100,
+    descending: bool = False,
+) -> List[Tuple[str, int, Dict]]:
+    """
+    Collect up to ``limit`` expenses in ``(date, index)`` order.
+
+    Args:
+        data: Dictionary mapping dates to expense lists
+        start_date: Start date (YYYY-MM-DD). Unbounded if None.
+        end_date: End date (YYYY-MM-DD). Unbounded if None.
+        after: Only return expenses positioned after this (date, expense ID, index)
+        limit: Maximum number of expenses to return
+        descending: Walk dates newest first (indices stay in order within a date)
+
+    Returns:
+        List of (date, index, expense dict) tuples
+    """
+    rows: List[Tuple[str, int, Dict]] = []
+    for date in sorted(data, reverse=descending):
+        if (start_date and date < start_date) or (end_date and date > end_date):
+            continue
+        if after is not None and (date > after[0] if descending else date < after[0]):
+            continue
+        first = 0
+        if after is not None and date == after[0]:
+            first = resume_position(data[date], after)
+        for index in range(first, len(data[date])):
+            if len(rows) >= limit:
+                return rows
+            rows.append((date, index, dict(data[date][index])))
+    return rows
 
 
 class ExpenseRepository:
-    """Repository for expense CRUD operations."""
+    """
+    Repository for expense CRUD operations.
+
+    When journaling is enabled (``LEDGER_JOURNAL=true``), mutations are
+    appended to a journal next to the ledger instead of rewriting the whole
+    snapshot, and the journal is compacted into the snapshot once it grows
+    past ``LEDGER_JOURNAL_COMPACT_THRESHOLD`` records.
+
+    Every write is also applied incrementally to the materialized
+    aggregates (see ``get_aggregates``).
+    """
 
     def __init__(self, file_manager: Optional[FileManager] = None):
         """
@@ -20,25 +111,120 @@ class ExpenseRepository:
         """
         self.settings = get_settings()
         self.file_manager = file_manager or FileManager(self.settings)
-
+        self.lock = lock_for(self.settings.ledger_file)
+        self.journal = ExpenseJournal(self.settings.journal_file)
+        self.writes = WriteCounter(self.settings.ledger_version_file)
+        self.aggregates = AggregateStore(
+            self.file_manager,
+            stamp=lambda: file_stamp(
+                self.file_manager, self.settings.ledger_file, self.settings.journal_file
+            ),
+            load_all=self.load_all,
+            load_month=self.get_expenses_by_month,
+        )
+
+    @read_locked
     def load_all(self) -> Dict[str, List[Dict]]:
         """
         Load all expenses from file.
 
+        The result may be shared with the file read cache and must be treated
+        as read-only.
+
         Returns:
             Dictionary mapping dates (YYYY-MM-DD) to lists of expense dicts
         """
-        return self.file_manager.load_json(self.settings.ledger_file, default={})
+        return self._load(readonly=True)
+
+    def _load(self, readonly: bool) -> Dict[str, List[Dict]]:
+        """
+        Load the snapshot and replay pending journal records on top of it.
 
+        The journal is replayed even if journaling has since been disabled.
+
+        Args:
+            readonly: Allow returning the shared cached snapshot
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        records = self.journal.read()
+        data = self.file_manager.load_json(
+            self.settings.ledger_file, default={}, readonly=readonly and not records
+        )
+        for record in records:
+            ExpenseJournal.apply(data, record)
+        return data
+
+    @write_locked
     def save_all(self, data: Dict[str, List[Dict]]) -> None:
         """
         Save all expenses to file.
 
+        Writing a full snapshot supersedes the journal, which is cleared.
+
         Args:
             data: Dictionary mapping dates to expense lists
         """
+        self._save(data)
+        if self.settings.aggregates_enabled:
+            self.aggregates.rebuild(data)
+
+    def _save(self, data: Dict[str, List[Dict]]) -> None:
+        """Write a full snapshot and clear the journal."""
         self.file_manager.save_json(self.settings.ledger_file, data)
+        self.journal.clear()
+        self.writes.bump()
+
+    @write_locked
+    def compact(self) -> None:
+        """Fold pending journal records into the ledger snapshot."""
+        data = self._load(readonly=False)
+        assign_missing_ids(data)
+        before = self.aggregates.stamp()
+        self._save(data)
+        self.aggregates.record(before)
+
+    def _append_to_journal(self, records: List[Dict]) -> None:
+        """Append mutation records and compact if the journal is too long."""
+        self.journal.append_many(records)
+        self.writes.bump()
+        if len(self.journal) >= self.settings.journal_compact_threshold:
+            self.compact()
+
+    @read_locked
+    def get_aggregates(self) -> LedgerAggregates:
+        """
+        Get materialized daily, monthly and per-name totals.
+
+        Returns:
+            LedgerAggregates view
+        """
+        return self.aggregates.get()
+
+    @read_locked
+    def get_version(self) -> List[Any]:
+        """
+        Get a version stamp of the ledger that changes on every write.
+
+        Returns:
+            JSON-compatible stamp of the write counter followed by the ledger
+            file versions, which catch edits made outside the repository
+        """
+        return [self.writes.value(), *self.aggregates.stamp()]
 
+    @read_locked
+    def rebuild_aggregates(self) -> LedgerAggregates:
+        """
+        Recompute the materialized aggregates from a full ledger scan.
+
+        Returns:
+            LedgerAggregates view
+        """
+        self.aggregates.rebuild()
+        return self.aggregates.get()
+
+    @write_locked
     def add_expense(self, expense: Expense) -> None:
         """
         Add a new expense.
@@ -46,15 +232,36 @@ class ExpenseRepository:
         Args:
             expense: Expense to add
         """
-        data = self.load_all()
-        date_key = expense.date
+        self.add_many([expense])
 
-        if date_key not in data:
-            data[date_key] = []
-
-        data[date_key].append(expense.to_dict())
-        self.save_all(data)
+    @write_locked
+    def add_many(self, expenses: List[Expense]) -> None:
+        """
+        Add several expenses with a single write.
 
+        Args:
+            expenses: Expenses to add
+        """
+        if not expenses:
+            return
+
+        added = [(expense.date, expense.to_dict()) for expense in expenses]
+        before = self.aggregates.stamp()
+
+        if self.settings.journal_enabled:
+            self._append_to_journal(
+                [{"op": "add", "date": date, "item": item} for date, item in added]
+            )
+        else:
+            data = self._load(readonly=False)
+            for date, item in added:
+                data.setdefault(date, []).append(item)
+            assign_missing_ids(data)
+            self._save(data)
+
+        self.aggregates.record(before, added=added)
+
+    @read_locked
     def get_expenses_by_date(self, date: str) -> List[Dict]:
         """
         Get expenses for a specific date.
@@ -68,6 +275,23 @@ class ExpenseRepository:
         data = self.load_all()
         return data.get(date, [])
 
+    @read_locked
+    def get_expenses_by_month(self, month: str) -> Dict[str, List[Dict]]:
+        """
+        Get expenses for a month.
+
+        Args:
+            month: Month in YYYY-MM format
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        data = self.load_all()
+        return {
+            date: expenses for date, expenses in data.items() if date.startswith(month)
+        }
+
+    @read_locked
     def get_expenses_by_week(self) -> Dict[str, List[Dict]]:
         """
         Get expenses for the current week (last 7 days).
@@ -82,6 +306,7 @@ class ExpenseRepository:
         ]
         return {date: data.get(date, []) for date in week_dates if date in data}
 
+    @read_locked
     def get_expenses_by_range(
         self, start_date: str, end_date: str
     ) -> Dict[str, List[Dict]]:
@@ -102,6 +327,31 @@ class ExpenseRepository:
             if start_date <= date <= end_date
         }
 
+    @read_locked
+    def get_expenses_page(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after: Optional[Tuple[str, Optional[str], int]] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> List[Tuple[str, int, Dict]]:
+        """
+        Get a page of expenses in ``(date, index)`` order.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            after: Only return expenses positioned after this (date, expense ID, index)
+            limit: Maximum number of expenses to return
+            descending: Walk dates newest first (indices stay in order within a date)
+
+        Returns:
+            List of (date, index, expense dict) tuples
+        """
+        return page_expenses(self.load_all(), start_date, end_date, after, limit, descending)
+
+    @write_locked
     def update_expense(
         self,
         date: str,
@@ -118,17 +368,39 @@ class ExpenseRepository:
             expense: New expense name (optional)
             amount: New amount (optional)
         """
-        data = self.load_all()
+        # Journaled writes only need the current data for validation
+        data = self._load(readonly=self.settings.journal_enabled)
         if date not in data or index >= len(data[date]) or index < 0:
             raise ValueError(f"Expense not found at date {date}, index {index}")
 
+        old_item = dict(data[date][index])
+        new_item = dict(old_item)
         if expense is not None:
-            data[date][index]["expense"] = expense.strip().title()
+            new_item["expense"] = expense.strip().title()
         if amount is not None:
-            data[date][index]["amount"] = amount
-
-        self.save_all(data)
-
+            new_item["amount"] = amount
+        before = self.aggregates.stamp()
+
+        if self.settings.journal_enabled:
+            self._append_to_journal(
+                [
+                    {
+                        "op": "update",
+                        "date": date,
+                        "index": index,
+                        "expense": new_item["expense"] if expense is not None else None,
+                        "amount": amount,
+                    }
+                ]
+            )
+        else:
+            data[date][index] = new_item
+            assign_missing_ids(data)
+            self._save(data)
+
+        self.aggregates.record(before, added=[(date, new_item)], removed=[(date, old_item)])
+
+    @write_locked
     def delete_expense(self, date: str, index: int) -> None:
         """
         Delete an expense by date and index.
@@ -137,22 +409,34 @@ class ExpenseRepository:
             date: Date of the expense
             index: Index of the expense in the date's list
         """
-        data = self.load_all()
+        # Journaled writes only need the current data for validation
+        data = self._load(readonly=self.settings.journal_enabled)
         if date not in data or index >= len(data[date]) or index < 0:
             raise ValueError(f"Expense not found at date {date}, index {index}")
 
-        data[date].pop(index)
+        removed = [(date, data[date][index])]
+        before = self.aggregates.stamp()
+
+        if self.settings.journal_enabled:
+            self._append_to_journal([{"op": "delete", "date": date, "index": index}])
+        else:
+            data[date].pop(index)
+
+            # Remove date key if no expenses remain
+            if not data[date]:
+                del data[date]
 
-        # Remove date key if no expenses remain
-        if not data[date]:
-            del data[date]
+            assign_missing_ids(data)
+            self._save(data)
 
-        self.save_all(data)
+        self.aggregates.record(before, removed=removed)
 
+    @write_locked
     def delete_all(self) -> None:
         """Delete all expenses."""
         self.save_all({})
 
+    @read_locked
     def find_expense_by_name(
         self, date: str, expense_name: str
     ) -> Optional[int]:
@@ -173,3 +457,87 @@ class ExpenseRepository:
                 return i
         return None
 
+    @read_locked
+    def find_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Find an expense by its stable ID.
+
+        Only the expenses on the date encoded in the ID are compared. A date
+        without expenses is answered from the aggregates without touching
+        the ledger; otherwise the single-file ledger (and any journal) still
+        has to be loaded in full to reach that date, served from the read
+        cache while unchanged. The partitioned and SQLite backends read only
+        that date's data.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index), or None if not found
+        """
+        date = expense_id_date(expense_id)
+        if date is None or self.aggregates.has_date(date) is False:
+            return None
+        for i, expense in enumerate(self.get_expenses_by_date(date)):
+            if expense.get("id") == expense_id:
+                return date, i
+        return None
+
+    @read_locked
+    def get_expense_by_id(self, expense_id: str) -> Optional[Dict]:
+        """
+        Get an expense by its stable ID.
+
+        The lookup and the read happen under one lock, so a concurrent
+        delete cannot shift the expense's index in between.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Expense dictionary including its date and index, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is None:
+            return None
+        date, index = location
+        return {**self.get_expenses_by_date(date)[index], "date": date, "index": index}
+
+    @write_locked
+    def update_expense_by_id(
+        self,
+        expense_id: str,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Update an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+            expense: New expense name (optional)
+            amount: New amount (optional)
+
+        Returns:
+            Tuple of (date, index) of the updated expense, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is not None:
+            self.update_expense(*location, expense, amount)
+        return location
+
+    @write_locked
+    def delete_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Delete an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index) the expense was deleted from, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is not None:
+            self.delete_expense(*location)
+        return location
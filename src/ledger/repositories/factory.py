@@ -0,0 +1,30 @@
+"""Factory for selecting the configured expense storage backend."""
+
+from typing import Optional
+
+from ..config import get_settings
+from .expense_repository import ExpenseRepository
+from .file_manager import FileManager
+from .partitioned_expense_repository import PartitionedExpenseRepository
+from .sqlite_expense_repository import SqliteExpenseRepository
+
+
+def create_expense_repository(file_manager: Optional[FileManager] = None):
+    """
+    Create the expense repository selected by ``LEDGER_STORAGE``.
+
+    Args:
+        file_manager: FileManager instance. Creates new one if None.
+
+    Returns:
+        ExpenseRepository ("json", the default), PartitionedExpenseRepository
+        ("partitioned") or SqliteExpenseRepository ("sqlite")
+    """
+    backend = get_settings().storage_backend
+    if backend == "json":
+        return ExpenseRepository(file_manager)
+    if backend == "partitioned":
+        return PartitionedExpenseRepository(file_manager)
+    if backend == "sqlite":
+        return SqliteExpenseRepository(file_manager)
+    raise ValueError(f"Unknown storage backend: {backend}. Use 'json', 'partitioned' or 'sqlite'")
@@ -1,17 +1,122 @@
 """File management and backup utilities."""
 
-import json
+import os
 import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ..config import get_settings
+from .compression import Codec, detect_codec, get_codec
+from .serializers import Serializer, detect_serializer, get_serializer
+
+
+FileVersion = Tuple[int, int, int]
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the containers of parsed JSON data, sharing immutable scalars."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class JsonReadCache:
+    """
+    Process-wide cache of parsed JSON files.
+
+    Entries are keyed on the file path and validated against the file's
+    ``(mtime_ns, size, inode)`` on every lookup, so writes from other
+    processes are picked up on the next read. At most ``maxsize`` files
+    are kept (``LEDGER_READ_CACHE_SIZE`` if None); the least recently used
+    one is evicted first.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached files (0 disables caching).
+                Read from settings on each insert if None.
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Path, Tuple[FileVersion, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, file_path: Path, version: FileVersion) -> Tuple[bool, Any]:
+        """
+        Look up a parsed file.
+
+        Args:
+            file_path: Path to the file
+            version: Current version of the file on disk
+
+        Returns:
+            Tuple of (found, data)
+        """
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(file_path)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def put(self, file_path: Path, version: FileVersion, data: Any) -> None:
+        """Store parsed data for a file version, evicting the oldest files when full."""
+        maxsize = self.maxsize if self.maxsize is not None else get_settings().read_cache_size
+        with self._lock:
+            if maxsize <= 0:
+                self._entries.pop(file_path, None)
+                return
+            self._entries[file_path] = (version, data)
+            self._entries.move_to_end(file_path)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, file_path: Path) -> None:
+        """Drop the cached entry for a file."""
+        with self._lock:
+            self._entries.pop(file_path, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+            }
 
 
 class FileManager:
     """Manages file operations with automatic backup support."""
 
+    # Shared by all instances: every repository creates its own FileManager.
+    read_cache = JsonReadCache()
+
     def __init__(self, settings=None):
         """
         Initialize file manager.
@@ -24,11 +129,17 @@ class FileManager:
 
             settings = get_settings()
         self.settings = settings
+        self.serializer: Serializer = get_serializer(settings.serializer)
+        self.codec: Codec = get_codec(settings.compression)
 
     def create_backup(self, file_path: Path) -> Optional[Path]:
         """
         Create a backup of a file.
 
+        Backups are written with the codec selected by ``LEDGER_COMPRESSION``
+        (e.g. ``ledger_backup_<timestamp>.json.gz``). The file is streamed
+        through the codec, so it is never held in memory as a whole.
+
         Args:
             file_path: Path to file to backup
 
@@ -40,8 +151,22 @@ class FileManager:
 
         self.settings.paths.ensure_directories()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.settings.backup_dir / f"{file_path.stem}_backup_{timestamp}.json"
-        shutil.copy2(file_path, backup_file)
+        backup_file = (
+            self.settings.backup_dir
+            / f"{file_path.stem}_backup_{timestamp}.json{self.codec.suffix}"
+        )
+
+        with open(file_path, "rb") as src:
+            source_codec = detect_codec(src.peek(4)[:4])
+            if source_codec is not self.codec:
+                with source_codec.reader(src) as reader, open(backup_file, "wb") as dst:
+                    with self.codec.writer(dst) as writer:
+                        shutil.copyfileobj(reader, writer)
+
+        if source_codec is self.codec:
+            shutil.copy2(file_path, backup_file)
+        else:
+            shutil.copystat(file_path, backup_file)
 
         # Keep only the last N backups
         self._cleanup_old_backups(file_path.stem)
@@ -56,20 +181,46 @@ class FileManager:
             file_stem: Stem of the file (e.g., "ledger", "categories")
         """
         backups = sorted(
-            self.settings.backup_dir.glob(f"{file_stem}_backup_*.json"),
+            self.settings.backup_dir.glob(f"{file_stem}_backup_*.json*"),
             reverse=True,
         )
         if len(backups) > self.settings.max_backups:
             for old_backup in backups[self.settings.max_backups :]:
                 old_backup.unlink()
 
-    def load_json(self, file_path: Path, default: Optional[Dict] = None) -> Dict:
+    def get_file_version(self, file_path: Path) -> Optional[FileVersion]:
+        """
+        Get a cheap version stamp for a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Tuple of (mtime_ns, size, inode), or None if file doesn't exist
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def load_json(
+        self, file_path: Path, default: Optional[Dict] = None, readonly: bool = False
+    ) -> Dict:
         """
-        Load JSON data from file.
+        Load data from file.
+
+        The format (JSON or MessagePack) and compression (none, gzip or
+        zstd) are detected from the file contents, so files written with
+        any serializer and codec can be read. Parsed data is
+        cached until the file changes on disk or is written through
+        ``save_json``.
 
         Args:
-            file_path: Path to JSON file
+            file_path: Path to data file
             default: Default value if file doesn't exist
+            readonly: Return the shared cached object instead of a private
+                copy. Callers passing True must not mutate the result.
 
         Returns:
             Dictionary with loaded data
@@ -78,22 +229,35 @@ class FileManager:
             default = {}
 
         try:
-            if not file_path.exists():
+            version = self.get_file_version(file_path)
+            if version is None:
+                self.read_cache.invalidate(file_path)
                 return default
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            found, data = self.read_cache.get(file_path, version)
+            if not found:
+                with open(file_path, "rb") as f:
+                    with detect_codec(f.peek(4)[:4]).reader(f) as reader:
+                        data = detect_serializer(reader.peek(1)[:1]).load(reader)
+                self.read_cache.put(file_path, version, data)
+        except (ValueError, IOError) as e:
             raise IOError(f"Error loading {file_path}: {e}") from e
 
+        return data if readonly else _copy_json(data)
+
     def save_json(
         self, file_path: Path, data: Dict, create_backup: Optional[bool] = None
     ) -> None:
         """
-        Save JSON data to file with optional backup.
+        Save data to file with optional backup.
+
+        Data is encoded with the serializer selected by ``LEDGER_SERIALIZER``
+        and streamed through the codec selected by ``LEDGER_COMPRESSION``.
+        The file is written under a temporary name and renamed into place,
+        so concurrent readers see either the old or the new contents.
 
         Args:
-            file_path: Path to JSON file
+            file_path: Path to data file
             data: Data to save
             create_backup: Whether to create backup. Uses settings default if None.
         """
@@ -108,11 +272,26 @@ class FileManager:
             self.create_backup(file_path)
 
         # Save file
+        fd, temp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(fd, "wb") as f, self.codec.writer(f) as writer:
+                self.serializer.dump(data, writer)
+            os.replace(temp_name, file_path)
         except IOError as e:
             raise IOError(f"Error saving {file_path}: {e}") from e
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            self.read_cache.invalidate(file_path)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get read cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, entries and evictions
+        """
+        return self.read_cache.stats()
 
     def file_exists(self, file_path: Path) -> bool:
         """Check if file exists."""
@@ -135,7 +314,7 @@ class FileManager:
             List of backup file paths, sorted by modification time (newest first)
         """
         backups = sorted(
-            self.settings.backup_dir.glob(f"{file_stem}_backup_*.json"),
+            self.settings.backup_dir.glob(f"{file_stem}_backup_*.json*"),
             key=lambda p: p.stat().st_mtime,
             reverse=True,
         )
@@ -0,0 +1,159 @@
+"""Append-only journal for ledger mutations."""
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class ExpenseJournal:
+    """
+    Append-only log of ledger mutations stored next to the ledger snapshot.
+
+    Each line is a compact JSON record describing one mutation. Replaying the
+    records in order on top of the snapshot yields the current ledger.
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Initialize journal.
+
+        Args:
+            file_path: Path to the journal file
+        """
+        self.file_path = file_path
+        self._count: Optional[int] = None
+
+    def append(self, record: Dict) -> None:
+        """
+        Append a single mutation record.
+
+        Args:
+            record: Mutation record (see ``apply`` for supported operations)
+        """
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict]) -> None:
+        """
+        Append several mutation records with a single write.
+
+        Args:
+            records: Mutation records to append
+        """
+        lines = [
+            json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+            for record in records
+        ]
+        if not lines:
+            return
+
+        count = len(self)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._repair_tail()
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except IOError as e:
+            raise IOError(f"Error appending to {self.file_path}: {e}") from e
+        self._count = count + len(lines)
+
+    def _repair_tail(self) -> None:
+        """
+        Drop a torn final line so the next record starts on a fresh line.
+
+        ``read`` already ignores such a line; appending after it would glue
+        the new record onto the fragment and lose both.
+        """
+        if not self.file_path.exists():
+            return
+        with open(self.file_path, "rb+") as f:
+            end = f.seek(0, 2)
+            position = end
+            while position > 0:
+                step = min(4096, position)
+                f.seek(position - step)
+                block = f.read(step)
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    position = position - step + newline + 1
+                    break
+                position -= step
+            if position != end:
+                f.truncate(position)
+
+    def read(self) -> List[Dict]:
+        """
+        Read all mutation records.
+
+        A truncated final line (e.g. from an interrupted append) is ignored.
+
+        Returns:
+            List of mutation records in append order
+        """
+        if not self.file_path.exists():
+            self._count = 0
+            return []
+
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                lines = [line for line in f.read().split("\n") if line.strip()]
+        except IOError as e:
+            raise IOError(f"Error loading {self.file_path}: {e}") from e
+
+        records = []
+        for position, line in enumerate(lines):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                if position == len(lines) - 1:
+                    break
+                raise IOError(f"Error loading {self.file_path}: {e}") from e
+
+        self._count = len(records)
+        return records
+
+    def clear(self) -> None:
+        """Remove all records (after they were compacted into the snapshot)."""
+        if self.file_path.exists():
+            self.file_path.unlink()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of records currently in the journal."""
+        if self._count is None:
+            self.read()
+        return self._count or 0
+
+    @staticmethod
+    def apply(data: Dict[str, List[Dict]], record: Dict) -> None:
+        """
+        Apply a mutation record to ledger data in place.
+
+        Supported operations:
+            add:    {"op": "add", "date": ..., "item": {...}}
+            update: {"op": "update", "date": ..., "index": ..., "expense": ..., "amount": ...}
+            delete: {"op": "delete", "date": ..., "index": ...}
+            clear:  {"op": "clear"}
+
+        Args:
+            data: Dictionary mapping dates to expense lists
+            record: Mutation record to apply
+        """
+        op = record.get("op")
+
+        if op == "add":
+            data.setdefault(record["date"], []).append(record["item"])
+        elif op == "update":
+            item = data[record["date"]][record["index"]]
+            if record.get("expense") is not None:
+                item["expense"] = record["expense"]
+            if record.get("amount") is not None:
+                item["amount"] = record["amount"]
+        elif op == "delete":
+            date = record["date"]
+            data[date].pop(record["index"])
+            if not data[date]:
+                del data[date]
+        elif op == "clear":
+            data.clear()
+        else:
+            raise ValueError(f"Unknown journal operation: {op}")
@@ -0,0 +1,119 @@
+"""Readers-writer locks shared by the file-backed repositories."""
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ReadWriteLock:
+    """
+    Reentrant lock that admits many readers or a single writer.
+
+    Service calls run on a thread pool, so reads of the same store proceed
+    in parallel while a read-modify-write holds it exclusively. Waiting
+    writers block new readers so a steady stream of reads cannot starve
+    them; a thread may re-enter a lock it already holds, and the writer may
+    also read, but a reader cannot upgrade to a writer.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: Dict[int, int] = {}
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the block."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me and me not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers[me] -= 1
+                if not self._readers[me]:
+                    del self._readers[me]
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Hold the lock exclusively for the duration of the block.
+
+        Raises:
+            RuntimeError: If the calling thread only holds the lock for reading
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                if me in self._readers:
+                    raise RuntimeError("Cannot upgrade a read lock to a write lock")
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._cond.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+_locks: Dict[Path, ReadWriteLock] = {}
+_locks_guard = threading.Lock()
+
+
+def lock_for(path: Path) -> ReadWriteLock:
+    """
+    Get the process-wide lock guarding a data file or directory.
+
+    Every repository instance over the same path shares one lock.
+
+    Args:
+        path: File or directory the lock protects
+
+    Returns:
+        ReadWriteLock instance
+    """
+    with _locks_guard:
+        return _locks.setdefault(Path(path), ReadWriteLock())
+
+
+def read_locked(method: F) -> F:
+    """Run a repository method holding ``self.lock`` for reading."""
+
+    @wraps(method)
+    def locked(self, *args: Any, **kwargs: Any) -> Any:
+        with self.lock.read():
+            return method(self, *args, **kwargs)
+
+    return cast(F, locked)
+
+
+def write_locked(method: F) -> F:
+    """Run a repository method holding ``self.lock`` exclusively."""
+
+    @wraps(method)
+    def locked(self, *args: Any, **kwargs: Any) -> Any:
+        with self.lock.write():
+            return method(self, *args, **kwargs)
+
+    return cast(F, locked)
@@ -0,0 +1,492 @@
+"""Month-partitioned JSON repository for expense data access."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import get_settings
+from ..domain.expense import Expense, expense_id_date
+from .aggregate_store import AggregateStore, LedgerAggregates, file_stamp
+from .expense_repository import ExpenseRepository, assign_missing_ids, page_expenses
+from .file_manager import FileManager
+from .locking import lock_for, read_locked, write_locked
+from .write_counter import WriteCounter
+
+
+MANIFEST_VERSION = 1
+
+
+class PartitionedExpenseRepository:
+    """
+    Repository for expense CRUD operations over per-month ledger files.
+
+    Expenses are stored as ``ledger/YYYY-MM.json`` partitions using the same
+    date-to-list layout as ``ledger.json``, plus a ``manifest.json`` listing
+    the partitions and their transaction counts, and a ``version`` write
+    counter. Reads only parse the
+    partitions overlapping the query and writes only rewrite the touched month.
+    Writes are applied incrementally to the materialized aggregates, stamped
+    with the manifest version.
+    """
+
+    def __init__(self, file_manager: Optional[FileManager] = None):
+        """
+        Initialize partitioned expense repository.
+
+        On first use an existing ``ledger.json`` is split into partitions.
+
+        Args:
+            file_manager: FileManager instance. Creates new one if None.
+        """
+        self.settings = get_settings()
+        self.file_manager = file_manager or FileManager(self.settings)
+        self.lock = lock_for(self.settings.ledger_partition_dir)
+        self.partition_dir = self.settings.ledger_partition_dir
+        self.manifest_file = self.partition_dir / "manifest.json"
+        self.writes = WriteCounter(self.partition_dir / "version")
+        self.aggregates = AggregateStore(
+            self.file_manager,
+            stamp=lambda: file_stamp(self.file_manager, self.manifest_file),
+            load_all=self.load_all,
+            load_month=self.get_expenses_by_month,
+        )
+
+        if not self.manifest_file.exists():
+            self.migrate_from_json()
+
+    def _partition_file(self, month: str) -> Path:
+        """Path to the partition holding a month (YYYY-MM)."""
+        return self.partition_dir / f"{month}.json"
+
+    def _load_manifest(self) -> Dict[str, int]:
+        """Load the month -> transaction count manifest."""
+        manifest = self.file_manager.load_json(
+            self.manifest_file, default={}, readonly=True
+        )
+        return manifest.get("months", {})
+
+    def _save_manifest(self, months: Dict[str, int]) -> None:
+        """Save the month -> transaction count manifest."""
+        self.file_manager.save_json(
+            self.manifest_file,
+            {"version": MANIFEST_VERSION, "months": dict(sorted(months.items()))},
+            create_backup=False,
+        )
+        self.writes.bump()
+
+    def _load_month(self, month: str, readonly: bool = True) -> Dict[str, List[Dict]]:
+        """Load the partition for a month."""
+        return self.file_manager.load_json(
+            self._partition_file(month), default={}, readonly=readonly
+        )
+
+    def _save_month(self, month: str, data: Dict[str, List[Dict]]) -> None:
+        """Rewrite a single partition and its manifest entry."""
+        months = dict(self._load_manifest())
+        partition_file = self._partition_file(month)
+
+        if data:
+            assign_missing_ids(data)
+            self.file_manager.save_json(partition_file, data)
+            months[month] = sum(len(expenses) for expenses in data.values())
+        else:
+            if partition_file.exists():
+                self.file_manager.create_backup(partition_file)
+                partition_file.unlink()
+            months.pop(month, None)
+
+        self._save_manifest(months)
+
+    def _months_between(self, start_date: str, end_date: str) -> List[str]:
+        """Partitions overlapping a date range."""
+        return [
+            month
+            for month in sorted(self._load_manifest())
+            if start_date[:7] <= month <= end_date[:7]
+        ]
+
+    def migrate_from_json(self) -> int:
+        """
+        One-shot split of the single-file JSON ledger into partitions.
+
+        Returns:
+            Number of expenses migrated
+        """
+        data = ExpenseRepository(self.file_manager).load_all()
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        self.save_all(data)
+        return sum(len(expenses) for expenses in data.values())
+
+    @read_locked
+    def load_all(self) -> Dict[str, List[Dict]]:
+        """
+        Load all expenses from every partition.
+
+        Returns:
+            Dictionary mapping dates (YYYY-MM-DD) to lists of expense dicts
+        """
+        data: Dict[str, List[Dict]] = {}
+        for month in sorted(self._load_manifest()):
+            data.update(self._load_month(month))
+        return data
+
+    @write_locked
+    def save_all(self, data: Dict[str, List[Dict]]) -> None:
+        """
+        Replace all expenses, rewriting every partition.
+
+        Args:
+            data: Dictionary mapping dates to expense lists
+        """
+        partitions: Dict[str, Dict[str, List[Dict]]] = {}
+        for date, expenses in data.items():
+            if expenses:
+                partitions.setdefault(date[:7], {})[date] = [dict(item) for item in expenses]
+
+        for month in set(self._load_manifest()) - set(partitions):
+            self._partition_file(month).unlink(missing_ok=True)
+
+        months = {}
+        for month, month_data in partitions.items():
+            assign_missing_ids(month_data)
+            self.file_manager.save_json(self._partition_file(month), month_data)
+            months[month] = sum(len(expenses) for expenses in month_data.values())
+        self._save_manifest(months)
+
+        if self.settings.aggregates_enabled:
+            self.aggregates.rebuild(data)
+
+    @read_locked
+    def get_aggregates(self) -> LedgerAggregates:
+        """
+        Get materialized daily, monthly and per-name totals.
+
+        Returns:
+            LedgerAggregates view
+        """
+        return self.aggregates.get()
+
+    @read_locked
+    def get_version(self) -> List[Any]:
+        """
+        Get a version stamp of the ledger that changes on every write.
+
+        Returns:
+            JSON-compatible stamp of the write counter followed by the
+            manifest file version
+        """
+        return [self.writes.value(), *self.aggregates.stamp()]
+
+    @read_locked
+    def rebuild_aggregates(self) -> LedgerAggregates:
+        """
+        Recompute the materialized aggregates from a full ledger scan.
+
+        Returns:
+            LedgerAggregates view
+        """
+        self.aggregates.rebuild()
+        return self.aggregates.get()
+
+    @write_locked
+    def add_expense(self, expense: Expense) -> None:
+        """
+        Add a new expense.
+
+        Args:
+            expense: Expense to add
+        """
+        self.add_many([expense])
+
+    @write_locked
+    def add_many(self, expenses: List[Expense]) -> None:
+        """
+        Add several expenses, rewriting each touched month once.
+
+        Args:
+            expenses: Expenses to add
+        """
+        added = [(expense.date, expense.to_dict()) for expense in expenses]
+        by_month: Dict[str, List[Tuple[str, Dict]]] = {}
+        for date, item in added:
+            by_month.setdefault(date[:7], []).append((date, item))
+
+        before = self.aggregates.stamp()
+        for month, month_items in sorted(by_month.items()):
+            data = self._load_month(month, readonly=False)
+            for date, item in month_items:
+                data.setdefault(date, []).append(item)
+            self._save_month(month, data)
+        self.aggregates.record(before, added=added)
+
+    @read_locked
+    def get_expenses_by_date(self, date: str) -> List[Dict]:
+        """
+        Get expenses for a specific date.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            List of expense dictionaries
+        """
+        return self._load_month(date[:7]).get(date, [])
+
+    @read_locked
+    def get_expenses_by_month(self, month: str) -> Dict[str, List[Dict]]:
+        """
+        Get expenses for a month.
+
+        Args:
+            month: Month in YYYY-MM format
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        return self._load_month(month)
+
+    @read_locked
+    def get_expenses_by_week(self) -> Dict[str, List[Dict]]:
+        """
+        Get expenses for the current week (last 7 days).
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        today = datetime.today()
+        start = (today + timedelta(days=-6)).strftime("%Y-%m-%d")
+        return self.get_expenses_by_range(start, today.strftime("%Y-%m-%d"))
+
+    @read_locked
+    def get_expenses_by_range(
+        self, start_date: str, end_date: str
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get expenses within a date range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        result: Dict[str, List[Dict]] = {}
+        for month in self._months_between(start_date, end_date):
+            for date, expenses in sorted(self._load_month(month).items()):
+                if start_date <= date <= end_date:
+                    result[date] = expenses
+        return result
+
+    @read_locked
+    def get_expenses_page(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after: Optional[Tuple[str, Optional[str], int]] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> List[Tuple[str, int, Dict]]:
+        """
+        Get a page of expenses in ``(date, index)`` order.
+
+        Only the partitions the page spans are loaded.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            after: Only return expenses positioned after this (date, expense ID, index)
+            limit: Maximum number of expenses to return
+            descending: Walk dates newest first (indices stay in order within a date)
+
+        Returns:
+            List of (date, index, expense dict) tuples
+        """
+        first_month = (start_date or "")[:7]
+        last_month = (end_date or "9999-12")[:7]
+        if after is not None and descending:
+            last_month = min(last_month, after[0][:7])
+        elif after is not None:
+            first_month = max(first_month, after[0][:7])
+
+        rows: List[Tuple[str, int, Dict]] = []
+        for month in sorted(self._load_manifest(), reverse=descending):
+            if month < first_month or month > last_month:
+                continue
+            if len(rows) >= limit:
+                break
+            rows.extend(
+                page_expenses(
+                    self._load_month(month),
+                    start_date,
+                    end_date,
+                    after,
+                    limit - len(rows),
+                    descending,
+                )
+            )
+        return rows
+
+    @write_locked
+    def update_expense(
+        self,
+        date: str,
+        index: int,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> None:
+        """
+        Update an expense by date and index.
+
+        Args:
+            date: Date of the expense
+            index: Index of the expense in the date's list
+            expense: New expense name (optional)
+            amount: New amount (optional)
+        """
+        month = date[:7]
+        data = self._load_month(month, readonly=False)
+        if date not in data or index >= len(data[date]) or index < 0:
+            raise ValueError(f"Expense not found at date {date}, index {index}")
+
+        old_item = dict(data[date][index])
+        if expense is not None:
+            data[date][index]["expense"] = expense.strip().title()
+        if amount is not None:
+            data[date][index]["amount"] = amount
+
+        before = self.aggregates.stamp()
+        self._save_month(month, data)
+        self.aggregates.record(
+            before, added=[(date, data[date][index])], removed=[(date, old_item)]
+        )
+
+    @write_locked
+    def delete_expense(self, date: str, index: int) -> None:
+        """
+        Delete an expense by date and index.
+
+        Args:
+            date: Date of the expense
+            index: Index of the expense in the date's list
+        """
+        month = date[:7]
+        data = self._load_month(month, readonly=False)
+        if date not in data or index >= len(data[date]) or index < 0:
+            raise ValueError(f"Expense not found at date {date}, index {index}")
+
+        removed = data[date].pop(index)
+
+        # Remove date key if no expenses remain
+        if not data[date]:
+            del data[date]
+
+        before = self.aggregates.stamp()
+        self._save_month(month, data)
+        self.aggregates.record(before, removed=[(date, removed)])
+
+    @write_locked
+    def delete_all(self) -> None:
+        """Delete all expenses."""
+        self.save_all({})
+
+    @read_locked
+    def find_expense_by_name(
+        self, date: str, expense_name: str
+    ) -> Optional[int]:
+        """
+        Find expense index by name (case-insensitive).
+
+        Args:
+            date: Date of the expense
+            expense_name: Name of the expense
+
+        Returns:
+            Index of the expense, or None if not found
+        """
+        expenses = self.get_expenses_by_date(date)
+        expense_name_lower = expense_name.lower()
+        for i, expense in enumerate(expenses):
+            if expense["expense"].lower() == expense_name_lower:
+                return i
+        return None
+
+    @read_locked
+    def find_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Find an expense by its stable ID.
+
+        Only the partition holding the date encoded in the ID is read.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index), or None if not found
+        """
+        date = expense_id_date(expense_id)
+        if date is None:
+            return None
+        for i, expense in enumerate(self.get_expenses_by_date(date)):
+            if expense.get("id") == expense_id:
+                return date, i
+        return None
+
+    @read_locked
+    def get_expense_by_id(self, expense_id: str) -> Optional[Dict]:
+        """
+        Get an expense by its stable ID.
+
+        The lookup and the read happen under one lock, so a concurrent
+        delete cannot shift the expense's index in between.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Expense dictionary including its date and index, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is None:
+            return None
+        date, index = location
+        return {**self.get_expenses_by_date(date)[index], "date": date, "index": index}
+
+    @write_locked
+    def update_expense_by_id(
+        self,
+        expense_id: str,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Update an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+            expense: New expense name (optional)
+            amount: New amount (optional)
+
+        Returns:
+            Tuple of (date, index) of the updated expense, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is not None:
+            self.update_expense(*location, expense, amount)
+        return location
+
+    @write_locked
+    def delete_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Delete an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index) the expense was deleted from, or None if not found
+        """
+        location = self.find_expense_by_id(expense_id)
+        if location is not None:
+            self.delete_expense(*location)
+        return location
@@ -0,0 +1,148 @@
+"""Serializers for on-disk data files."""
+
+import io
+import json
+from typing import Any, BinaryIO, Dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+# First bytes of a msgpack map or array; JSON documents never start with these.
+_MSGPACK_MARKERS = frozenset(range(0x80, 0xA0)) | {0xDC, 0xDD, 0xDE, 0xDF}
+
+
+class Serializer:
+    """Encodes data to and decodes data from binary file objects."""
+
+    name = ""
+
+    def dump(self, data: Any, fh: BinaryIO) -> None:
+        """Write data to a binary file object."""
+        raise NotImplementedError
+
+    def load(self, fh: BinaryIO) -> Any:
+        """Read data from a binary file object."""
+        raise NotImplementedError
+
+
+class JsonSerializer(Serializer):
+    """Standard library JSON, pretty-printed (the historical format)."""
+
+    name = "json"
+    indent = 2
+    separators = None
+
+    def dump(self, data: Any, fh: BinaryIO) -> None:
+        """Stream JSON text to a binary file object."""
+        writer = io.TextIOWrapper(fh, encoding="utf-8")
+        try:
+            json.dump(
+                data,
+                writer,
+                indent=self.indent,
+                separators=self.separators,
+                ensure_ascii=False,
+            )
+        finally:
+            writer.detach()
+
+    def load(self, fh: BinaryIO) -> Any:
+        """Parse JSON, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.loads(fh.read())
+        reader = io.TextIOWrapper(fh, encoding="utf-8")
+        try:
+            return json.load(reader)
+        finally:
+            reader.detach()
+
+
+class CompactJsonSerializer(JsonSerializer):
+    """Standard library JSON without whitespace."""
+
+    name = "json-compact"
+    indent = None
+    separators = (",", ":")
+
+
+class OrjsonSerializer(JsonSerializer):
+    """Compact JSON encoded with orjson."""
+
+    name = "orjson"
+
+    def dump(self, data: Any, fh: BinaryIO) -> None:
+        """Write compact JSON bytes."""
+        fh.write(orjson.dumps(data))
+
+
+class MsgpackSerializer(Serializer):
+    """Binary MessagePack encoding."""
+
+    name = "msgpack"
+
+    def dump(self, data: Any, fh: BinaryIO) -> None:
+        """Write MessagePack bytes."""
+        msgpack.pack(data, fh, use_bin_type=True)
+
+    def load(self, fh: BinaryIO) -> Any:
+        """Read MessagePack bytes."""
+        return msgpack.unpack(fh, raw=False)
+
+
+SERIALIZERS: Dict[str, Serializer] = {
+    serializer.name: serializer
+    for serializer in (
+        JsonSerializer(),
+        CompactJsonSerializer(),
+        OrjsonSerializer(),
+        MsgpackSerializer(),
+    )
+}
+
+
+def get_serializer(name: str) -> Serializer:
+    """
+    Get a serializer by name.
+
+    Args:
+        name: One of "json", "json-compact", "orjson" or "msgpack"
+
+    Returns:
+        Serializer instance
+
+    Raises:
+        ValueError: If the serializer is unknown or its library is not installed
+    """
+    serializer = SERIALIZERS.get(name)
+    if serializer is None:
+        raise ValueError(
+            f"Unknown serializer: {name}. Use one of: {', '.join(SERIALIZERS)}"
+        )
+    if name == "orjson" and orjson is None:
+        raise ValueError("The orjson serializer requires the 'orjson' package")
+    if name == "msgpack" and msgpack is None:
+        raise ValueError("The msgpack serializer requires the 'msgpack' package")
+    return serializer
+
+
+def detect_serializer(head: bytes) -> Serializer:
+    """
+    Pick the serializer able to read a file from its first bytes.
+
+    Args:
+        head: Leading bytes of the file
+
+    Returns:
+        Serializer instance (JSON unless the data is MessagePack)
+    """
+    if head and head[0] in _MSGPACK_MARKERS:
+        return get_serializer("msgpack")
+    return SERIALIZERS["json"]
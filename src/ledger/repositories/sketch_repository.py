@@ -0,0 +1,43 @@
+"""Repository for persisted analytics sketches."""
+
+from typing import Any, Dict, Optional
+
+from ..config import get_settings
+from .file_manager import FileManager
+from .locking import lock_for, read_locked, write_locked
+
+
+class SketchRepository:
+    """Stores per-month analytics sketches as a single JSON document."""
+
+    def __init__(self, file_manager: Optional[FileManager] = None):
+        """
+        Initialize sketch repository.
+
+        Args:
+            file_manager: FileManager instance. Creates new one if None.
+        """
+        self.settings = get_settings()
+        self.file_manager = file_manager or FileManager(self.settings)
+        self.lock = lock_for(self.settings.sketches_file)
+
+    @read_locked
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the sketches document.
+
+        Returns:
+            Stored document (shared with the read cache; must not be mutated),
+            or an empty dictionary
+        """
+        return self.file_manager.load_json(self.settings.sketches_file, default={}, readonly=True)
+
+    @write_locked
+    def save(self, doc: Dict[str, Any]) -> None:
+        """
+        Save the sketches document.
+
+        Args:
+            doc: Document to store
+        """
+        self.file_manager.save_json(self.settings.sketches_file, doc, create_backup=False)
@@ -0,0 +1,632 @@
+"""SQLite-backed repository for expense data access."""
+
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..config import get_settings
+from ..domain.expense import Expense, new_expense_id
+from .aggregate_store import LedgerAggregates
+from .file_manager import FileManager
+
+
+SCHEMA_VERSION = 1
+SQLITE_MAX_ROWID = 2**63 - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS expenses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    expense TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    amount REAL NOT NULL,
+    uid TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses (date, id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_expenses_uid ON expenses (uid);
+CREATE INDEX IF NOT EXISTS idx_expenses_name ON expenses (name_key, date);
+
+CREATE TABLE IF NOT EXISTS day_totals (
+    date TEXT PRIMARY KEY,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS name_totals (
+    month TEXT NOT NULL,
+    expense TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (month, expense)
+);
+CREATE TABLE IF NOT EXISTS day_name_totals (
+    date TEXT NOT NULL,
+    expense TEXT NOT NULL,
+    total REAL NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (date, expense)
+);
+CREATE TABLE IF NOT EXISTS ledger_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO ledger_version VALUES (0, 0);
+"""
+
+# Keep the *_totals tables in step with expenses inside each write transaction
+_ADD_TOTALS = """
+    INSERT INTO day_totals VALUES ({row}.date, {row}.amount, 1)
+        ON CONFLICT (date) DO UPDATE
+        SET total = total + excluded.total, count = count + 1;
+    INSERT INTO name_totals VALUES (substr({row}.date, 1, 7), {row}.expense, {row}.amount, 1)
+        ON CONFLICT (month, expense) DO UPDATE
+        SET total = total + excluded.total, count = count + 1;
+    INSERT INTO day_name_totals VALUES ({row}.date, {row}.expense, {row}.amount, 1)
+        ON CONFLICT (date, expense) DO UPDATE
+        SET total = total + excluded.total, count = count + 1;
+"""
+_REMOVE_TOTALS = """
+    UPDATE day_totals SET total = total - {row}.amount, count = count - 1
+        WHERE date = {row}.date;
+    DELETE FROM day_totals WHERE date = {row}.date AND count <= 0;
+    UPDATE name_totals SET total = total - {row}.amount, count = count - 1
+        WHERE month = substr({row}.date, 1, 7) AND expense = {row}.expense;
+    DELETE FROM name_totals
+        WHERE month = substr({row}.date, 1, 7) AND expense = {row}.expense AND count <= 0;
+    UPDATE day_name_totals SET total = total - {row}.amount, count = count - 1
+        WHERE date = {row}.date AND expense = {row}.expense;
+    DELETE FROM day_name_totals
+        WHERE date = {row}.date AND expense = {row}.expense AND count <= 0;
+"""
+# Every row change advances the ledger version, whichever connection made it
+_BUMP_VERSION = """
+    UPDATE ledger_version SET version = version + 1;
+"""
+TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS expenses_totals_insert AFTER INSERT ON expenses BEGIN
+{_ADD_TOTALS.format(row="NEW")}
+{_BUMP_VERSION}
+END;
+CREATE TRIGGER IF NOT EXISTS expenses_totals_delete AFTER DELETE ON expenses BEGIN
+{_REMOVE_TOTALS.format(row="OLD")}
+{_BUMP_VERSION}
+END;
+CREATE TRIGGER IF NOT EXISTS expenses_totals_update
+AFTER UPDATE OF date, expense, amount ON expenses BEGIN
+{_REMOVE_TOTALS.format(row="OLD")}
+{_ADD_TOTALS.format(row="NEW")}
+{_BUMP_VERSION}
+END;
+"""
+
+
+class SqliteExpenseRepository:
+    """
+    Repository for expense CRUD operations backed by SQLite.
+
+    Drop-in replacement for ``ExpenseRepository``: expenses are still
+    addressed by ``(date, index)``, where the index is the position of the
+    expense within its date in insertion order. Date and normalized-name
+    indexes keep point and range queries logarithmic in the ledger size.
+    Daily totals and per-day and per-month expense-name totals are maintained
+    by triggers in the same transaction as each write.
+    """
+
+    def __init__(self, file_manager: Optional[FileManager] = None):
+        """
+        Initialize SQLite expense repository.
+
+        On first use an existing ``ledger.json`` is migrated into the database.
+
+        Args:
+            file_manager: FileManager instance. Creates new one if None.
+        """
+        self.settings = get_settings()
+        self.file_manager = file_manager or FileManager(self.settings)
+        self.db_file = self.settings.ledger_db_file
+        self._lock = threading.RLock()
+        self._aggregates: Optional[Tuple[Tuple[int, int], LedgerAggregates]] = None
+
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.executescript(TRIGGERS)
+
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self.migrate_from_json()
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    @staticmethod
+    def _normalize_name(expense_name: str) -> str:
+        """Normalize an expense name for indexed lookups."""
+        return expense_name.lower()
+
+    @staticmethod
+    def _group_by_date(rows: Iterable[Tuple[str, str, float, str]]) -> Dict[str, List[Dict]]:
+        """Group ``(date, expense, amount, uid)`` rows into the ledger layout."""
+        data: Dict[str, List[Dict]] = {}
+        for date, expense, amount, uid in rows:
+            data.setdefault(date, []).append({"expense": expense, "amount": amount, "id": uid})
+        return data
+
+    def _insert_rows(self, rows: Iterable[Tuple[str, Dict]]) -> None:
+        """Insert ``(date, expense dict)`` rows (caller holds a transaction)."""
+        self._conn.executemany(
+            "INSERT INTO expenses (date, expense, name_key, amount, uid) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    date,
+                    item["expense"],
+                    self._normalize_name(item["expense"]),
+                    float(item["amount"]),
+                    item.get("id") or new_expense_id(date),
+                )
+                for date, item in rows
+            ),
+        )
+
+    def _find_row_id(self, date: str, index: int) -> Optional[int]:
+        """Find the row id of the expense at ``index`` on ``date``."""
+        if index < 0:
+            return None
+        row = self._conn.execute(
+            "SELECT id FROM expenses WHERE date = ? ORDER BY id LIMIT 1 OFFSET ?",
+            (date, index),
+        ).fetchone()
+        return row[0] if row else None
+
+    def migrate_from_json(self) -> int:
+        """
+        One-shot import of the JSON ledger (snapshot plus journal).
+
+        Runs only for a new database, so a ledger that was emptied after
+        migration is not re-imported.
+
+        Returns:
+            Number of expenses imported
+        """
+        from .expense_repository import ExpenseRepository
+
+        with self._lock, self._conn:
+            data = ExpenseRepository(self.file_manager).load_all()
+            rows = [(date, item) for date, expenses in data.items() for item in expenses]
+            empty = self._conn.execute("SELECT 1 FROM expenses LIMIT 1").fetchone() is None
+            if empty:
+                self._insert_rows(rows)
+        return len(rows) if empty else 0
+
+    def load_all(self) -> Dict[str, List[Dict]]:
+        """
+        Load all expenses.
+
+        Returns:
+            Dictionary mapping dates (YYYY-MM-DD) to lists of expense dicts
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, expense, amount, uid FROM expenses ORDER BY date, id"
+            ).fetchall()
+        return self._group_by_date(rows)
+
+    def save_all(self, data: Dict[str, List[Dict]]) -> None:
+        """
+        Replace all expenses.
+
+        Args:
+            data: Dictionary mapping dates to expense lists
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM expenses")
+            self._insert_rows(
+                (date, item) for date, expenses in data.items() for item in expenses
+            )
+
+    def add_expense(self, expense: Expense) -> None:
+        """
+        Add a new expense.
+
+        Args:
+            expense: Expense to add
+        """
+        with self._lock, self._conn:
+            self._insert_rows([(expense.date, expense.to_dict())])
+
+    def add_many(self, expenses: List[Expense]) -> None:
+        """
+        Add several expenses in a single transaction.
+
+        Args:
+            expenses: Expenses to add
+        """
+        with self._lock, self._conn:
+            self._insert_rows((expense.date, expense.to_dict()) for expense in expenses)
+
+    def get_expenses_by_date(self, date: str) -> List[Dict]:
+        """
+        Get expenses for a specific date.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            List of expense dictionaries
+        """
+        return self.get_expenses_by_range(date, date).get(date, [])
+
+    def get_expenses_by_month(self, month: str) -> Dict[str, List[Dict]]:
+        """
+        Get expenses for a month.
+
+        Args:
+            month: Month in YYYY-MM format
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        return self.get_expenses_by_range(f"{month}-01", f"{month}-31")
+
+    def get_expenses_by_week(self) -> Dict[str, List[Dict]]:
+        """
+        Get expenses for the current week (last 7 days).
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        today = datetime.today()
+        start = (today + timedelta(days=-6)).strftime("%Y-%m-%d")
+        return self.get_expenses_by_range(start, today.strftime("%Y-%m-%d"))
+
+    def get_expenses_by_range(
+        self, start_date: str, end_date: str
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get expenses within a date range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary mapping dates to expense lists
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, expense, amount, uid FROM expenses "
+                "WHERE date BETWEEN ? AND ? ORDER BY date, id",
+                (start_date, end_date),
+            ).fetchall()
+        return self._group_by_date(rows)
+
+    def get_expenses_page(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        after: Optional[Tuple[str, Optional[str], int]] = None,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> List[Tuple[str, int, Dict]]:
+        """
+        Get a page of expenses in ``(date, index)`` order.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            after: Only return expenses positioned after this (date, expense ID, index)
+            limit: Maximum number of expenses to return
+            descending: Walk dates newest first (indices stay in order within a date)
+
+        Returns:
+            List of (date, index, expense dict) tuples
+        """
+        low, high = start_date or "", end_date or "9999-12-31"
+        keyset, params = "", [low, high]
+        order = "date DESC, id" if descending else "date, id"
+        after_date, first = (after[0], 0) if after is not None else ("", 0)
+        with self._lock:
+            if after is not None:
+                row_id, first = self._resume_row(after)
+                if descending:
+                    params[1] = min(high, after_date)
+                else:
+                    params[0] = max(low, after_date)
+                keyset = f" AND (date {'<' if descending else '>'} ? OR (date = ? AND id > ?))"
+                params += [after_date, after_date, row_id]
+            # Keyset seek on (date, id): only the rows of this page are visited
+            rows = self._conn.execute(
+                "SELECT date, expense, amount, uid FROM expenses "
+                f"WHERE date BETWEEN ? AND ?{keyset} ORDER BY {order} LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+        page: List[Tuple[str, int, Dict]] = []
+        index, current = first - 1, after_date
+        for date, expense, amount, uid in rows:
+            if date != current:
+                index, current = -1, date
+            index += 1
+            page.append((date, index, {"expense": expense, "amount": amount, "id": uid}))
+        return page
+
+    def _resume_row(self, after: Tuple[str, Optional[str], int]) -> Tuple[int, int]:
+        """
+        Resolve a cursor to the row id a page seeks past.
+
+        Args:
+            after: Cursor position (date, expense ID, index)
+
+        Returns:
+            Tuple of (row id to seek past, index of the next expense on the date)
+        """
+        date, expense_id, index = after
+        row = self._conn.execute(
+            "SELECT id FROM expenses WHERE uid = ? AND date = ?", (expense_id, date)
+        ).fetchone()
+        if row is not None:
+            position = self._conn.execute(
+                "SELECT COUNT(*) FROM expenses WHERE date = ? AND id <= ?", (date, row[0])
+            ).fetchone()[0]
+            return row[0], position
+        # The cursor's expense was deleted; the one after it moved into its slot
+        index = max(index, 0)
+        previous = self._find_row_id(date, index - 1)
+        if previous is None:
+            return (-1, 0) if index == 0 else (SQLITE_MAX_ROWID, index)
+        return previous, index
+
+    def update_expense(
+        self,
+        date: str,
+        index: int,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> None:
+        """
+        Update an expense by date and index.
+
+        Args:
+            date: Date of the expense
+            index: Index of the expense in the date's list
+            expense: New expense name (optional)
+            amount: New amount (optional)
+        """
+        with self._lock, self._conn:
+            row_id = self._find_row_id(date, index)
+            if row_id is None:
+                raise ValueError(f"Expense not found at date {date}, index {index}")
+
+            if expense is not None:
+                name = expense.strip().title()
+                self._conn.execute(
+                    "UPDATE expenses SET expense = ?, name_key = ? WHERE id = ?",
+                    (name, self._normalize_name(name), row_id),
+                )
+            if amount is not None:
+                self._conn.execute(
+                    "UPDATE expenses SET amount = ? WHERE id = ?", (float(amount), row_id)
+                )
+
+    def delete_expense(self, date: str, index: int) -> None:
+        """
+        Delete an expense by date and index.
+
+        Args:
+            date: Date of the expense
+            index: Index of the expense in the date's list
+        """
+        with self._lock, self._conn:
+            row_id = self._find_row_id(date, index)
+            if row_id is None:
+                raise ValueError(f"Expense not found at date {date}, index {index}")
+            self._conn.execute("DELETE FROM expenses WHERE id = ?", (row_id,))
+
+    def delete_all(self) -> None:
+        """Delete all expenses."""
+        self.save_all({})
+
+    def find_expense_by_name(
+        self, date: str, expense_name: str
+    ) -> Optional[int]:
+        """
+        Find expense index by name (case-insensitive).
+
+        Args:
+            date: Date of the expense
+            expense_name: Name of the expense
+
+        Returns:
+            Index of the expense, or None if not found
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM expenses WHERE name_key = ? AND date = ? ORDER BY id LIMIT 1",
+                (self._normalize_name(expense_name), date),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM expenses WHERE date = ? AND id < ?",
+                (date, row[0]),
+            ).fetchone()[0]
+
+    def get_version(self) -> List[Any]:
+        """
+        Get the ledger version, which every committed row change advances.
+
+        Returns:
+            JSON-compatible stamp holding the monotonically increasing version
+        """
+        with self._lock:
+            return [self._conn.execute("SELECT version FROM ledger_version").fetchone()[0]]
+
+    def get_aggregates(self) -> LedgerAggregates:
+        """
+        Get materialized daily, monthly and per-name totals.
+
+        Returns:
+            LedgerAggregates view
+        """
+        with self._lock:
+            # data_version tracks other connections' commits, total_changes our own
+            version = (
+                self._conn.execute("PRAGMA data_version").fetchone()[0],
+                self._conn.total_changes,
+            )
+            if self._aggregates is not None and self._aggregates[0] == version:
+                return self._aggregates[1]
+
+            day_rows = self._conn.execute(
+                "SELECT date, total, count FROM day_totals ORDER BY date"
+            ).fetchall()
+            name_rows = self._conn.execute(
+                "SELECT month, expense, total, count FROM name_totals ORDER BY month"
+            ).fetchall()
+
+        days = {date: [total, count] for date, total, count in day_rows}
+        months: Dict[str, List[float]] = {}
+        for date, total, count in day_rows:
+            bucket = months.setdefault(date[:7], [0.0, 0, 0])
+            bucket[0] += total
+            bucket[1] += count
+            bucket[2] += 1
+        names: Dict[str, Dict[str, List[float]]] = {}
+        for month, expense, total, count in name_rows:
+            names.setdefault(month, {})[expense] = [total, count]
+
+        aggregates = LedgerAggregates(days, months, names, month_day_names=self._month_day_names)
+        self._aggregates = (version, aggregates)
+        return aggregates
+
+    def _month_day_names(self, month: str) -> Dict[str, Dict[str, List[float]]]:
+        """
+        Read one month of the per-day expense-name totals.
+
+        Args:
+            month: Month (YYYY-MM)
+
+        Returns:
+            Date -> expense name -> [total, count]
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, expense, total, count FROM day_name_totals "
+                "WHERE date BETWEEN ? AND ? ORDER BY date",
+                (f"{month}-01", f"{month}-31"),
+            ).fetchall()
+        day_names: Dict[str, Dict[str, List[float]]] = {}
+        for date, expense, total, count in rows:
+            day_names.setdefault(date, {})[expense] = [total, count]
+        return day_names
+
+    def rebuild_aggregates(self) -> LedgerAggregates:
+        """
+        Recompute the aggregate tables from a full scan of the expenses table.
+
+        Returns:
+            LedgerAggregates view
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM day_totals")
+            self._conn.execute("DELETE FROM name_totals")
+            self._conn.execute("DELETE FROM day_name_totals")
+            self._conn.execute(
+                "INSERT INTO day_totals "
+                "SELECT date, SUM(amount), COUNT(*) FROM expenses GROUP BY date"
+            )
+            self._conn.execute(
+                "INSERT INTO name_totals "
+                "SELECT substr(date, 1, 7), expense, SUM(amount), COUNT(*) "
+                "FROM expenses GROUP BY 1, 2"
+            )
+            self._conn.execute(
+                "INSERT INTO day_name_totals "
+                "SELECT date, expense, SUM(amount), COUNT(*) FROM expenses GROUP BY 1, 2"
+            )
+        return self.get_aggregates()
+
+    def find_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Find an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index), or None if not found
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, date FROM expenses WHERE uid = ?", (expense_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            row_id, date = row
+            index = self._conn.execute(
+                "SELECT COUNT(*) FROM expenses WHERE date = ? AND id < ?",
+                (date, row_id),
+            ).fetchone()[0]
+        return date, index
+
+    def get_expense_by_id(self, expense_id: str) -> Optional[Dict]:
+        """
+        Get an expense by its stable ID.
+
+        The lookup and the read happen under one lock, so a concurrent
+        delete cannot shift the expense's index in between.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Expense dictionary including its date and index, or None if not found
+        """
+        with self._lock:
+            location = self.find_expense_by_id(expense_id)
+            if location is None:
+                return None
+            date, index = location
+            return {**self.get_expenses_by_date(date)[index], "date": date, "index": index}
+
+    def update_expense_by_id(
+        self,
+        expense_id: str,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Update an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+            expense: New expense name (optional)
+            amount: New amount (optional)
+
+        Returns:
+            Tuple of (date, index) of the updated expense, or None if not found
+        """
+        with self._lock:
+            location = self.find_expense_by_id(expense_id)
+            if location is not None:
+                self.update_expense(*location, expense, amount)
+        return location
+
+    def delete_expense_by_id(self, expense_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Delete an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Tuple of (date, index) the expense was deleted from, or None if not found
+        """
+        with self._lock:
+            location = self.find_expense_by_id(expense_id)
+            if location is not None:
+                self.delete_expense(*location)
+        return location
@@ -5,6 +5,7 @@ from typing import Optional
 from ..config import get_settings
 from ..domain.user import User
 from .file_manager import FileManager
+from .locking import lock_for, read_locked, write_locked
 
 
 class UserRepository:
@@ -19,7 +20,9 @@ class UserRepository:
         """
         self.settings = get_settings()
         self.file_manager = file_manager or FileManager(self.settings)
+        self.lock = lock_for(self.settings.user_file)
 
+    @read_locked
     def load(self) -> Optional[User]:
         """
         Load user data from file.
@@ -30,6 +33,7 @@ class UserRepository:
         data = self.file_manager.load_json(self.settings.user_file, default={})
         return User.from_dict(data)
 
+    @write_locked
     def save(self, user: User) -> None:
         """
         Save user data to file.
@@ -39,10 +43,12 @@ class UserRepository:
         """
         self.file_manager.save_json(self.settings.user_file, user.to_dict())
 
+    @write_locked
     def delete(self) -> None:
         """Delete user data."""
         self.file_manager.save_json(self.settings.user_file, {})
 
+    @read_locked
     def exists(self) -> bool:
         """Check if user exists."""
         user = self.load()
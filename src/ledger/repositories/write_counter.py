@@ -0,0 +1,54 @@
+"""Monotonic write counter for file-backed ledgers."""
+
+import os
+from pathlib import Path
+
+
+class WriteCounter:
+    """
+    Count of ledger writes stored as a single integer in a small file.
+
+    File stamps (mtime, size, inode) can repeat when two writes land within
+    the filesystem's timestamp resolution and leave the file the same size,
+    so they cannot tell two versions apart on their own. The counter is
+    bumped after every write, like SQLite's ``ledger_version`` table, and is
+    read straight from disk so other processes' writes are seen.
+    """
+
+    def __init__(self, file_path: Path):
+        """
+        Initialize write counter.
+
+        Args:
+            file_path: Path to the counter file
+        """
+        self.file_path = file_path
+
+    def value(self) -> int:
+        """
+        Read the current count.
+
+        Returns:
+            Number of writes recorded, 0 if none
+        """
+        try:
+            return int(self.file_path.read_text() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def bump(self) -> int:
+        """
+        Record a write.
+
+        The new count is written to a temporary file and renamed into place,
+        so readers never see a partially written value.
+
+        Returns:
+            The new count
+        """
+        value = self.value() + 1
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.file_path.with_name(self.file_path.name + ".tmp")
+        temp_file.write_text(str(value))
+        os.replace(temp_file, self.file_path)
+        return value
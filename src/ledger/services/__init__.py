@@ -1,16 +1,31 @@
 """Service layer for business logic."""
 
-from .expense_service import ExpenseService
-from .category_service import CategoryService
-from .budget_service import BudgetService
-from .analytics_service import AnalyticsService
-from .user_service import UserService
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "ExpenseService",
-    "CategoryService",
-    "BudgetService",
-    "AnalyticsService",
-    "UserService",
-]
+if TYPE_CHECKING:
+    from .expense_service import ExpenseService
+    from .category_service import CategoryService
+    from .budget_service import BudgetService
+    from .analytics_service import AnalyticsService
+    from .user_service import UserService
 
+# Services are imported on first access so that importing one service does
+# not pull in the others (and their dependencies).
+_SERVICE_MODULES = {
+    "ExpenseService": ".expense_service",
+    "CategoryService": ".category_service",
+    "BudgetService": ".budget_service",
+    "AnalyticsService": ".analytics_service",
+    "UserService": ".user_service",
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name: str):
+    """Import a service class on first access."""
+    module = _SERVICE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -1,15 +1,49 @@
 """Service for analytics and statistics."""
 
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
-import pandas as pd
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Optional
+from datetime import date as Date, datetime
 
-from ..repositories import ExpenseRepository
+from ..config import get_settings
+from ..repositories import ExpenseRepository, create_expense_repository
+from ..repositories.aggregate_store import LedgerAggregates, apply_rows
+from .cache import ResultCache
 from .category_service import CategoryService
+from .sketches import MonthSketches, SketchIndex
+from .topk import TOP_DIMENSIONS, top_k, top_k_buckets
+
+
+GRANULARITIES = ("day", "week", "month")
+
+
+def period_key(date: str, granularity: str) -> str:
+    """
+    Map a date to its bucket label at a granularity.
+
+    Args:
+        date: Date (YYYY-MM-DD)
+        granularity: "day", "week" (ISO week, YYYY-Www) or "month" (YYYY-MM)
+
+    Returns:
+        Bucket label
+    """
+    if granularity == "day":
+        return date
+    if granularity == "month":
+        return date[:7]
+    year, week, _ = datetime.strptime(date, "%Y-%m-%d").isocalendar()
+    return f"{year}-W{week:02d}"
 
 
 class AnalyticsService:
-    """Service for analytics and statistics calculations."""
+    """
+    Service for analytics and statistics calculations.
+
+    Ledger-wide and monthly statistics are computed from the repository's
+    materialized aggregates when ``LEDGER_AGGREGATES`` is enabled (the
+    default), and from a full scan of the expenses otherwise. Results are
+    memoized in a ``ResultCache`` keyed by the ledger and categories
+    versions, so any write to either invalidates them.
+    """
 
     def __init__(
         self,
@@ -23,8 +57,34 @@ class AnalyticsService:
             expense_repository: ExpenseRepository instance
             category_service: CategoryService instance
         """
-        self.expense_repo = expense_repository or ExpenseRepository()
+        self.expense_repo = expense_repository or create_expense_repository()
         self.category_service = category_service or CategoryService()
+        self.sketches = SketchIndex(self.expense_repo, self.category_service)
+        settings = get_settings()
+        self._results = ResultCache(settings.result_cache_size, settings.result_cache_ttl)
+
+    def get_version(self) -> List[Any]:
+        """
+        Get a version stamp of everything analytics results depend on.
+
+        Returns:
+            JSON-compatible stamp of the ledger and the categories
+        """
+        return [self.expense_repo.get_version(), self.category_service.get_version()]
+
+    def _cached(self, key: Hashable, compute: Callable[[], Dict]) -> Dict:
+        """Memoize a result against the data version, today's date and the read path."""
+        version = [*self.get_version(), Date.today().isoformat(), self._use_aggregates()]
+        return self._results.get_or_compute(key, version, compute)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, expirations and invalidations
+        """
+        return self._results.stats()
 
     def calculate_summary_stats(
         self, expenses_data: Dict[str, List[Dict]], period_description: str
@@ -60,127 +120,372 @@ class AnalyticsService:
             "days_with_expenses": days_with_expenses,
         }
 
-    def calculate_comprehensive_stats(self) -> Dict:
+    def _use_aggregates(self) -> bool:
+        """Whether statistics can be read from materialized aggregates."""
+        return get_settings().aggregates_enabled and hasattr(
+            self.expense_repo, "get_aggregates"
+        )
+
+    def _category_totals(self, name_totals: Dict[str, Tuple[float, int]]) -> Dict[str, float]:
+        """Roll per-name totals up into per-category totals."""
+        return {
+            category: total
+            for category, (total, _) in self._category_buckets(name_totals).items()
+        }
+
+    def _category_buckets(
+        self, name_totals: Dict[str, Tuple[float, int]]
+    ) -> Dict[str, Tuple[float, int]]:
+        """Roll per-name (total, count) up into per-category (total, count)."""
+        buckets: Dict[str, Tuple[float, int]] = {}
+        categories = self.category_service.categorize_many(list(name_totals))
+        for category, (amount, count) in zip(categories, name_totals.values()):
+            total, prev_count = buckets.get(category, (0, 0))
+            buckets[category] = (total + amount, prev_count + count)
+        return buckets
+
+    def _range_aggregates(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> LedgerAggregates:
         """
-        Calculate comprehensive statistics for all expenses.
+        Get day and name buckets for a date range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
 
         Returns:
-            Dictionary with comprehensive statistics
+            LedgerAggregates view covering only the range
         """
-        data = self.expense_repo.load_all()
+        if self._use_aggregates():
+            return self.expense_repo.get_aggregates().restrict(start_date, end_date)
+
+        doc: Dict = {"days": {}, "months": {}, "names": {}, "day_names": {}}
+        apply_rows(
+            doc,
+            (
+                (date, item)
+                for date, items in self.expense_repo.load_all().items()
+                if (start_date is None or date >= start_date)
+                and (end_date is None or date <= end_date)
+                for item in items
+            ),
+            1,
+        )
+        return LedgerAggregates(doc["days"], doc["months"], doc["names"], doc["day_names"])
+
+    def get_top(
+        self,
+        by: str = "amount",
+        dimension: str = "name",
+        k: int = 10,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict:
+        """
+        Get the top k expense names, categories or days.
 
-        if not data:
-            return self._empty_stats()
+        Args:
+            by: Rank by "amount" (total spent) or "count" (transactions)
+            dimension: "name", "category" or "day"
+            k: Number of entries to return
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
 
-        # Flatten data for analysis
-        records = []
-        category_totals: Dict[str, float] = {}
-        daily_totals: Dict[str, float] = {}
-        monthly_totals: Dict[str, float] = {}
-        expense_counts: Dict[str, int] = {}
+        Returns:
+            Dictionary with the ranking parameters and the ranked items
 
-        for date, expenses in data.items():
-            daily_total = 0.0
-            month = date[:7]  # Extract YYYY-MM
+        Raises:
+            ValueError: If ``by`` or ``dimension`` is unknown
+        """
+        return self._cached(
+            ("top", by, dimension, k, start_date, end_date),
+            lambda: self._top(by, dimension, k, start_date, end_date),
+        )
 
-            for item in expenses:
-                amount = float(item["amount"])
-                expense_name = item["expense"]
+    def _top(
+        self,
+        by: str,
+        dimension: str,
+        k: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> Dict:
+        """Compute ``get_top`` without the result cache."""
+        if dimension not in TOP_DIMENSIONS:
+            raise ValueError(
+                f"Unknown dimension: {dimension}. Use one of {', '.join(TOP_DIMENSIONS)}"
+            )
+
+        aggregates = self._range_aggregates(start_date, end_date)
+        if dimension == "day":
+            buckets = aggregates.days
+        elif dimension == "category":
+            buckets = self._category_buckets(aggregates.name_totals())
+        else:
+            buckets = aggregates.name_totals()
+
+        label = "date" if dimension == "day" else "name"
+        return {
+            "by": by,
+            "dimension": dimension,
+            "k": k,
+            "items": [
+                {label: key, by: round(value, 2) if by == "amount" else int(value)}
+                for key, value in top_k_buckets(buckets, k, by)
+            ],
+        }
 
-                records.append(
-                    {
-                        "date": date,
-                        "expense": expense_name,
-                        "amount": amount,
-                    }
-                )
+    def calculate_comprehensive_stats(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        granularity: str = "month",
+        approximate: bool = False,
+    ) -> Dict:
+        """
+        Calculate comprehensive statistics for expenses in a date range.
 
-                # Track totals
-                daily_total += amount
-                monthly_totals[month] = monthly_totals.get(month, 0) + amount
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            granularity: Bucket size of ``spending_by_period``: day, week or month
+            approximate: Add sketch-based amount quantiles (overall and per
+                category), a distinct expense-name estimate and frequent names
 
-                # Track expense frequency
-                expense_counts[expense_name] = expense_counts.get(expense_name, 0) + 1
+        Returns:
+            Dictionary with comprehensive statistics
 
-                # Track category totals
-                category = self.category_service.categorize_expense(expense_name)
-                category_totals[category] = category_totals.get(category, 0) + amount
+        Raises:
+            ValueError: If the range is inverted or the granularity is unknown
+        """
+        return self._cached(
+            ("stats", start_date, end_date, granularity, approximate),
+            lambda: self._comprehensive_stats(start_date, end_date, granularity, approximate),
+        )
 
-            daily_totals[date] = daily_total
+    def _comprehensive_stats(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        granularity: str,
+        approximate: bool,
+    ) -> Dict:
+        """Compute ``calculate_comprehensive_stats`` without the result cache."""
+        if granularity not in GRANULARITIES:
+            raise ValueError(
+                f"Unknown granularity: {granularity}. Use one of {', '.join(GRANULARITIES)}"
+            )
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError("Start date cannot be after end date")
+
+        if self._use_aggregates():
+            aggregates = self.expense_repo.get_aggregates()
+            stats = self._comprehensive_stats_from_aggregates(
+                aggregates.restrict(start_date, end_date), granularity
+            )
+            if approximate:
+                sketches = self.sketches.for_range(aggregates, start_date, end_date)
+                stats["approximate"] = sketches.summary()
+            return stats
+
+        stats = self._comprehensive_stats_from_scan(start_date, end_date, granularity)
+        if approximate:
+            stats["approximate"] = self._sketch_scan(start_date, end_date).summary()
+        return stats
+
+    def _sketch_scan(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> MonthSketches:
+        """Sketch a date range straight from the expenses (no persisted sketches)."""
+        rows = (
+            (item["expense"], float(item["amount"]))
+            for date, items in self.expense_repo.load_all().items()
+            if (start_date is None or date >= start_date) and (end_date is None or date <= end_date)
+            for item in items
+        )
+        return MonthSketches.build(rows, self.category_service.categorize_many)
+
+    def _comprehensive_stats_from_aggregates(
+        self, aggregates: LedgerAggregates, granularity: str = "month"
+    ) -> Dict:
+        """
+        Calculate comprehensive statistics from materialized aggregates.
 
-        # Calculate derived stats
-        df = pd.DataFrame(records)
-        if len(df) == 0:
-            return self._empty_stats()
+        Runs in time proportional to the number of day and name buckets.
 
-        df["date"] = pd.to_datetime(df["date"])
+        Args:
+            aggregates: LedgerAggregates view, already restricted to the range
+            granularity: Bucket size of ``spending_by_period``
 
-        total_spent = df["amount"].sum()
-        total_days = (df["date"].max() - df["date"].min()).days + 1
-        avg_daily = total_spent / total_days if total_days > 0 else 0
+        Returns:
+            Dictionary with comprehensive statistics
+        """
+        return self._build_comprehensive_stats(
+            aggregates.daily_totals(),
+            aggregates.monthly_totals(),
+            aggregates.name_totals(),
+            aggregates.total,
+            aggregates.transaction_count,
+            granularity,
+        )
+
+    def _comprehensive_stats_from_scan(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        granularity: str = "month",
+    ) -> Dict:
+        """
+        Calculate comprehensive statistics by scanning every expense.
 
-        # Most expensive day
-        most_expensive_day = max(daily_totals.items(), key=lambda x: x[1]) if daily_totals else (None, 0)
+        The ledger is loaded once into typed columns (amounts as a float64
+        array, names factorized to integer codes). Daily totals are segment
+        sums over the date-grouped amounts, per-name totals and counts are
+        bincounts over the name codes, and categories are assigned once per
+        distinct name.
 
-        # Top category
-        top_category = max(category_totals.items(), key=lambda x: x[1]) if category_totals else (None, 0)
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            granularity: Bucket size of ``spending_by_period``
 
-        # Most frequent expense
-        most_frequent_expense = max(expense_counts.items(), key=lambda x: x[1]) if expense_counts else (None, 0)
+        Returns:
+            Dictionary with comprehensive statistics
+        """
+        # Deferred: only the scan path needs numpy/pandas
+        import numpy as np
+        import pandas as pd
 
-        # Top expenses by total amount
-        expense_totals = df.groupby("expense")["amount"].sum().sort_values(ascending=False)
-        top_expenses = [
-            {"name": name, "total_amount": round(amount, 2)}
-            for name, amount in expense_totals.head(5).items()
+        data = self.expense_repo.load_all()
+        dates = [
+            date
+            for date, expenses in data.items()
+            if expenses
+            and (start_date is None or date >= start_date)
+            and (end_date is None or date <= end_date)
         ]
+        if not dates:
+            return self._empty_stats(granularity)
+
+        sizes = np.fromiter((len(data[date]) for date in dates), dtype=np.int64, count=len(dates))
+        rows = int(sizes.sum())
+        amounts = np.fromiter(
+            (float(item["amount"]) for date in dates for item in data[date]),
+            dtype=np.float64,
+            count=rows,
+        )
+        codes, names = pd.factorize(
+            pd.Series([item["expense"] for date in dates for item in data[date]], dtype=object)
+        )
+
+        starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        daily = pd.Series(np.add.reduceat(amounts, starts), index=dates)
+        monthly = daily.groupby([date[:7] for date in dates], sort=False).sum()
+        name_sums = np.bincount(codes, weights=amounts, minlength=len(names))
+        name_counts = np.bincount(codes, minlength=len(names))
+
+        return self._build_comprehensive_stats(
+            dict(zip(daily.index, daily.tolist())),
+            dict(zip(monthly.index, monthly.tolist())),
+            {
+                name: (float(total), int(count))
+                for name, total, count in zip(names, name_sums, name_counts)
+            },
+            float(amounts.sum()),
+            rows,
+            granularity,
+        )
 
-        # Top categories
-        top_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_categories_list = [
-            {"name": name, "total_amount": round(amount, 2)}
-            for name, amount in top_categories
-        ]
+    def _build_comprehensive_stats(
+        self,
+        daily_totals: Dict[str, float],
+        monthly_totals: Dict[str, float],
+        name_totals: Dict[str, Tuple[float, int]],
+        total_spent: float,
+        transaction_count: int,
+        granularity: str = "month",
+    ) -> Dict:
+        """
+        Assemble the comprehensive statistics from per-bucket totals.
+
+        Args:
+            daily_totals: Date -> total spent
+            monthly_totals: Month -> total spent
+            name_totals: Expense name -> (total, count)
+            total_spent: Total amount spent
+            transaction_count: Number of expenses
+            granularity: Bucket size of ``spending_by_period``
+
+        Returns:
+            Dictionary with comprehensive statistics
+        """
+        if not daily_totals:
+            return self._empty_stats(granularity)
+
+        period_totals: Dict[str, float] = {}
+        for date in sorted(daily_totals):
+            key = period_key(date, granularity)
+            period_totals[key] = period_totals.get(key, 0) + daily_totals[date]
+
+        category_totals = self._category_totals(name_totals)
+
+        first_day = datetime.strptime(min(daily_totals), "%Y-%m-%d")
+        last_day = datetime.strptime(max(daily_totals), "%Y-%m-%d")
+        total_days = (last_day - first_day).days + 1
+        avg_daily = total_spent / total_days if total_days > 0 else 0
+
+        most_expensive_day = max(daily_totals.items(), key=lambda x: x[1])
+        top_category = max(category_totals.items(), key=lambda x: x[1])
+        most_frequent_expense = max(
+            ((name, count) for name, (_, count) in name_totals.items()), key=lambda x: x[1]
+        )
+
+        # Largest first, ties broken by name
+        top_expenses = top_k_buckets(name_totals, 5)
+        top_categories = top_k(category_totals.items(), 5)
 
-        # Current month stats
         current_month = datetime.now().strftime("%Y-%m")
-        current_month_spent = monthly_totals.get(current_month, 0)
 
         return {
             "total_spent": round(total_spent, 2),
             "daily_average": round(avg_daily, 2),
-            "transaction_count": len(df),
+            "transaction_count": transaction_count,
             "days_tracked": total_days,
             "most_spent_category": {
                 "name": top_category[0],
                 "amount": round(top_category[1], 2),
-            }
-            if top_category[0]
-            else None,
+            },
             "most_frequent_expense": {
                 "name": most_frequent_expense[0],
                 "count": most_frequent_expense[1],
-            }
-            if most_frequent_expense[0]
-            else None,
+            },
             "most_expensive_day": {
                 "date": most_expensive_day[0],
                 "amount": round(most_expensive_day[1], 2),
-            }
-            if most_expensive_day[0]
-            else None,
-            "top_expenses": top_expenses,
-            "top_categories": top_categories_list,
+            },
+            "top_expenses": [
+                {"name": name, "total_amount": round(amount, 2)}
+                for name, amount in top_expenses
+            ],
+            "top_categories": [
+                {"name": name, "total_amount": round(amount, 2)}
+                for name, amount in top_categories
+            ],
             "category_breakdown": {
                 name: round(amount, 2) for name, amount in category_totals.items()
             },
             "monthly_spending": {
                 month: round(amount, 2) for month, amount in monthly_totals.items()
             },
-            "current_month_spent": round(current_month_spent, 2),
+            "current_month_spent": round(monthly_totals.get(current_month, 0), 2),
+            "granularity": granularity,
+            "spending_by_period": {
+                period: round(amount, 2) for period, amount in period_totals.items()
+            },
         }
 
-    def _empty_stats(self) -> Dict:
+    def _empty_stats(self, granularity: str = "month") -> Dict:
         """Return empty statistics structure."""
         return {
             "total_spent": 0,
@@ -195,6 +500,8 @@ class AnalyticsService:
             "category_breakdown": {},
             "monthly_spending": {},
             "current_month_spent": 0,
+            "granularity": granularity,
+            "spending_by_period": {},
         }
 
     def get_monthly_stats(self, month: str) -> Dict:
@@ -207,10 +514,18 @@ class AnalyticsService:
         Returns:
             Dictionary with monthly statistics
         """
-        data = self.expense_repo.load_all()
-        month_data = {date: expenses for date, expenses in data.items() if date.startswith(month)}
-
-        if not month_data:
+        return self._cached(("monthly", month), lambda: self._monthly_stats(month))
+
+    def _monthly_stats(self, month: str) -> Dict:
+        """Compute ``get_monthly_stats`` without the result cache."""
+        if self._use_aggregates():
+            aggregates = self.expense_repo.get_aggregates()
+            total_spent, transaction_count, days_tracked = aggregates.month_bucket(month)
+            name_totals = aggregates.name_totals(month)
+        else:
+            total_spent, transaction_count, days_tracked, name_totals = self._scan_month(month)
+
+        if not transaction_count:
             return {
                 "month": month,
                 "total_spent": 0,
@@ -221,31 +536,11 @@ class AnalyticsService:
                 "top_expenses": [],
             }
 
-        total_spent = 0.0
-        category_totals: Dict[str, float] = {}
-        expense_totals: Dict[str, float] = {}
-        transaction_count = 0
-
-        for date, expenses in month_data.items():
-            for expense in expenses:
-                amount = float(expense["amount"])
-                expense_name = expense["expense"]
-
-                total_spent += amount
-                transaction_count += 1
-
-                # Track category totals
-                category = self.category_service.categorize_expense(expense_name)
-                category_totals[category] = category_totals.get(category, 0) + amount
-
-                # Track expense totals
-                expense_totals[expense_name] = expense_totals.get(expense_name, 0) + amount
-
-        days_tracked = len(month_data)
+        category_totals = self._category_totals(name_totals)
         daily_average = total_spent / days_tracked if days_tracked > 0 else 0
 
         # Top expenses
-        top_expenses = sorted(expense_totals.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_expenses = top_k_buckets(name_totals, 10)
 
         return {
             "month": month,
@@ -259,3 +554,27 @@ class AnalyticsService:
             ],
         }
 
+    def _scan_month(self, month: str) -> Tuple[float, int, int, Dict[str, Tuple[float, int]]]:
+        """
+        Compute month totals by scanning the month's expenses.
+
+        Args:
+            month: Month in YYYY-MM format
+
+        Returns:
+            Tuple of (total, transaction count, days tracked, per-name totals)
+        """
+        month_data = self.expense_repo.get_expenses_by_month(month)
+        total_spent = 0.0
+        transaction_count = 0
+        name_totals: Dict[str, Tuple[float, int]] = {}
+
+        for expenses in month_data.values():
+            for expense in expenses:
+                amount = float(expense["amount"])
+                total, count = name_totals.get(expense["expense"], (0.0, 0))
+                name_totals[expense["expense"]] = (total + amount, count + 1)
+                total_spent += amount
+                transaction_count += 1
+
+        return total_spent, transaction_count, len(month_data), name_totals
@@ -0,0 +1,78 @@
+"""Awaitable access to the synchronous services."""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from ..config import get_settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@lru_cache()
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared, bounded pool that service calls run on.
+
+    Sized by ``LEDGER_API_WORKERS`` (default 4). Calls run concurrently:
+    the repositories hold a readers-writer lock per store, so reads proceed
+    in parallel while each read-modify-write has its store to itself.
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    return ThreadPoolExecutor(
+        max_workers=get_settings().api_workers, thread_name_prefix="ledger-io"
+    )
+
+
+class AsyncFacade(Generic[T]):
+    """
+    Awaitable view of a service.
+
+    Every method of the wrapped service becomes a coroutine function that
+    runs the original call on a bounded thread pool, so disk I/O, parsing
+    and pandas work never block the event loop. Plain attributes are
+    passed through unchanged.
+    """
+
+    def __init__(self, service: T, executor: Optional[Executor] = None):
+        """
+        Initialize facade.
+
+        Args:
+            service: Service instance to wrap
+            executor: Executor to run calls on. Uses the shared pool if None.
+        """
+        self.service = service
+        self._executor = executor or get_executor()
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Run any blocking callable on the facade's executor.
+
+        Args:
+            func: Callable to run
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        """Wrap service methods as coroutine functions."""
+        attr = getattr(self.service, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(attr, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
@@ -1,14 +1,23 @@
 """Service for budget business logic."""
 
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
 from datetime import datetime
 
+from ..config import get_settings
 from ..domain.budget import Budget, MonthlyBudget
-from ..repositories import BudgetRepository, ExpenseRepository
+from ..repositories import BudgetRepository, ExpenseRepository, create_expense_repository
+from .cache import ResultCache
 
 
 class BudgetService:
-    """Service for budget operations."""
+    """
+    Service for budget operations.
+
+    Budget status and history are memoized in a ``ResultCache`` keyed by
+    the budget file and ledger versions, so any write to either invalidates
+    them. Writes hold the budget repository's write lock from load to save,
+    so concurrent updates cannot overwrite each other.
+    """
 
     def __init__(
         self,
@@ -23,7 +32,36 @@ class BudgetService:
             expense_repository: ExpenseRepository instance
         """
         self.budget_repo = budget_repository or BudgetRepository()
-        self.expense_repo = expense_repository or ExpenseRepository()
+        self.expense_repo = expense_repository or create_expense_repository()
+        settings = get_settings()
+        self._results = ResultCache(settings.result_cache_size, settings.result_cache_ttl)
+
+    def get_version(self) -> List[Any]:
+        """
+        Get a version stamp of everything budget results depend on.
+
+        Returns:
+            JSON-compatible stamp of the budget file and the ledger
+        """
+        return [self.budget_repo.get_version(), self.expense_repo.get_version()]
+
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Memoize a result against the data version, current month and read path."""
+        version = [
+            *self.get_version(),
+            self.get_current_month(),
+            get_settings().aggregates_enabled,
+        ]
+        return self._results.get_or_compute(key, version, compute)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, expirations and invalidations
+        """
+        return self._results.stats()
 
     def get_current_month(self) -> str:
         """Get current month in YYYY-MM format."""
@@ -42,22 +80,57 @@ class BudgetService:
         if month is None:
             month = self.get_current_month()
 
-        expenses_dict = self.expense_repo.load_all()
+        if get_settings().aggregates_enabled and hasattr(self.expense_repo, "get_aggregates"):
+            return self.expense_repo.get_aggregates().month_total(month)
+
+        expenses_dict = self.expense_repo.get_expenses_by_month(month)
         total = 0.0
 
-        for date_str, expenses in expenses_dict.items():
-            if date_str.startswith(month):
-                for expense in expenses:
-                    total += float(expense["amount"])
+        for expenses in expenses_dict.values():
+            for expense in expenses:
+                total += float(expense["amount"])
 
         return total
 
-    def reset_monthly_budget_if_needed(self) -> Budget:
+    def get_spending_by_month(self, months: Iterable[str]) -> Dict[str, float]:
         """
-        Check and reset budget for new month if auto-reset is enabled.
+        Calculate total spending for several months in one pass.
+
+        Reads the monthly aggregates when they are enabled; otherwise scans
+        the ledger once over the span of the requested months.
+
+        Args:
+            months: Months in YYYY-MM format
 
         Returns:
-            Updated Budget instance
+            Dictionary mapping each requested month to its total spending
+        """
+        totals = {month: 0.0 for month in months}
+        if not totals:
+            return totals
+
+        if get_settings().aggregates_enabled and hasattr(self.expense_repo, "get_aggregates"):
+            aggregates = self.expense_repo.get_aggregates()
+            return {month: aggregates.month_total(month) for month in totals}
+
+        expenses_dict = self.expense_repo.get_expenses_by_range(
+            f"{min(totals)}-01", f"{max(totals)}-31"
+        )
+        for date, expenses in expenses_dict.items():
+            month = date[:7]
+            if month in totals:
+                totals[month] += sum(float(expense["amount"]) for expense in expenses)
+        return totals
+
+    def _load_budget(self) -> Budget:
+        """
+        Load the budget and roll it over to the current month in memory.
+
+        A rollover marks the budget dirty; nothing is written here. Reads use
+        the rolled-over budget as is and the next budget write persists it.
+
+        Returns:
+            Budget instance
         """
         budget = self.budget_repo.load()
         current_month = self.get_current_month()
@@ -76,10 +149,24 @@ class BudgetService:
                 budget.monthly_budgets[current_month].reset_from_previous = True
 
             budget.current_month = current_month
-            self.budget_repo.save(budget)
+            budget.dirty = True
 
         return budget
 
+    def reset_monthly_budget_if_needed(self) -> Budget:
+        """
+        Check and reset budget for new month if auto-reset is enabled.
+
+        The budget file is written only when a rollover actually happened.
+
+        Returns:
+            Updated Budget instance
+        """
+        with self.budget_repo.lock.write():
+            budget = self._load_budget()
+            self.budget_repo.save_if_dirty(budget)
+        return budget
+
     def set_monthly_budget(self, amount: float, month: Optional[str] = None) -> MonthlyBudget:
         """
         Set budget for a month.
@@ -94,64 +181,83 @@ class BudgetService:
         if amount < 0:
             raise ValueError("Budget amount must be positive")
 
-        budget = self.reset_monthly_budget_if_needed()
         if month is None:
             month = self.get_current_month()
 
-        # Calculate current spending
-        current_spending = self.get_monthly_spending(month)
-
-        # Set budget
-        monthly_budget = budget.set_monthly_budget(month, amount)
-        monthly_budget.spent = current_spending
-        budget.monthly_budgets[month] = monthly_budget
-        self.budget_repo.save(budget)
+        with self.budget_repo.lock.write():
+            budget = self._load_budget()
+            monthly_budget = budget.set_monthly_budget(month, amount)
+            self.budget_repo.save(budget)
 
+        # Spending is derived from the ledger, never taken from the file
+        monthly_budget.spent = self.get_monthly_spending(month)
         return monthly_budget
 
     def get_budget_status(self, month: Optional[str] = None) -> MonthlyBudget:
         """
         Get budget status for a month.
 
+        Spending is computed at read time and the budget file is never
+        written: a due monthly rollover is applied in memory, and a month
+        without a budget gets a zero-amount status that is not stored.
+
         Args:
             month: Month in YYYY-MM format. Defaults to current month.
 
         Returns:
-            MonthlyBudget instance with updated spending
+            MonthlyBudget instance with updated spending (must not be mutated)
         """
-        budget = self.reset_monthly_budget_if_needed()
+        return self._cached(("status", month), lambda: self._budget_status(month))
+
+    def _budget_status(self, month: Optional[str]) -> MonthlyBudget:
+        """Compute ``get_budget_status`` without the result cache."""
+        budget = self._load_budget()
         if month is None:
             month = self.get_current_month()
 
-        # Get or create monthly budget
         monthly_budget = budget.monthly_budgets.get(month)
         if monthly_budget is None:
             monthly_budget = MonthlyBudget(month=month, amount=0)
 
-        # Update spending
         monthly_budget.spent = self.get_monthly_spending(month)
-        budget.monthly_budgets[month] = monthly_budget
-        self.budget_repo.save(budget)
-
         return monthly_budget
 
-    def get_budget_history(self) -> List[MonthlyBudget]:
+    def get_budget_history(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[MonthlyBudget]:
         """
-        Get budget history for all months.
+        Get budget history, newest month first.
+
+        Spending is computed only for the months on the requested page, all
+        in one pass over the ledger.
+
+        Args:
+            limit: Maximum number of months to return. All months if None.
+            offset: Number of months to skip
 
         Returns:
-            List of MonthlyBudget instances, sorted by month (newest first)
+            List of MonthlyBudget instances, sorted by month (newest first;
+            must not be mutated)
+
+        Raises:
+            ValueError: If limit or offset is negative
         """
-        budget = self.budget_repo.load()
-        history = []
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Limit and offset must not be negative")
+        return self._cached(("history", limit, offset), lambda: self._budget_history(limit, offset))
 
-        for month, monthly_budget in budget.monthly_budgets.items():
-            # Update spending for each month
-            monthly_budget.spent = self.get_monthly_spending(month)
-            history.append(monthly_budget)
+    def _budget_history(self, limit: Optional[int], offset: int) -> List[MonthlyBudget]:
+        """Compute ``get_budget_history`` without the result cache."""
+        budget = self._load_budget()
+        months = sorted(budget.monthly_budgets, reverse=True)
+        page = months[offset:] if limit is None else months[offset:offset + limit]
 
-        # Sort by month (newest first)
-        history.sort(key=lambda b: b.month, reverse=True)
+        spending = self.get_spending_by_month(page)
+        history = []
+        for month in page:
+            monthly_budget = budget.monthly_budgets[month]
+            monthly_budget.spent = spending[month]
+            history.append(monthly_budget)
         return history
 
     def toggle_auto_reset(self, enabled: Optional[bool] = None) -> bool:
@@ -164,13 +270,15 @@ class BudgetService:
         Returns:
             New auto_reset setting
         """
-        budget = self.budget_repo.load()
+        with self.budget_repo.lock.write():
+            budget = self._load_budget()
 
-        if enabled is None:
-            enabled = not budget.auto_reset
+            if enabled is None:
+                enabled = not budget.auto_reset
 
-        budget.auto_reset = enabled
-        self.budget_repo.save(budget)
+            if budget.auto_reset != enabled:
+                budget.auto_reset = enabled
+                self.budget_repo.save(budget)
         return enabled
 
     def delete_current_budget(self, month: Optional[str] = None) -> None:
@@ -183,8 +291,9 @@ class BudgetService:
         if month is None:
             month = self.get_current_month()
 
-        budget = self.budget_repo.load()
-        if month in budget.monthly_budgets:
-            del budget.monthly_budgets[month]
-            self.budget_repo.save(budget)
+        with self.budget_repo.lock.write():
+            budget = self._load_budget()
+            if month in budget.monthly_budgets:
+                del budget.monthly_budgets[month]
+                self.budget_repo.save(budget)
 
@@ -0,0 +1,170 @@
+"""In-process caches used by services."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """Bounded, thread-safe mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key, marking it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (found, value)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "evictions": self.evictions,
+            }
+
+
+class ResultCache:
+    """
+    Memoizes service results against a data version.
+
+    Entries live in a bounded LRU cache and expire after ``ttl`` seconds as
+    a safety net. Every lookup passes the current version of the data the
+    results depend on; when it differs from the version the entries were
+    computed for, the whole cache is dropped, so a write invalidates exactly
+    the results derived from the data it changed.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of results (0 disables caching)
+            ttl: Seconds a result stays valid (0 or less means no expiry)
+            clock: Time source in seconds
+        """
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = LRUCache(maxsize)
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get_or_compute(
+        self, key: Hashable, version: Any, compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Get a cached result, computing and storing it on a miss.
+
+        Args:
+            key: Hashable description of the call (method name and arguments)
+            version: JSON-compatible stamp of the data the result depends on
+            compute: Produces the result on a miss
+
+        Returns:
+            The cached or freshly computed result (must not be mutated)
+        """
+        stamp = json.dumps(version, default=str)
+        with self._lock:
+            if stamp != self._version:
+                if self._version is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._version = stamp
+
+        found, entry = self._entries.get(key)
+        now = self._clock()
+        with self._lock:
+            if found and (self.ttl <= 0 or now - entry[0] < self.ttl):
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            if found:
+                self.expirations += 1
+
+        value = compute()
+        with self._lock:
+            # Skip storing if a write was observed while computing
+            if stamp == self._version:
+                self._entries.put(key, (now, value))
+        return value
+
+    def clear(self) -> None:
+        """Drop all results, keeping the counters."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss, expiry and invalidation counters."""
+        stats = self._entries.stats()
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats.update(
+                hits=self.hits,
+                misses=self.misses,
+                hit_ratio=round(self.hits / lookups, 4) if lookups else 0.0,
+                ttl=self.ttl,
+                expirations=self.expirations,
+                invalidations=self.invalidations,
+            )
+        return stats
@@ -1,13 +1,26 @@
 """Service for category business logic."""
 
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from ..config import get_settings
 from ..domain.category import Category
+from ..domain.category_matcher import CategoryMatcher
 from ..repositories import CategoryRepository
+from .cache import LRUCache
 
 
 class CategoryService:
-    """Service for category operations."""
+    """
+    Service for category operations.
+
+    Categorization results are memoized per expense name in a bounded LRU
+    cache (``LEDGER_CATEGORY_CACHE_SIZE`` entries). Entries are keyed on
+    the generation of the matcher that produced them, which changes with the
+    categories file version and with this service's own category changes,
+    so a call still running on an old matcher cannot leave a stale result
+    behind for newer ones.
+    """
 
     def __init__(self, repository: Optional[CategoryRepository] = None):
         """
@@ -17,6 +30,27 @@ class CategoryService:
             repository: CategoryRepository instance. Creates new one if None.
         """
         self.repository = repository or CategoryRepository()
+        self._matcher: Optional[CategoryMatcher] = None
+        self._matcher_version = None
+        self._generation = 0
+        self._matcher_lock = threading.Lock()
+        self._memo = LRUCache(get_settings().category_cache_size)
+
+    def _invalidate(self) -> None:
+        """Drop the compiled matcher and memoized categorizations."""
+        with self._matcher_lock:
+            self._matcher = None
+            self._generation += 1
+            self._memo.clear()
+
+    def get_version(self) -> Optional[Any]:
+        """
+        Get a version stamp of the categories.
+
+        Returns:
+            File version, or None while the default categories are in use
+        """
+        return self.repository.get_version()
 
     def get_all_categories(self) -> Dict[str, Category]:
         """
@@ -54,6 +88,7 @@ class CategoryService:
             keywords = []
         category = Category(name=name, keywords=keywords)
         self.repository.add_category(category)
+        self._invalidate()
         return category
 
     def remove_category(self, name: str) -> None:
@@ -64,6 +99,7 @@ class CategoryService:
             name: Category name to remove
         """
         self.repository.remove_category(name)
+        self._invalidate()
 
     def update_category(self, name: str, keywords: List[str]) -> Category:
         """
@@ -78,6 +114,39 @@ class CategoryService:
         """
         category = Category(name=name, keywords=keywords)
         self.repository.update_category(category)
+        self._invalidate()
+        return category
+
+    def get_matcher(self) -> CategoryMatcher:
+        """
+        Get the compiled keyword matcher for the current categories.
+
+        The matcher is rebuilt (and the name memo cleared) only when the
+        categories file changes.
+
+        Returns:
+            CategoryMatcher instance
+        """
+        return self._current_matcher()[1]
+
+    def _current_matcher(self) -> Tuple[int, CategoryMatcher]:
+        """Get the current matcher together with its generation."""
+        version = self.repository.get_version()
+        with self._matcher_lock:
+            if self._matcher is None or version != self._matcher_version:
+                self._generation += 1
+                self._memo.clear()
+                self._matcher = CategoryMatcher(self.get_all_categories().values())
+                self._matcher_version = version
+            return self._generation, self._matcher
+
+    def _categorize(self, matcher: Tuple[int, CategoryMatcher], expense_name: str) -> str:
+        """Categorize a name through the memo, keyed on the matcher's generation."""
+        generation, compiled = matcher
+        found, category = self._memo.get((generation, expense_name))
+        if not found:
+            category = compiled.categorize(expense_name)
+            self._memo.put((generation, expense_name), category)
         return category
 
     def categorize_expense(self, expense_name: str) -> str:
@@ -90,15 +159,29 @@ class CategoryService:
         Returns:
             Category name (defaults to "miscellaneous")
         """
-        categories = self.get_all_categories()
-        expense_lower = expense_name.lower().strip()
+        return self._categorize(self._current_matcher(), expense_name)
+
+    def categorize_many(self, expense_names: Iterable[str]) -> List[str]:
+        """
+        Determine categories for a list or column of expenses.
 
-        # Check each category for matches
-        for category in categories.values():
-            if category.matches(expense_name):
-                return category.name
+        Args:
+            expense_names: Names of the expenses
 
-        return "miscellaneous"
+        Returns:
+            Category names in the same order
+        """
+        matcher = self._current_matcher()
+        return [self._categorize(matcher, name) for name in expense_names]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get name-to-category memo statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_ratio, entries, maxsize and evictions
+        """
+        return self._memo.stats()
 
     def get_category_summary(
         self, expenses_data: Dict[str, List[Dict]]
@@ -113,10 +196,11 @@ class CategoryService:
             Dictionary mapping category names to total amounts
         """
         category_totals: Dict[str, float] = {}
+        matcher = self._current_matcher()
 
         for expenses in expenses_data.values():
             for expense in expenses:
-                category = self.categorize_expense(expense["expense"])
+                category = self._categorize(matcher, expense["expense"])
                 amount = float(expense["amount"])
                 category_totals[category] = category_totals.get(category, 0) + amount
 
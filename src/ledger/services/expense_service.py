@@ -1,10 +1,12 @@
 """Service for expense business logic."""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
+from ..config import get_settings
 from ..domain.expense import Expense
-from ..repositories import ExpenseRepository
+from ..repositories import ExpenseRepository, create_expense_repository
+from .pagination import MAX_PAGE_SIZE, decode_cursor, encode_cursor
 
 
 class ExpenseService:
@@ -17,7 +19,16 @@ class ExpenseService:
         Args:
             repository: ExpenseRepository instance. Creates new one if None.
         """
-        self.repository = repository or ExpenseRepository()
+        self.repository = repository or create_expense_repository()
+
+    def get_version(self) -> List[Any]:
+        """
+        Get a version stamp of the ledger that changes on every write.
+
+        Returns:
+            JSON-compatible stamp
+        """
+        return self.repository.get_version()
 
     def add_expense(
         self, expense_name: str, amount: float, date: Optional[str] = None
@@ -37,6 +48,31 @@ class ExpenseService:
         self.repository.add_expense(expense)
         return expense
 
+    def add_expenses(self, items: List[Dict]) -> List[Expense]:
+        """
+        Add several expenses in one write.
+
+        Every item is validated before anything is stored, so an invalid
+        item leaves the ledger unchanged.
+
+        Args:
+            items: Dicts with "expense", "amount" and optional "date" keys
+
+        Returns:
+            List of created Expense instances
+        """
+        expenses = []
+        for position, item in enumerate(items):
+            try:
+                expenses.append(
+                    Expense.create(item["expense"], item["amount"], item.get("date"))
+                )
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"Invalid expense at position {position}: {e}") from e
+
+        self.repository.add_many(expenses)
+        return expenses
+
     def get_expenses_by_date(self, date: str) -> List[Dict]:
         """
         Get expenses for a specific date.
@@ -75,6 +111,61 @@ class ExpenseService:
             raise ValueError("Start date cannot be after end date")
         return self.repository.get_expenses_by_range(start_date, end_date)
 
+    def get_expenses_page(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        newest_first: bool = False,
+        offset: int = 0,
+    ) -> Dict:
+        """
+        Get one page of expenses in date order.
+
+        Memory is bounded by ``limit`` rather than by the size of the range.
+        ``offset`` is kept for clients that page by position; those rows are
+        still read and skipped, so deep pages should follow ``next_cursor``.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+            cursor: ``next_cursor`` from the previous page. First page if None.
+            limit: Page size, at most MAX_PAGE_SIZE
+            newest_first: List dates newest first (expenses within a date
+                stay in the order they were added)
+            offset: Number of expenses to skip after the cursor
+
+        Returns:
+            Dictionary with "expenses" (each with its "date" and "index") and
+            "next_cursor" (None on the last page)
+
+        Raises:
+            ValueError: If the cursor, limit, offset or range is invalid
+        """
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+        if offset < 0:
+            raise ValueError("Offset cannot be negative")
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError("Start date cannot be after end date")
+        after = decode_cursor(cursor) if cursor else None
+
+        # One extra row tells us whether another page follows
+        rows = self.repository.get_expenses_page(
+            start_date, end_date, after, offset + limit + 1, newest_first
+        )[offset:]
+        next_cursor = None
+        if len(rows) > limit:
+            date, index, item = rows[limit - 1]
+            next_cursor = encode_cursor(date, item.get("id"), index)
+        return {
+            "expenses": [
+                {**item, "date": date, "index": index} for date, index, item in rows[:limit]
+            ],
+            "next_cursor": next_cursor,
+        }
+
     def update_expense(
         self,
         date: str,
@@ -126,6 +217,55 @@ class ExpenseService:
 
         self.repository.delete_expense(date, index)
 
+    def get_expense_by_id(self, expense_id: str) -> Dict:
+        """
+        Get an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+
+        Returns:
+            Expense dictionary including its date and current index
+        """
+        expense = self.repository.get_expense_by_id(expense_id)
+        if expense is None:
+            raise ValueError(f"Expense '{expense_id}' not found")
+        return expense
+
+    def update_expense_by_id(
+        self,
+        expense_id: str,
+        expense: Optional[str] = None,
+        amount: Optional[float] = None,
+    ) -> Dict:
+        """
+        Update an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+            expense: New expense name (optional)
+            amount: New amount (optional)
+
+        Returns:
+            Updated expense dictionary
+        """
+        if expense is None and amount is None:
+            raise ValueError("At least one of expense or amount must be provided")
+
+        if self.repository.update_expense_by_id(expense_id, expense, amount) is None:
+            raise ValueError(f"Expense '{expense_id}' not found")
+        return self.get_expense_by_id(expense_id)
+
+    def delete_expense_by_id(self, expense_id: str) -> None:
+        """
+        Delete an expense by its stable ID.
+
+        Args:
+            expense_id: Expense ID
+        """
+        if self.repository.delete_expense_by_id(expense_id) is None:
+            raise ValueError(f"Expense '{expense_id}' not found")
+
     def delete_all(self) -> None:
         """Delete all expenses."""
         self.repository.delete_all()
@@ -165,9 +305,42 @@ class ExpenseService:
         Returns:
             Total amount
         """
-        expenses_dict = self.get_expenses_by_range(start_date, end_date)
-        total = 0.0
-        for expenses in expenses_dict.values():
-            total += sum(float(exp["amount"]) for exp in expenses)
-        return total
+        return self.get_range_totals(start_date, end_date)["total"]
+
+    def get_range_totals(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> Dict:
+        """
+        Get total, transaction count and active days for a date range.
+
+        Served from the prefix-sum daily index when aggregates are enabled,
+        so the cost does not depend on the number of expenses in the range.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+
+        Returns:
+            Dictionary with total, transaction_count and days_with_expenses
+        """
+        if start_date is not None and end_date is not None and start_date > end_date:
+            raise ValueError("Start date cannot be after end date")
+
+        if get_settings().aggregates_enabled and hasattr(self.repository, "get_aggregates"):
+            index = self.repository.get_aggregates().daily_index
+            total, count, days = index.range_totals(start_date, end_date)
+        else:
+            total, count, days = 0.0, 0, 0
+            for date, expenses in self.repository.load_all().items():
+                if (start_date and date < start_date) or (end_date and date > end_date):
+                    continue
+                total += sum(float(exp["amount"]) for exp in expenses)
+                count += len(expenses)
+                days += 1 if expenses else 0
+
+        return {
+            "total": round(total, 2),
+            "transaction_count": count,
+            "days_with_expenses": days,
+        }
 
@@ -0,0 +1,54 @@
+"""Opaque keyset cursors for paging through the ledger."""
+
+import base64
+import json
+from typing import Optional, Tuple
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(date: str, expense_id: Optional[str], index: int) -> str:
+    """
+    Encode a ledger position as an opaque cursor.
+
+    Pages resume after the expense with ``expense_id``, so rows added or
+    removed elsewhere on the same date do not shift the next page. The
+    index is only used if that expense has since been deleted.
+
+    Args:
+        date: Date of the last returned expense (YYYY-MM-DD)
+        expense_id: Stable ID of the last returned expense
+        index: Index of the last returned expense within its date
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([date, expense_id, index], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Optional[str], int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (date, expense ID, index)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        date, expense_id, index = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (
+        not isinstance(date, str)
+        or not isinstance(expense_id, (str, type(None)))
+        or not isinstance(index, int)
+    ):
+        raise ValueError("Invalid cursor")
+    return date, expense_id, index
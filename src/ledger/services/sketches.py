@@ -0,0 +1,257 @@
+"""Per-month analytics sketches kept in step with the ledger."""
+
+import calendar
+import hashlib
+import json
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..domain.sketches import CountMinSketch, HyperLogLog, KLLSketch
+from ..repositories import SketchRepository
+from ..repositories.aggregate_store import LedgerAggregates
+
+SKETCHES_VERSION = 1
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class MonthSketches:
+    """Amount quantiles (overall and per category), distinct names and frequent names."""
+
+    def __init__(self):
+        """Initialize empty sketches."""
+        self.amounts = KLLSketch()
+        self.categories: Dict[str, KLLSketch] = {}
+        self.names = HyperLogLog()
+        self.frequent = CountMinSketch()
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Tuple[str, float]],
+        categorize: Callable[[List[str]], List[str]],
+    ) -> "MonthSketches":
+        """
+        Build sketches from expenses.
+
+        Args:
+            rows: (expense name, amount) pairs
+            categorize: Maps expense names to categories
+
+        Returns:
+            MonthSketches instance
+        """
+        sketches = cls()
+        rows = list(rows)
+        counts = Counter(name for name, _ in rows)
+        names = sorted(counts)
+        category_of = dict(zip(names, categorize(names)))
+
+        # Name sketches only need each distinct name once, with its count
+        for name in names:
+            sketches.names.add(name)
+            sketches.frequent.add(name, counts[name])
+
+        by_category: Dict[str, List[float]] = {}
+        for name, amount in rows:
+            by_category.setdefault(category_of[name], []).append(amount)
+        for category, amounts in by_category.items():
+            sketches.categories[category] = KLLSketch()
+            sketches.categories[category].update(amounts)
+        sketches.amounts.update(amount for _, amount in rows)
+        return sketches
+
+    def merge(self, *others: "MonthSketches") -> None:
+        """Fold other months' sketches into these."""
+        self.amounts.merge(*(other.amounts for other in others))
+        categories = sorted(set().union(*(other.categories for other in others)))
+        for category in categories:
+            self.categories.setdefault(category, KLLSketch()).merge(
+                *(other.categories[category] for other in others if category in other.categories)
+            )
+        self.names.merge(*(other.names for other in others))
+        self.frequent.merge(*(other.frequent for other in others))
+
+    def summary(self, heavy: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the sketches.
+
+        Args:
+            heavy: Number of frequent expense names to report
+
+        Returns:
+            Dictionary with quantiles, distinct-name estimate and heavy hitters
+        """
+
+        def quantiles(sketch: KLLSketch) -> Dict[str, Optional[float]]:
+            return {
+                f"p{round(q * 100)}": None if value is None else round(value, 2)
+                for q, value in ((q, sketch.quantile(q)) for q in QUANTILES)
+            }
+
+        return {
+            "amount_quantiles": quantiles(self.amounts),
+            "category_quantiles": {
+                category: quantiles(sketch) for category, sketch in sorted(self.categories.items())
+            },
+            "distinct_expenses": self.names.count() if self.amounts.n else 0,
+            "frequent_expenses": [
+                {"name": name, "count": count}
+                for name, count in self.frequent.heavy_hitters(heavy)
+            ],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "amounts": self.amounts.to_dict(),
+            "categories": {name: sketch.to_dict() for name, sketch in self.categories.items()},
+            "names": self.names.to_dict(),
+            "frequent": self.frequent.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MonthSketches":
+        """Deserialize from ``to_dict`` output."""
+        sketches = cls()
+        sketches.amounts = KLLSketch.from_dict(data["amounts"])
+        sketches.categories = {
+            name: KLLSketch.from_dict(sketch) for name, sketch in data["categories"].items()
+        }
+        sketches.names = HyperLogLog.from_dict(data["names"])
+        sketches.frequent = CountMinSketch.from_dict(data["frequent"])
+        return sketches
+
+
+def month_fingerprint(aggregates: LedgerAggregates, month: str) -> str:
+    """
+    Digest of a month's aggregate buckets.
+
+    Adding, removing, renaming or re-pricing an expense changes the month's
+    totals, counts or per-name buckets, so a matching fingerprint means the
+    stored sketches are current. (Edits that exactly cancel out within one
+    expense name go unnoticed until the month's next write; acceptable for
+    an approximate tier.)
+
+    Args:
+        aggregates: LedgerAggregates view
+        month: Month (YYYY-MM)
+
+    Returns:
+        Hex digest
+    """
+    payload = [aggregates.months.get(month), aggregates.names.get(month, {})]
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class SketchIndex:
+    """
+    Persisted per-month sketches, merged on demand for a date range.
+
+    Each month's sketches carry a fingerprint of that month's aggregate
+    buckets. After writes only the months whose fingerprint changed are
+    rebuilt, and a change to the categories file rebuilds every month.
+    Months are mergeable, so any range of whole months is answered without
+    touching expenses; partial months at the edges are sketched directly.
+    """
+
+    def __init__(self, expense_repo, category_service, repository: Optional[SketchRepository] = None):
+        """
+        Initialize sketch index.
+
+        Args:
+            expense_repo: Expense repository with ``get_aggregates``
+            category_service: CategoryService used to assign categories
+            repository: SketchRepository instance. Creates new one if None.
+        """
+        self.expense_repo = expense_repo
+        self.category_service = category_service
+        self.repository = repository or SketchRepository()
+        self._cached: Optional[Tuple[LedgerAggregates, Any, Dict[str, MonthSketches]]] = None
+
+    def _build(self, start_date: str, end_date: str) -> MonthSketches:
+        """Sketch the expenses of a date range directly."""
+        rows = (
+            (item["expense"], float(item["amount"]))
+            for items in self.expense_repo.get_expenses_by_range(start_date, end_date).values()
+            for item in items
+        )
+        return MonthSketches.build(rows, self.category_service.categorize_many)
+
+    def refresh(self, aggregates: LedgerAggregates) -> Dict[str, MonthSketches]:
+        """
+        Bring the stored sketches up to date.
+
+        Args:
+            aggregates: Current LedgerAggregates view
+
+        Returns:
+            Dictionary mapping months to their sketches
+        """
+        version = self.category_service.repository.get_version()
+        categories_stamp = list(version) if version is not None else None
+        if (
+            self._cached is not None
+            and self._cached[0] is aggregates
+            and self._cached[1] == categories_stamp
+        ):
+            return self._cached[2]
+
+        doc = self.repository.load()
+        stored = doc.get("months", {})
+        if doc.get("version") != SKETCHES_VERSION or doc.get("categories") != categories_stamp:
+            stored = {}
+
+        months: Dict[str, MonthSketches] = {}
+        entries: Dict[str, Any] = {}
+        changed = len(stored) != len(aggregates.months)
+        for month in sorted(aggregates.months):
+            fingerprint = month_fingerprint(aggregates, month)
+            entry = stored.get(month)
+            if entry is not None and entry["fingerprint"] == fingerprint:
+                months[month] = MonthSketches.from_dict(entry["sketches"])
+                entries[month] = entry
+                continue
+            last_day = calendar.monthrange(int(month[:4]), int(month[5:]))[1]
+            months[month] = self._build(f"{month}-01", f"{month}-{last_day:02d}")
+            entries[month] = {"fingerprint": fingerprint, "sketches": months[month].to_dict()}
+            changed = True
+
+        if changed:
+            self.repository.save(
+                {"version": SKETCHES_VERSION, "categories": categories_stamp, "months": entries}
+            )
+        # Reused while the repository keeps serving the same aggregates view
+        self._cached = (aggregates, categories_stamp, months)
+        return months
+
+    def for_range(
+        self,
+        aggregates: LedgerAggregates,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> MonthSketches:
+        """
+        Merge sketches covering a date range.
+
+        Args:
+            aggregates: Current LedgerAggregates view
+            start_date: Start date (YYYY-MM-DD). Unbounded if None.
+            end_date: End date (YYYY-MM-DD). Unbounded if None.
+
+        Returns:
+            MonthSketches for the range
+        """
+        parts: List[MonthSketches] = []
+        for month, sketches in self.refresh(aggregates).items():
+            last_day = calendar.monthrange(int(month[:4]), int(month[5:]))[1]
+            first, last = f"{month}-01", f"{month}-{last_day:02d}"
+            lo = max(first, start_date or first)
+            hi = min(last, end_date or last)
+            if lo <= hi:
+                parts.append(sketches if (lo, hi) == (first, last) else self._build(lo, hi))
+
+        merged = MonthSketches()
+        if parts:
+            merged.merge(*parts)
+        return merged
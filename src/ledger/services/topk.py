@@ -0,0 +1,49 @@
+"""Heap-based top-K selection over aggregate buckets."""
+
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+TOP_BY = ("amount", "count")
+TOP_DIMENSIONS = ("name", "category", "day")
+
+
+def top_k(items: Iterable[Tuple[str, float]], k: int) -> List[Tuple[str, float]]:
+    """
+    Select the k largest (key, value) pairs.
+
+    Runs in O(n log k) with a bounded heap instead of sorting all n items.
+    Ties are broken by key so the result is deterministic.
+
+    Args:
+        items: (key, value) pairs
+        k: Number of pairs to keep
+
+    Returns:
+        Up to k pairs, largest value first
+    """
+    if k <= 0:
+        return []
+    return heapq.nsmallest(k, items, key=lambda item: (-item[1], item[0]))
+
+
+def top_k_buckets(
+    buckets: Dict[str, Tuple[float, int]], k: int, by: str = "amount"
+) -> List[Tuple[str, float]]:
+    """
+    Select the top k buckets by total amount or by transaction count.
+
+    Args:
+        buckets: Key -> (total, count)
+        k: Number of buckets to keep
+        by: "amount" or "count"
+
+    Returns:
+        Up to k (key, total or count) pairs, largest first
+
+    Raises:
+        ValueError: If ``by`` is unknown
+    """
+    if by not in TOP_BY:
+        raise ValueError(f"Unknown ranking: {by}. Use one of {', '.join(TOP_BY)}")
+    position = 0 if by == "amount" else 1
+    return top_k(((key, bucket[position]) for key, bucket in buckets.items()), k)
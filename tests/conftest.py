@@ -12,6 +12,8 @@ from src.ledger.repositories import (
     BudgetRepository,
     UserRepository,
     FileManager,
+    PartitionedExpenseRepository,
+    SqliteExpenseRepository,
 )
 from src.ledger.services import (
     ExpenseService,
@@ -54,6 +56,22 @@ def expense_repository(file_manager):
     return ExpenseRepository()
 
 
+@pytest.fixture(params=["json", "journal", "partitioned", "sqlite"])
+def repository(request, test_settings, monkeypatch):
+    """Create an expense repository for each storage backend."""
+    if request.param == "journal":
+        monkeypatch.setattr(test_settings, "journal_enabled", True)
+        monkeypatch.setattr(test_settings, "journal_compact_threshold", 3)
+    if request.param == "sqlite":
+        repository = SqliteExpenseRepository()
+        yield repository
+        repository.close()
+    elif request.param == "partitioned":
+        yield PartitionedExpenseRepository()
+    else:
+        yield ExpenseRepository()
+
+
 @pytest.fixture
 def category_repository(file_manager):
     """Create a category repository instance."""
@@ -0,0 +1,271 @@
+"""Integration tests for the analytics API routes."""
+
+import asyncio
+import contextlib
+import threading
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.dependencies import (
+    get_analytics_service,
+    get_budget_service,
+    get_category_service,
+    get_expense_service,
+)
+
+
+@pytest.fixture
+def client(expense_service, analytics_service, category_service, budget_service):
+    """Create a test client wired to the temporary ledger."""
+    app.dependency_overrides[get_budget_service] = lambda: budget_service
+    app.dependency_overrides[get_expense_service] = lambda: expense_service
+    app.dependency_overrides[get_analytics_service] = lambda: analytics_service
+    app.dependency_overrides[get_category_service] = lambda: category_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.integration
+class TestSummaryRoutes:
+    """Test cases for /summary."""
+
+    def test_totals_only_matches_full_summary(self, client, expense_service):
+        """Test that totals_only returns the full summary's totals without expenses."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        expense_service.add_expense("taxi", 700.5, "2025-01-15")
+        expense_service.add_expense("data", 1000, "2025-01-20")
+        expense_service.add_expense("rent", 50000, "2025-02-01")
+
+        for params in ({}, {"range": "2025-01-01,2025-01-31"}, {"date": "2025-01-15"}):
+            full = client.get("/summary", params=params).json()
+            totals = client.get("/summary", params={**params, "totals_only": True}).json()
+
+            assert "expenses" not in totals
+            assert totals == {key: full[key] for key in totals}
+
+        totals = client.get("/summary", params={"range": "2025-01-01,2025-01-31", "totals_only": True})
+        assert totals.json()["total"] == 3200.5
+        assert totals.json()["days_with_expenses"] == 2
+
+    def test_totals_only_rejects_bad_range(self, client):
+        """Test that malformed and inverted ranges are rejected."""
+        assert client.get("/summary", params={"range": "2025-01-01", "totals_only": True}).status_code == 400
+        assert client.get(
+            "/summary", params={"range": "2025-02-01,2025-01-01", "totals_only": True}
+        ).status_code == 400
+
+
+@pytest.mark.integration
+class TestStatsRoutes:
+    """Test cases for /stats."""
+
+    def test_range_and_granularity(self, client, expense_service):
+        """Test range-scoped stats bucketed at the requested granularity."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        expense_service.add_expense("taxi", 700, "2025-01-16")
+        expense_service.add_expense("rent", 50000, "2025-02-01")
+
+        response = client.get(
+            "/stats", params={"start": "2025-01-16", "end": "2025-02-28", "granularity": "week"}
+        )
+
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["total_spent"] == 50700.0
+        assert stats["transaction_count"] == 2
+        assert stats["spending_by_period"] == {"2025-W03": 700.0, "2025-W05": 50000.0}
+        assert client.get("/stats").json()["transaction_count"] == 3
+
+    def test_rejects_bad_parameters(self, client):
+        """Test that bad dates, inverted ranges and granularities are rejected."""
+        assert client.get("/stats", params={"start": "15-01-2025"}).status_code == 400
+        assert client.get("/stats", params={"start": "2025-02-01", "end": "2025-01-01"}).status_code == 400
+        assert client.get("/stats", params={"granularity": "year"}).status_code == 400
+
+    def test_approximate_flag(self, client, expense_service):
+        """Test that approximate=true adds the sketch-based section."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        expense_service.add_expense("lunch", 1500, "2025-02-15")
+
+        plain = client.get("/stats").json()
+        approximate = client.get("/stats", params={"approximate": True}).json()
+
+        assert "approximate" not in plain
+        assert approximate["approximate"]["distinct_expenses"] == 1
+        assert approximate["approximate"]["amount_quantiles"]["p50"] == 1500.0
+
+
+@pytest.mark.integration
+class TestSummaryPaging:
+    """Test cases for paged /summary."""
+
+    def test_pages_follow_cursor(self, client, expense_service):
+        """Test that paged summaries carry totals and walk every expense once."""
+        for day in range(1, 8):
+            expense_service.add_expense(f"item {day}", 100 * day, f"2025-01-{day:02d}")
+
+        params = {"range": "2025-01-02,2025-01-06", "limit": 2}
+        seen, cursor = [], None
+        while True:
+            body = client.get("/summary", params={**params, "cursor": cursor} if cursor else params).json()
+            assert body["total"] == 2000.0
+            assert body["transaction_count"] == 5
+            seen.extend(exp["date"] for exp in body["expenses"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [f"2025-01-{day:02d}" for day in range(2, 7)]
+
+    def test_rejects_bad_cursor_and_limit(self, client):
+        """Test that malformed cursors and oversized pages are rejected."""
+        assert client.get("/summary", params={"cursor": "%%%"}).status_code == 400
+        assert client.get("/summary", params={"limit": 100000}).status_code == 422
+
+
+@pytest.mark.integration
+class TestTopRoutes:
+    """Test cases for /top."""
+
+    def test_top_names_and_days(self, client, expense_service):
+        """Test ranking names by count and days by amount."""
+        expense_service.add_expense("taxi", 700, "2025-01-15")
+        expense_service.add_expense("taxi", 800, "2025-01-16")
+        expense_service.add_expense("rent", 50000, "2025-01-16")
+
+        names = client.get("/top", params={"by": "count", "dimension": "name", "k": 1}).json()
+        days = client.get("/top", params={"dimension": "day"}).json()
+
+        assert names["items"] == [{"name": "Taxi", "count": 2}]
+        assert days["items"] == [
+            {"date": "2025-01-16", "amount": 50800.0},
+            {"date": "2025-01-15", "amount": 700.0},
+        ]
+
+    def test_rejects_bad_parameters(self, client):
+        """Test that unknown rankings and out-of-range k are rejected."""
+        assert client.get("/top", params={"by": "median"}).status_code == 400
+        assert client.get("/top", params={"dimension": "vendor"}).status_code == 400
+        assert client.get("/top", params={"k": 0}).status_code == 422
+
+
+@pytest.mark.integration
+class TestConditionalRequests:
+    """Test cases for ETag / If-None-Match handling."""
+
+    def test_unchanged_data_answers_304_without_computing(
+        self, client, expense_service, analytics_service, monkeypatch
+    ):
+        """Test that a matching ETag short-circuits before any stats are computed."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        first = client.get("/stats")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+
+        monkeypatch.setattr(
+            analytics_service, "calculate_comprehensive_stats",
+            lambda *args: pytest.fail("stats recomputed"),
+        )
+        second = client.get("/stats", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert second.content == b""
+
+    def test_writes_change_the_etag(self, client, expense_service, category_service):
+        """Test that expense and category writes both invalidate analytics ETags."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        etag = client.get("/summary").headers["ETag"]
+
+        expense_service.add_expense("taxi", 700, "2025-01-15")
+        response = client.get("/summary", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2200
+        etag = response.headers["ETag"]
+
+        category_service.add_category("Rides", ["taxi"])
+        assert client.get("/summary", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_expenses_and_categories_revalidate(self, client, expense_service):
+        """Test conditional GETs on /expenses and /categories."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        for path in ("/expenses", "/categories"):
+            etag = client.get(path).headers["ETag"]
+            assert client.get(path, headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+            assert client.get(path, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.integration
+class TestMetricsRoute:
+    """Test cases for /metrics."""
+
+    def test_reports_result_cache_hit_ratio(self, client, expense_service):
+        """Test that repeated /stats calls show up as result cache hits."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        for _ in range(3):
+            client.get("/stats")
+        client.get("/budget")
+
+        metrics = client.get("/metrics").json()
+        analytics = metrics["caches"]["analytics_results"]
+        assert (analytics["hits"], analytics["misses"]) == (2, 1)
+        assert analytics["hit_ratio"] == 0.6667
+        assert metrics["budget_writes"] == 0
+        assert "categorization" in metrics["caches"]
+
+
+@pytest.mark.integration
+class TestEventLoopOffload:
+    """Test that slow service calls do not block other requests."""
+
+    def run_during_slow_stats(self, client, analytics_service, monkeypatch, path, hold=None):
+        """
+        Request ``path`` while a /stats call is blocked inside the service.
+
+        The stats computation waits until the second request has completed,
+        so the recorded order shows whether that request could run alongside
+        it. The wait only times out if the second request was blocked.
+        """
+        stats_started = threading.Event()
+        other_done = threading.Event()
+        events = []
+
+        def slow_stats(*args):
+            with hold() if hold else contextlib.nullcontext():
+                stats_started.set()
+                events.append("stats" if other_done.wait(5) else "stats timed out")
+            return {}
+
+        monkeypatch.setattr(analytics_service, "_comprehensive_stats", slow_stats)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=client.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                stats = asyncio.create_task(http.get("/stats"))
+                await asyncio.to_thread(stats_started.wait, 5)
+                other = await http.get(path)
+                events.append(path)
+                other_done.set()
+                return (await stats).status_code, other.status_code
+
+        assert asyncio.run(scenario()) == (200, 200)
+        return events
+
+    def test_health_answers_during_slow_stats(self, client, analytics_service, monkeypatch):
+        """Test that /health answers while a blocking /stats computation runs."""
+        events = self.run_during_slow_stats(client, analytics_service, monkeypatch, "/health")
+
+        assert events == ["/health", "stats"]
+
+    def test_reads_run_during_slow_stats(self, client, analytics_service, expense_service, monkeypatch):
+        """Test that /expenses reads the ledger while a slow /stats holds it for reading."""
+        expense_service.add_expense("lunch", 1500, "2025-01-15")
+        repository = analytics_service.expense_repo
+
+        events = self.run_during_slow_stats(
+            client, analytics_service, monkeypatch, "/expenses", hold=repository.lock.read
+        )
+
+        assert events == ["/expenses", "stats"]
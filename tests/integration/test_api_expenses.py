@@ -0,0 +1,124 @@
+"""Integration tests for the expense API routes."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.dependencies import get_expense_service
+
+
+@pytest.fixture
+def client(expense_service):
+    """Create a test client wired to the temporary ledger."""
+    app.dependency_overrides[get_expense_service] = lambda: expense_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.integration
+class TestExpenseRoutes:
+    """Test cases for /expenses routes."""
+
+    def test_create_expenses_batch(self, client, expense_service):
+        """Test adding several expenses in one request."""
+        response = client.post(
+            "/expenses/batch",
+            json={
+                "expenses": [
+                    {"expense": "lunch", "amount": 1500, "date": "2025-01-15"},
+                    {"expense": "taxi", "amount": 700, "date": "2025-01-15"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["count"] == 2
+        assert len(expense_service.get_expenses_by_date("2025-01-15")) == 2
+
+    def test_create_expenses_batch_rejects_invalid_item(self, client, expense_service):
+        """Test that an invalid item rejects the whole batch."""
+        response = client.post(
+            "/expenses/batch",
+            json={
+                "expenses": [
+                    {"expense": "lunch", "amount": 1500, "date": "2025-01-15"},
+                    {"expense": "", "amount": 700, "date": "2025-01-15"},
+                ]
+            },
+        )
+
+        assert response.status_code == 400
+        assert expense_service.get_all_expenses() == {}
+
+    def test_expense_id_routes(self, client, expense_service):
+        """Test GET/PUT/DELETE by stable ID."""
+        expense_id = client.post(
+            "/expenses", json={"expense": "lunch", "amount": 1500, "date": "2025-01-15"}
+        ).json()["expense"]["id"]
+
+        assert client.get(f"/expenses/id/{expense_id}").json()["expense"] == "Lunch"
+
+        response = client.put(f"/expenses/id/{expense_id}", json={"amount": 1600})
+        assert response.status_code == 200
+        assert response.json()["expense"]["amount"] == 1600
+
+        assert client.delete(f"/expenses/id/{expense_id}").status_code == 200
+        assert client.get(f"/expenses/id/{expense_id}").status_code == 404
+
+
+@pytest.mark.integration
+class TestExpenseListing:
+    """Test cases for paging GET /expenses."""
+
+    @pytest.fixture
+    def ledger(self, expense_service):
+        for day in range(1, 6):
+            expense_service.add_expense(f"item {day}a", 100 * day, f"2025-01-{day:02d}")
+            expense_service.add_expense(f"item {day}b", 10 * day, f"2025-01-{day:02d}")
+        return expense_service
+
+    def test_cursor_walk_is_newest_first(self, client, ledger):
+        """Test that following next_cursor lists every expense once, newest first."""
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            body = client.get("/expenses", params=params).json()
+            assert body["total"] == 10
+            assert body["has_more"] == (body["next_cursor"] is not None)
+            seen.extend((exp["date"], exp["index"]) for exp in body["expenses"])
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == [(f"2025-01-{day:02d}", index) for day in range(5, 0, -1) for index in (0, 1)]
+
+    def test_offset_still_pages(self, client, ledger):
+        """Test that limit/offset keeps working alongside cursors."""
+        body = client.get("/expenses", params={"limit": 4, "offset": 4}).json()
+
+        assert [exp["date"] for exp in body["expenses"]] == ["2025-01-03"] * 2 + ["2025-01-02"] * 2
+        assert body["offset"] == 4
+        assert body["has_more"] is True
+
+    def test_cursor_respects_range(self, client, ledger):
+        """Test that cursor pages stay within a date range."""
+        first = client.get("/expenses", params={"range": "2025-01-02,2025-01-03", "limit": 3}).json()
+        rest = client.get(
+            "/expenses",
+            params={"range": "2025-01-02,2025-01-03", "limit": 3, "cursor": first["next_cursor"]},
+        ).json()
+
+        assert first["total"] == 4
+        assert [exp["expense"] for exp in first["expenses"] + rest["expenses"]] == [
+            "Item 3A",
+            "Item 3B",
+            "Item 2A",
+            "Item 2B",
+        ]
+        assert rest["next_cursor"] is None
+
+    def test_rejects_bad_cursor(self, client, ledger):
+        """Test that malformed cursors and cursor+offset are rejected."""
+        assert client.get("/expenses", params={"cursor": "%%%"}).status_code == 400
+        cursor = client.get("/expenses", params={"limit": 1}).json()["next_cursor"]
+        assert client.get("/expenses", params={"cursor": cursor, "offset": 2}).status_code == 400
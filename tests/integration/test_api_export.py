@@ -0,0 +1,89 @@
+"""Integration tests for the streaming export routes."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.dependencies import get_category_service, get_expense_service
+from src.api.routes import export
+
+
+@pytest.fixture
+def client(expense_service, category_service):
+    """Create a test client wired to the temporary ledger."""
+    app.dependency_overrides[get_expense_service] = lambda: expense_service
+    app.dependency_overrides[get_category_service] = lambda: category_service
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def ledger(expense_service, category_service):
+    """A small ledger spread over several days."""
+    category_service.add_category("fitness", ["zumba"])
+    for day in range(1, 6):
+        expense_service.add_expense("zumba", 100 * day, f"2025-01-{day:02d}")
+        expense_service.add_expense("mystery", 10 * day, f"2025-01-{day:02d}")
+    return expense_service
+
+
+@pytest.mark.integration
+class TestExportRoutes:
+    """Test cases for /export.csv and /export.ndjson."""
+
+    def test_csv_export(self, client, ledger):
+        """Test that the CSV export lists every expense with its category."""
+        response = client.get("/export.csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 10
+        assert list(rows[0]) == ["Date", "Expense", "Amount", "Category"]
+        assert rows[0] == {
+            "Date": "2025-01-01",
+            "Expense": "Zumba",
+            "Amount": "100.0",
+            "Category": "Fitness",
+        }
+        assert [row["Date"] for row in rows] == sorted(row["Date"] for row in rows)
+
+    def test_ndjson_export_range(self, client, ledger):
+        """Test that the NDJSON export honours the date range."""
+        response = client.get("/export.ndjson", params={"range": "2025-01-02,2025-01-03"})
+
+        assert response.status_code == 200
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["date"] for record in records] == ["2025-01-02"] * 2 + ["2025-01-03"] * 2
+        assert records[0]["category"] == "fitness"
+        assert all(record["id"] for record in records)
+
+    def test_export_streams_in_pages(self, client, ledger, monkeypatch):
+        """Test that the export reads the ledger page by page."""
+        monkeypatch.setattr(export, "MAX_PAGE_SIZE", 3)
+        pages = []
+        original = ledger.get_expenses_page
+        monkeypatch.setattr(
+            ledger,
+            "get_expenses_page",
+            lambda *args, **kwargs: pages.append(args) or original(*args, **kwargs),
+        )
+
+        records = client.get("/export.ndjson").text.splitlines()
+        assert len(records) == 10
+        assert len(pages) == 4
+
+    def test_export_empty_ledger(self, client):
+        """Test that an empty ledger exports just the header."""
+        assert client.get("/export.csv").text == "Date,Expense,Amount,Category\n"
+        assert client.get("/export.ndjson").text == ""
+
+    def test_rejects_bad_range(self, client):
+        """Test that malformed and reversed ranges are rejected."""
+        assert client.get("/export.csv", params={"range": "2025-13-01,2025-01-02"}).status_code == 400
+        assert client.get("/export.ndjson", params={"range": "2025-02-01,2025-01-01"}).status_code == 400
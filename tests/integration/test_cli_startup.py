@@ -0,0 +1,58 @@
+"""Integration tests for CLI startup cost."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of src.cli.main, in milliseconds
+IMPORT_BUDGET_MS = float(os.getenv("LEDGER_IMPORT_BUDGET_MS", "500"))
+
+HEAVY_MODULES = ("pandas", "numpy", "src.ledger.services.analytics_service")
+
+
+def run_python(args, home):
+    """Run the interpreter from the repository root with an isolated home."""
+    env = {**os.environ, "HOME": str(home)}
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+@pytest.mark.integration
+class TestCliStartup:
+    """Test cases for lazy CLI imports."""
+
+    def test_import_time_budget(self, temp_dir):
+        """Test that importing the CLI stays within budget and skips heavy modules."""
+        result = run_python(["-X", "importtime", "-c", "import src.cli.main"], temp_dir)
+
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, total, module = line.split("|")
+                if total.strip().isdigit():
+                    cumulative[module.strip()] = int(total) / 1000
+
+        assert not [m for m in HEAVY_MODULES if m in cumulative]
+        assert cumulative["src.cli.main"] < IMPORT_BUDGET_MS
+
+    def test_add_command_skips_analytics(self, temp_dir):
+        """Test that a lightweight command never imports the analytics stack."""
+        script = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from src.cli.main import app\n"
+            "result = CliRunner().invoke(app, ['add', 'Coffee', '5'], input='y\\n')\n"
+            "assert result.exit_code == 0, result.output\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        )
+        result = run_python(["-c", script], temp_dir)
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+        assert (temp_dir / ".ledger" / "ledger.json").exists()
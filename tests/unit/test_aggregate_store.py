@@ -0,0 +1,209 @@
+"""Unit tests for materialized ledger aggregates."""
+
+import json
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.repositories.aggregate_store import DailyIndex
+from src.ledger.services import AnalyticsService, BudgetService, ExpenseService
+
+
+def populate(repository):
+    """Run a mix of writes against a repository."""
+    repository.add_many(
+        [
+            Expense.create("Rice", 1000, "2025-01-15"),
+            Expense.create("Fuel", 2500, "2025-01-15"),
+            Expense.create("Rice", 1200, "2025-01-20"),
+            Expense.create("Data", 800, "2025-02-01"),
+        ]
+    )
+    repository.add_expense(Expense.create("Lunch", 1500, "2025-02-03"))
+    repository.update_expense("2025-01-15", 1, expense="petrol", amount=3000)
+    repository.delete_expense("2025-02-01", 0)
+    repository.add_expense(Expense.create("Rice", 900, "2025-02-03"))
+
+
+def snapshot(aggregates):
+    """Comparable form of aggregates, rounded to cents."""
+    return (
+        {k: round(v, 2) for k, v in aggregates.daily_totals().items()},
+        {k: round(v, 2) for k, v in aggregates.monthly_totals().items()},
+        {k: (round(t, 2), c) for k, (t, c) in aggregates.name_totals().items()},
+        aggregates.transaction_count,
+    )
+
+
+@pytest.mark.unit
+class TestAggregates:
+    """Test cases for aggregates maintained on write."""
+
+    def test_incremental_matches_rebuild(self, repository):
+        """Test that incremental maintenance agrees with a full rebuild."""
+        populate(repository)
+        incremental = snapshot(repository.get_aggregates())
+
+        assert incremental == snapshot(repository.rebuild_aggregates())
+        assert incremental[1] == {"2025-01": 5200.0, "2025-02": 2400.0}
+        assert incremental[2]["Rice"] == (3100.0, 3)
+        assert "Data" not in incremental[2]
+
+    def test_stats_match_full_scan(self, repository, category_service, monkeypatch, test_settings):
+        """Test that aggregate-backed statistics equal the raw-scan results."""
+        populate(repository)
+        analytics = AnalyticsService(repository, category_service)
+        budget = BudgetService(expense_repository=repository)
+
+        from_aggregates = (
+            analytics.calculate_comprehensive_stats(),
+            analytics.get_monthly_stats("2025-01"),
+            budget.get_monthly_spending("2025-02"),
+        )
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        from_scan = (
+            analytics.calculate_comprehensive_stats(),
+            analytics.get_monthly_stats("2025-01"),
+            budget.get_monthly_spending("2025-02"),
+        )
+
+        assert from_aggregates == from_scan
+        assert from_aggregates[2] == 2400.0
+
+    @pytest.mark.parametrize("granularity", ["day", "week", "month"])
+    def test_range_stats_match_full_scan(
+        self, repository, category_service, monkeypatch, test_settings, granularity
+    ):
+        """Test that range-scoped statistics from the rollup equal a raw scan."""
+        populate(repository)
+        repository.add_expense(Expense.create("Rice", 700, "2025-03-10"))
+        analytics = AnalyticsService(repository, category_service)
+        ranges = [
+            ("2025-01-16", "2025-03-31"),
+            ("2025-02-01", "2025-02-28"),
+            ("2025-01-15", None),
+            (None, "2025-02-03"),
+            ("2026-01-01", None),
+        ]
+
+        from_rollup = [analytics.calculate_comprehensive_stats(s, e, granularity) for s, e in ranges]
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        from_scan = [analytics.calculate_comprehensive_stats(s, e, granularity) for s, e in ranges]
+
+        assert from_rollup == from_scan
+        assert from_rollup[0]["transaction_count"] == 4
+        assert from_rollup[0]["total_spent"] == 4300.0
+        assert from_rollup[4]["transaction_count"] == 0
+
+    def test_external_edit_triggers_rebuild(self, test_settings, expense_repository):
+        """Test that aggregates are recomputed when the ledger changes behind them."""
+        expense_repository.add_expense(Expense.create("Rice", 1000, "2025-01-15"))
+        assert expense_repository.get_aggregates().month_total("2025-01") == 1000
+
+        ledger = {"2025-01-15": [{"expense": "Rice", "amount": 4000}]}
+        test_settings.ledger_file.write_text(json.dumps(ledger, indent=4))
+
+        assert expense_repository.get_aggregates().month_total("2025-01") == 4000
+
+    def test_write_touches_only_its_month(self, test_settings, expense_repository, monkeypatch):
+        """Test that a write rewrites the touched month's aggregates and the index only."""
+        populate(expense_repository)
+        expense_repository.get_aggregates()
+        saved = []
+        original = expense_repository.file_manager.save_json
+        monkeypatch.setattr(
+            expense_repository.file_manager,
+            "save_json",
+            lambda path, *args, **kwargs: saved.append(path) or original(path, *args, **kwargs),
+        )
+
+        expense_repository.add_expense(Expense.create("Tea", 300, "2025-02-10"))
+
+        aggregate_paths = [path for path in saved if path != test_settings.ledger_file]
+        assert aggregate_paths == [
+            test_settings.aggregates_dir / "2025-02.json",
+            test_settings.aggregates_file,
+        ]
+        assert expense_repository.get_aggregates().month_total("2025-02") == 2700.0
+
+    def test_id_lookup_on_empty_date_skips_ledger(self, expense_repository, monkeypatch):
+        """Test that an ID whose date has no expenses is rejected without loading the ledger."""
+        populate(expense_repository)
+        gone = Expense.create("Tea", 300, "2025-03-01")
+        expense_repository.add_expense(gone)
+        expense_repository.delete_expense("2025-03-01", 0)
+        kept = expense_repository.get_expenses_by_date("2025-02-03")[1]["id"]
+        expense_repository.get_aggregates()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("ledger loaded")
+
+        monkeypatch.setattr(expense_repository, "_load", fail)
+        assert expense_repository.find_expense_by_id(gone.id) is None
+
+        monkeypatch.undo()
+        assert expense_repository.find_expense_by_id(kept) == ("2025-02-03", 1)
+
+    def test_range_reads_day_names_for_edge_months_only(self, repository, monkeypatch):
+        """Test that a range query loads per-day name buckets for partial months only."""
+        populate(repository)
+        repository.add_expense(Expense.create("Rice", 700, "2025-03-10"))
+        aggregates = repository.get_aggregates()
+        assert aggregates.day_names is None
+        loaded = []
+        original = aggregates._month_day_names
+        monkeypatch.setattr(
+            aggregates,
+            "_month_day_names",
+            lambda month: loaded.append(month) or original(month),
+        )
+
+        restricted = aggregates.restrict("2025-01-16", "2025-03-31")
+
+        assert loaded == ["2025-01"]
+        assert restricted.name_totals()["Rice"] == (2800.0, 3)
+
+    def test_range_totals_match_full_scan(self, repository, monkeypatch, test_settings):
+        """Test that prefix-sum range totals equal a scan of the same range."""
+        populate(repository)
+        service = ExpenseService(repository)
+        ranges = [
+            ("2025-01-01", "2025-12-31"),
+            ("2025-01-15", "2025-01-15"),
+            ("2025-01-16", "2025-02-02"),
+            ("2025-02-03", "2025-03-01"),
+            ("2024-01-01", "2024-12-31"),
+            (None, "2025-01-31"),
+            (None, None),
+        ]
+
+        from_index = [service.get_range_totals(start, end) for start, end in ranges]
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        from_scan = [service.get_range_totals(start, end) for start, end in ranges]
+
+        assert from_index == from_scan
+        assert from_index[0] == {"total": 7600.0, "transaction_count": 5, "days_with_expenses": 3}
+        assert from_index[2]["transaction_count"] == 1
+        assert from_index[4]["total"] == 0.0
+
+
+@pytest.mark.unit
+class TestDailyIndex:
+    """Test cases for the prefix-sum daily index."""
+
+    def test_range_totals(self):
+        """Test lookups over gaps, clamped bounds and month boundaries."""
+        index = DailyIndex(
+            {"2025-01-30": [100.0, 2], "2025-02-02": [50.0, 1], "2025-03-01": [25.0, 1]}
+        )
+
+        assert index.range_totals("2025-01-30", "2025-01-30") == (100.0, 2, 1)
+        assert index.range_totals("2025-01-31", "2025-02-28") == (50.0, 1, 1)
+        assert index.range_totals("2024-01-01", "2030-01-01") == (175.0, 4, 3)
+        assert index.range_totals("2025-03-02", None) == (0.0, 0, 0)
+        assert index.range_totals("2025-02-10", "2025-02-01") == (0.0, 0, 0)
+
+    def test_empty(self):
+        """Test that an empty ledger yields zero totals."""
+        assert DailyIndex({}).range_totals("2025-01-01", "2025-12-31") == (0.0, 0, 0)
+        assert DailyIndex({}).range_totals() == (0.0, 0, 0)
@@ -0,0 +1,153 @@
+"""Unit tests for BudgetService."""
+
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def budget_months(budget_service, expense_service):
+    """Budgets for three months, each with some spending."""
+    budget = budget_service.budget_repo.load()
+    for month, amount in (("2025-01", 1000.0), ("2025-02", 2000.0), ("2025-03", 3000.0)):
+        budget.set_monthly_budget(month, amount)
+    budget_service.budget_repo.save(budget)
+
+    expense_service.add_expense("Lunch", 150.0, "2025-01-15")
+    expense_service.add_expense("Rent", 900.0, "2025-02-01")
+    expense_service.add_expense("Taxi", 50.0, "2025-02-28")
+    expense_service.add_expense("Outside", 10.0, "2025-04-02")
+    return budget_service
+
+
+@pytest.mark.unit
+class TestBudgetHistory:
+    """Test cases for budget history."""
+
+    @pytest.mark.parametrize("aggregates", [True, False])
+    def test_history_spending(self, budget_months, test_settings, monkeypatch, aggregates):
+        """Spending matches per-month totals with and without aggregates."""
+        monkeypatch.setattr(test_settings, "aggregates_enabled", aggregates)
+        history = budget_months.get_budget_history()
+
+        assert [item.month for item in history] == ["2025-03", "2025-02", "2025-01"]
+        assert [item.spent for item in history] == [0.0, 950.0, 150.0]
+        for item in history:
+            assert item.spent == budget_months.get_monthly_spending(item.month)
+
+    def test_history_pages(self, budget_months):
+        """Limit and offset page through months newest first."""
+        first = budget_months.get_budget_history(limit=2)
+        rest = budget_months.get_budget_history(limit=2, offset=2)
+
+        assert [item.month for item in first] == ["2025-03", "2025-02"]
+        assert [item.month for item in rest] == ["2025-01"]
+        assert budget_months.get_budget_history(offset=5) == []
+
+    def test_history_scans_ledger_once(self, budget_months, test_settings, monkeypatch):
+        """Without aggregates the ledger is read once, not once per month."""
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        repo = budget_months.expense_repo
+        calls = []
+        original = repo.get_expenses_by_range
+        monkeypatch.setattr(
+            repo, "get_expenses_by_range", lambda *args: calls.append(args) or original(*args)
+        )
+        monkeypatch.setattr(
+            repo, "get_expenses_by_month", lambda month: pytest.fail("per-month scan")
+        )
+
+        budget_months.get_budget_history()
+        assert calls == [("2025-01-01", "2025-03-31")]
+
+    def test_history_rejects_negative_offset(self, budget_service):
+        """Negative offsets are rejected."""
+        with pytest.raises(ValueError):
+            budget_service.get_budget_history(offset=-1)
+
+
+@pytest.mark.unit
+class TestBudgetWrites:
+    """Test cases for budget persistence on read and write paths."""
+
+    def test_status_reads_do_not_write(self, budget_service, expense_service):
+        """Repeated status reads leave the budget file alone."""
+        budget_service.set_monthly_budget(1000.0)
+        expense_service.add_expense("Lunch", 250.0)
+        writes = budget_service.budget_repo.writes
+
+        for _ in range(3):
+            status = budget_service.get_budget_status()
+            assert status.spent == 250.0
+            assert status.remaining == 750.0
+        budget_service.get_budget_history()
+
+        assert budget_service.budget_repo.writes == writes
+
+    def test_status_without_budget_is_not_stored(self, budget_service):
+        """A month without a budget is reported but not persisted."""
+        budget_service.reset_monthly_budget_if_needed()
+        writes = budget_service.budget_repo.writes
+
+        status = budget_service.get_budget_status("2024-06")
+        assert status.amount == 0
+        assert budget_service.budget_repo.writes == writes
+        assert "2024-06" not in budget_service.budget_repo.load().monthly_budgets
+
+    def test_rollover_persisted_by_next_write(self, budget_service, monkeypatch):
+        """A new month is applied by reads in memory and saved by the next budget write."""
+        monkeypatch.setattr(budget_service, "get_current_month", lambda: "2025-01")
+        budget_service.set_monthly_budget(500.0)
+
+        monkeypatch.setattr(budget_service, "get_current_month", lambda: "2025-02")
+        writes = budget_service.budget_repo.writes
+        status = budget_service.get_budget_status()
+        history = budget_service.get_budget_history()
+
+        assert status.amount == 500.0
+        assert status.reset_from_previous
+        assert [monthly.month for monthly in history] == ["2025-02", "2025-01"]
+        assert budget_service.budget_repo.writes == writes
+        assert "2025-02" not in budget_service.budget_repo.load().monthly_budgets
+
+        budget_service.toggle_auto_reset(False)
+        stored = budget_service.budget_repo.load()
+        assert budget_service.budget_repo.writes == writes + 1
+        assert stored.current_month == "2025-02"
+        assert stored.monthly_budgets["2025-02"].reset_from_previous
+
+    def test_concurrent_budget_writes_keep_both(self, budget_service, monkeypatch):
+        """Test that a budget write landing between another's load and save is not lost."""
+        loaded, proceed = threading.Event(), threading.Event()
+        load = budget_service.budget_repo.load
+
+        def paused_load():
+            budget = load()
+            if not loaded.is_set():
+                loaded.set()
+                proceed.wait(5)
+            return budget
+
+        monkeypatch.setattr(budget_service.budget_repo, "load", paused_load)
+        first = threading.Thread(target=budget_service.set_monthly_budget, args=(100.0, "2025-01"))
+        second = threading.Thread(target=budget_service.set_monthly_budget, args=(200.0, "2025-02"))
+        first.start()
+        assert loaded.wait(5)
+        second.start()
+        second.join(0.1)
+        proceed.set()
+        first.join()
+        second.join()
+
+        stored = budget_service.budget_repo.load().monthly_budgets
+        assert (stored["2025-01"].amount, stored["2025-02"].amount) == (100.0, 200.0)
+
+    def test_toggle_auto_reset_writes_on_change(self, budget_service):
+        """Toggling auto-reset to its current value does not write."""
+        budget_service.toggle_auto_reset(False)
+        writes = budget_service.budget_repo.writes
+
+        budget_service.toggle_auto_reset(False)
+        assert budget_service.budget_repo.writes == writes
+        assert budget_service.toggle_auto_reset() is True
+        assert budget_service.budget_repo.writes == writes + 1
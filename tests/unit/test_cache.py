@@ -0,0 +1,96 @@
+"""Unit tests for the service result cache."""
+
+import pytest
+
+from src.ledger.services.cache import ResultCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hits_until_version_changes(self):
+        """Test that results are reused until the data version changes."""
+        cache = ResultCache()
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+
+        assert cache.get_or_compute("stats", [1], compute) == 1
+        assert cache.get_or_compute("stats", [1], compute) == 1
+        assert cache.get_or_compute("stats", [2], compute) == 2
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["invalidations"]) == (1, 2, 1)
+        assert stats["hit_ratio"] == 0.3333
+
+    def test_ttl_expires_entries(self):
+        """Test that entries older than the TTL are recomputed."""
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+
+        cache.get_or_compute("stats", [1], compute)
+        clock.now = 9.9
+        assert cache.get_or_compute("stats", [1], compute) == 1
+        clock.now = 10.0
+        assert cache.get_or_compute("stats", [1], compute) == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_bounded_size_and_errors_not_cached(self):
+        """Test LRU eviction and that failed computations are not stored."""
+        cache = ResultCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            cache.get_or_compute(key, [1], lambda: key)
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+
+        def fail():
+            raise ValueError("bad range")
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute("bad", [1], fail)
+        assert cache.get_or_compute("bad", [1], lambda: "ok") == "ok"
+
+
+@pytest.mark.unit
+class TestServiceResultCaching:
+    """Test cases for result caching in the analytics and budget services."""
+
+    def test_stats_reused_until_ledger_or_categories_change(
+        self, analytics_service, expense_service, category_service, mocker
+    ):
+        """Test that writes to either repository invalidate cached stats."""
+        expense_service.add_expense("zumba", 700, "2025-01-15")
+        compute = mocker.spy(analytics_service, "_comprehensive_stats")
+
+        first = analytics_service.calculate_comprehensive_stats()
+        assert analytics_service.calculate_comprehensive_stats() is first
+        assert compute.call_count == 1
+
+        expense_service.add_expense("lunch", 1500, "2025-01-16")
+        assert analytics_service.calculate_comprehensive_stats()["total_spent"] == 2200
+        assert compute.call_count == 2
+
+        category_service.add_category("Fitness", ["zumba"])
+        assert "fitness" in analytics_service.calculate_comprehensive_stats()["category_breakdown"]
+        assert compute.call_count == 3
+
+    def test_budget_status_reused_until_write(self, budget_service, expense_service):
+        """Test that budget status is cached and refreshed by writes."""
+        budget_service.set_monthly_budget(1000.0)
+        assert budget_service.get_budget_status() is budget_service.get_budget_status()
+
+        expense_service.add_expense("Lunch", 250.0)
+        assert budget_service.get_budget_status().spent == 250.0
+        assert budget_service.cache_stats()["invalidations"] >= 1
@@ -0,0 +1,53 @@
+"""Unit tests for CategoryMatcher."""
+
+import pytest
+
+from src.ledger.domain import Category, CategoryMatcher
+
+
+def first_match(categories, expense_name):
+    """Reference categorization: first category whose matches() is true."""
+    for category in categories:
+        if category.matches(expense_name):
+            return category.name
+    return "miscellaneous"
+
+
+@pytest.mark.unit
+class TestCategoryMatcher:
+    """Test cases for the compiled keyword matcher."""
+
+    @pytest.mark.parametrize(
+        "expense_name",
+        ["Lunch", "  Moi-Moi ", "Water bill", "Uber to work", "Textbooks", "Rent", ""],
+    )
+    def test_matches_category_order_semantics(self, expense_name):
+        """Test parity with Category.matches over the default categories."""
+        categories = list(Category.get_default_categories().values())
+        matcher = CategoryMatcher(categories)
+
+        assert matcher.categorize(expense_name) == first_match(categories, expense_name)
+
+    def test_overlapping_keywords_prefer_earlier_category(self):
+        """Test that a later, longer keyword does not beat an earlier category."""
+        matcher = CategoryMatcher(
+            [
+                Category(name="a", keywords=["she"]),
+                Category(name="b", keywords=["he", "hers"]),
+            ]
+        )
+
+        assert matcher.categorize("ushers") == "a"
+        assert matcher.categorize("ahe") == "b"
+        assert matcher.categorize("xyz") == "miscellaneous"
+
+    def test_categorize_many(self):
+        """Test bulk categorization keeps input order."""
+        matcher = CategoryMatcher(Category.get_default_categories().values())
+
+        assert matcher.categorize_many(["Taxi", "Rice", "Taxi", "Gift"]) == [
+            "transport",
+            "food",
+            "transport",
+            "miscellaneous",
+        ]
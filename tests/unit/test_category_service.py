@@ -41,3 +41,45 @@ class TestCategoryService:
         assert summary["food"] == 1500.0
         assert summary["transport"] == 500.0
 
+    def test_matcher_follows_category_changes(self, category_service):
+        """Test that the compiled matcher is rebuilt when categories change."""
+        assert category_service.categorize_expense("Netflix") == "miscellaneous"
+        matcher = category_service.get_matcher()
+        assert category_service.get_matcher() is matcher
+
+        category_service.update_category("entertainment", ["netflix"])
+
+        assert category_service.categorize_expense("Netflix") == "entertainment"
+
+    def test_name_memo_hits_and_invalidation(self, category_service):
+        """Test that repeated names are memoized until categories change."""
+        names = ["Lunch", "Taxi", "Lunch", "Lunch", "Netflix"]
+        assert category_service.categorize_many(names)[-1] == "miscellaneous"
+
+        stats = category_service.cache_stats()
+        assert stats["misses"] == 3
+        assert stats["hits"] == 2
+
+        category_service.add_category("streaming", ["netflix"])
+        assert category_service.cache_stats()["entries"] == 0
+        assert category_service.categorize_expense("Netflix") == "streaming"
+
+    def test_stale_matcher_cannot_poison_memo(self, category_service):
+        """Test that a categorization still running on an old matcher is not served later."""
+        stale = category_service._current_matcher()
+
+        category_service.add_category("streaming", ["netflix"])
+        assert category_service._categorize(stale, "Netflix") == "miscellaneous"
+
+        assert category_service.categorize_expense("Netflix") == "streaming"
+
+    def test_name_memo_is_bounded(self, category_repository, test_settings, monkeypatch):
+        """Test LRU eviction once the memo is full."""
+        monkeypatch.setattr(test_settings, "category_cache_size", 2)
+        service = CategoryService(category_repository)
+
+        service.categorize_many(["Lunch", "Taxi", "Rice"])
+
+        stats = service.cache_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
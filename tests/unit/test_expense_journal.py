@@ -0,0 +1,85 @@
+"""Unit tests for journaled ExpenseRepository storage."""
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.repositories.expense_repository import ExpenseRepository
+
+
+@pytest.fixture
+def journaled_repository(test_settings, monkeypatch):
+    """Create an expense repository with journaling enabled."""
+    monkeypatch.setattr(test_settings, "journal_enabled", True)
+    monkeypatch.setattr(test_settings, "journal_compact_threshold", 3)
+    return ExpenseRepository()
+
+
+@pytest.mark.unit
+class TestExpenseJournal:
+    """Test cases for journaled expense storage."""
+
+    def test_add_appends_without_rewriting_snapshot(self, journaled_repository, test_settings):
+        """Test that adds go to the journal, not the snapshot."""
+        journaled_repository.add_expense(Expense.create("Coffee", 500.0, "2025-01-15"))
+
+        assert not test_settings.ledger_file.exists()
+        assert len(journaled_repository.journal) == 1
+        expenses = journaled_repository.get_expenses_by_date("2025-01-15")
+        assert [(e["expense"], e["amount"]) for e in expenses] == [("Coffee", 500.0)]
+
+    def test_update_and_delete_are_replayed(self, journaled_repository):
+        """Test that update and delete records replay in order."""
+        journaled_repository.add_expense(Expense.create("Coffee", 500.0, "2025-01-15"))
+        journaled_repository.update_expense("2025-01-15", 0, amount=600.0)
+
+        assert journaled_repository.get_expenses_by_date("2025-01-15")[0]["amount"] == 600.0
+
+        journaled_repository.delete_expense("2025-01-15", 0)
+        assert journaled_repository.load_all() == {}
+
+    def test_version_changes_on_every_write(self, journaled_repository, monkeypatch):
+        """Test that journal appends and snapshots advance the version, even with equal file stamps."""
+        monkeypatch.setattr(journaled_repository.aggregates, "stamp", lambda: [None, None])
+        versions = [journaled_repository.get_version()]
+        for name in ["Tea", "Bread", "Rice"]:
+            journaled_repository.add_expense(Expense.create(name, 100.0, "2025-01-15"))
+            versions.append(journaled_repository.get_version())
+        journaled_repository.save_all({})
+        versions.append(journaled_repository.get_version())
+
+        counts = [version[0] for version in versions]
+        assert counts == sorted(set(counts))
+
+    def test_compacts_at_threshold(self, journaled_repository, test_settings):
+        """Test that the journal is folded into the snapshot at the threshold."""
+        for name in ["Tea", "Bread", "Rice"]:
+            journaled_repository.add_expense(Expense.create(name, 100.0, "2025-01-15"))
+
+        assert len(journaled_repository.journal) == 0
+        assert test_settings.ledger_file.exists()
+        assert len(journaled_repository.get_expenses_by_date("2025-01-15")) == 3
+
+    def test_ignores_truncated_last_record(self, journaled_repository, test_settings):
+        """Test that an interrupted append does not corrupt the ledger."""
+        journaled_repository.add_expense(Expense.create("Coffee", 500.0, "2025-01-15"))
+        with open(test_settings.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"op":"add","date":"2025-01')
+
+        assert len(ExpenseRepository().get_expenses_by_date("2025-01-15")) == 1
+
+    def test_append_after_truncated_last_record(
+        self, journaled_repository, test_settings, monkeypatch
+    ):
+        """Test that appending after an interrupted append keeps the new records."""
+        monkeypatch.setattr(test_settings, "journal_compact_threshold", 10)
+        journaled_repository.add_expense(Expense.create("Coffee", 500.0, "2025-01-15"))
+        with open(test_settings.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"op":"add","date":"2025-01')
+
+        repository = ExpenseRepository()
+        repository.add_expense(Expense.create("Tea", 200.0, "2025-01-15"))
+        repository.add_expense(Expense.create("Bread", 300.0, "2025-01-15"))
+
+        expenses = ExpenseRepository().get_expenses_by_date("2025-01-15")
+        assert [e["expense"] for e in expenses] == ["Coffee", "Tea", "Bread"]
+        assert len(repository.journal) == 3
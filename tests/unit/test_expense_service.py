@@ -1,5 +1,7 @@
 """Unit tests for ExpenseService."""
 
+import threading
+
 import pytest
 from datetime import datetime
 
@@ -75,3 +77,79 @@ class TestExpenseService:
         with pytest.raises(ValueError, match="Start date cannot be after end date"):
             expense_service.get_expenses_by_range("2025-01-16", "2025-01-15")
 
+
+    def test_add_expenses_single_write(self, expense_service, mocker):
+        """Test that a batch is stored with one save."""
+        save = mocker.spy(expense_service.repository, "_save")
+
+        expenses = expense_service.add_expenses(
+            [
+                {"expense": "lunch", "amount": 1500, "date": "2025-01-15"},
+                {"expense": "taxi", "amount": 700, "date": "2025-01-16"},
+            ]
+        )
+
+        assert [e.expense for e in expenses] == ["Lunch", "Taxi"]
+        assert save.call_count == 1
+        assert len(expense_service.get_expenses_by_date("2025-01-16")) == 1
+
+    def test_add_expenses_is_all_or_nothing(self, expense_service):
+        """Test that one invalid item rejects the whole batch."""
+        with pytest.raises(ValueError, match="position 1"):
+            expense_service.add_expenses(
+                [
+                    {"expense": "lunch", "amount": 1500, "date": "2025-01-15"},
+                    {"expense": "taxi", "amount": -1, "date": "2025-01-15"},
+                ]
+            )
+
+        assert expense_service.get_all_expenses() == {}
+
+    def test_expense_ids_are_stable_across_deletes(self, expense_service):
+        """Test that ID addressing survives index shifts."""
+        first = expense_service.add_expense("Coffee", 500.0, "2025-01-15")
+        second = expense_service.add_expense("Lunch", 1500.0, "2025-01-15")
+
+        expense_service.delete_expense_by_id(first.id)
+        updated = expense_service.update_expense_by_id(second.id, amount=1600.0)
+
+        assert updated["index"] == 0
+        assert updated["amount"] == 1600.0
+        with pytest.raises(ValueError, match="not found"):
+            expense_service.get_expense_by_id(first.id)
+
+    def test_interleaved_deletes_by_id(self, repository, monkeypatch):
+        """Test that a delete landing between an ID lookup and its edit cannot shift the target."""
+        service = ExpenseService(repository)
+        ids = [service.add_expense(name, 100.0, "2025-01-15").id for name in "ABCD"]
+        located, proceed = threading.Event(), threading.Event()
+        find = repository.find_expense_by_id
+
+        def paused_find(expense_id):
+            location = find(expense_id)
+            if expense_id == ids[2] and not located.is_set():
+                located.set()
+                proceed.wait(5)
+            return location
+
+        monkeypatch.setattr(repository, "find_expense_by_id", paused_find)
+        delete_c = threading.Thread(target=service.delete_expense_by_id, args=(ids[2],))
+        delete_a = threading.Thread(target=service.delete_expense_by_id, args=(ids[0],))
+        delete_c.start()
+        assert located.wait(5)
+        delete_a.start()
+        delete_a.join(0.1)
+        proceed.set()
+        delete_c.join()
+        delete_a.join()
+
+        names = [e["expense"] for e in service.get_expenses_by_date("2025-01-15")]
+        assert names == ["B", "D"]
+
+    def test_legacy_expenses_get_ids_on_write(self, expense_service, sample_expenses):
+        """Test that expenses stored without IDs are backfilled on the next write."""
+        expense_service.repository.save_all(sample_expenses)
+        expense_service.add_expense("Tea", 200.0, "2025-01-16")
+
+        expenses = expense_service.get_expenses_by_date("2025-01-15")
+        assert all(expense_service.get_expense_by_id(e["id"]) for e in expenses)
@@ -0,0 +1,125 @@
+"""Unit tests for FileManager."""
+
+import json
+import os
+
+import pytest
+
+
+@pytest.mark.unit
+class TestFileManagerReadCache:
+    """Test cases for the FileManager read cache."""
+
+    def test_repeated_loads_hit_cache(self, file_manager, temp_dir):
+        """Test that unchanged files are parsed only once."""
+        path = temp_dir / "data.json"
+        file_manager.save_json(path, {"a": [1, 2]}, create_backup=False)
+        file_manager.read_cache.clear()
+
+        file_manager.load_json(path)
+        file_manager.load_json(path)
+
+        stats = file_manager.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_mutable_loads_do_not_leak_into_cache(self, file_manager, temp_dir):
+        """Test copy-on-read semantics for mutable loads."""
+        path = temp_dir / "data.json"
+        file_manager.save_json(path, {"a": [1, 2]}, create_backup=False)
+
+        data = file_manager.load_json(path)
+        data["a"].append(3)
+
+        assert file_manager.load_json(path, readonly=True) == {"a": [1, 2]}
+
+    def test_save_invalidates_cache(self, file_manager, temp_dir):
+        """Test that writes are visible to the next load."""
+        path = temp_dir / "data.json"
+        file_manager.save_json(path, {"v": 1}, create_backup=False)
+        file_manager.load_json(path)
+        file_manager.save_json(path, {"v": 2}, create_backup=False)
+
+        assert file_manager.load_json(path) == {"v": 2}
+
+    def test_cache_is_bounded(self, file_manager, temp_dir, test_settings, monkeypatch):
+        """Test that the least recently used file is evicted once the cache is full."""
+        monkeypatch.setattr(test_settings, "read_cache_size", 2)
+        file_manager.read_cache.clear()
+        paths = [temp_dir / f"{name}.json" for name in "abc"]
+        for path in paths:
+            file_manager.save_json(path, {"name": path.stem}, create_backup=False)
+
+        file_manager.load_json(paths[0])
+        file_manager.load_json(paths[1])
+        file_manager.load_json(paths[0])
+        file_manager.load_json(paths[2])
+
+        stats = file_manager.cache_stats()
+        assert (stats["entries"], stats["evictions"]) == (2, 1)
+        file_manager.load_json(paths[0])
+        assert file_manager.cache_stats()["hits"] == 2
+
+    def test_external_change_invalidates_cache(self, file_manager, temp_dir):
+        """Test that changes made outside FileManager are detected."""
+        path = temp_dir / "data.json"
+        file_manager.save_json(path, {"v": 1}, create_backup=False)
+        file_manager.load_json(path)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"v": 22}, f)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert file_manager.load_json(path) == {"v": 22}
+
+
+@pytest.mark.unit
+class TestFileManagerCompression:
+    """Test cases for compressed storage and backups."""
+
+    def test_gzip_round_trip_is_transparent(self, test_settings, temp_dir, monkeypatch):
+        """Test that compressed files load regardless of the configured codec."""
+        from src.ledger.repositories import FileManager
+
+        path = temp_dir / "ledger.json"
+        data = {"2025-01-15": [{"expense": "Rice", "amount": 1500.0}] * 50}
+
+        monkeypatch.setattr(test_settings, "compression", "gzip")
+        FileManager(test_settings).save_json(path, data, create_backup=False)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+
+        monkeypatch.setattr(test_settings, "compression", "none")
+        FileManager.read_cache.clear()
+        assert FileManager(test_settings).load_json(path) == data
+
+    def test_backups_are_compressed_and_rotated(self, test_settings, temp_dir, monkeypatch):
+        """Test that plain files are backed up compressed and old backups pruned."""
+        from src.ledger.repositories import FileManager
+
+        path = temp_dir / "ledger.json"
+        plain = FileManager(test_settings)
+        plain.save_json(path, {"v": [1] * 100}, create_backup=False)
+
+        monkeypatch.setattr(test_settings, "compression", "gzip")
+        monkeypatch.setattr(test_settings, "max_backups", 1)
+        manager = FileManager(test_settings)
+        backup = manager.create_backup(path)
+
+        assert backup.name.endswith(".json.gz")
+        assert backup.stat().st_size < path.stat().st_size
+        assert manager.load_json(backup) == {"v": [1] * 100}
+
+        stale = test_settings.backup_dir / "ledger_backup_19990101_000000.json"
+        stale.write_text("{}")
+        manager.create_backup(path)
+        assert not stale.exists()
+        assert len(manager.list_backups("ledger")) == 1
+
+    def test_unknown_compression(self, test_settings, monkeypatch):
+        """Test that unknown codecs are rejected."""
+        from src.ledger.repositories import FileManager
+
+        monkeypatch.setattr(test_settings, "compression", "lz4")
+        with pytest.raises(ValueError, match="Unknown compression"):
+            FileManager(test_settings)
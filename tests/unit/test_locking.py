@@ -0,0 +1,64 @@
+"""Unit tests for the repository readers-writer lock."""
+
+import threading
+import time
+
+import pytest
+
+from src.ledger.repositories.locking import ReadWriteLock
+
+
+@pytest.mark.unit
+class TestReadWriteLock:
+    """Test cases for ReadWriteLock."""
+
+    def test_readers_share_the_lock(self):
+        """Test that a second reader gets in while the first holds the lock."""
+        lock = ReadWriteLock()
+        entered = threading.Event()
+
+        def reader():
+            with lock.read():
+                entered.set()
+
+        with lock.read():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            assert entered.wait(1)
+        thread.join()
+
+    def test_writer_waits_for_readers(self):
+        """Test that a writer only enters once every reader has left."""
+        lock = ReadWriteLock()
+        events = []
+
+        def writer():
+            with lock.write():
+                events.append("write")
+
+        with lock.read():
+            thread = threading.Thread(target=writer)
+            thread.start()
+            time.sleep(0.05)
+            events.append("read done")
+        thread.join()
+
+        assert events == ["read done", "write"]
+
+    def test_reentrant(self):
+        """Test that the writer may re-enter and read, and readers may re-enter."""
+        lock = ReadWriteLock()
+        with lock.write(), lock.write(), lock.read():
+            pass
+        with lock.read(), lock.read():
+            pass
+        with lock.write():
+            pass
+
+    def test_upgrade_rejected(self):
+        """Test that a reader cannot take the lock for writing."""
+        lock = ReadWriteLock()
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                with lock.write():
+                    pass
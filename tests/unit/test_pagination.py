@@ -0,0 +1,145 @@
+"""Unit tests for cursor-paged expense listing."""
+
+import base64
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.services import ExpenseService
+from src.ledger.services.pagination import decode_cursor, encode_cursor
+
+
+def collect(service, limit, **kwargs):
+    """Walk every page, returning (expenses, page count)."""
+    expenses, pages, cursor = [], 0, None
+    while True:
+        page = service.get_expenses_page(cursor=cursor, limit=limit, **kwargs)
+        assert len(page["expenses"]) <= limit
+        expenses.extend(page["expenses"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return expenses, pages
+
+
+@pytest.mark.unit
+class TestExpensePages:
+    """Test cases for keyset paging over every backend."""
+
+    @pytest.fixture
+    def service(self, repository):
+        repository.add_many(
+            [
+                Expense.create(f"item {i}", 100 + i, f"2025-0{1 + i % 3}-{10 + i % 4}")
+                for i in range(23)
+            ]
+        )
+        return ExpenseService(repository)
+
+    @pytest.mark.parametrize("limit", [1, 4, 23, 50])
+    def test_pages_cover_range_in_order(self, service, limit):
+        """Test that walking the pages yields each expense once, in ledger order."""
+        expenses, pages = collect(service, limit)
+
+        expected = [
+            {**item, "date": date, "index": index}
+            for date, items in sorted(service.get_all_expenses().items())
+            for index, item in enumerate(items)
+        ]
+        assert expenses == expected
+        assert pages == max(1, -(-23 // limit))
+
+    @pytest.mark.parametrize("limit", [1, 4, 23, 50])
+    def test_newest_first_pages(self, service, limit):
+        """Test that newest-first pages walk dates backwards, entries in order."""
+        expenses, pages = collect(service, limit, newest_first=True)
+
+        expected = [
+            {**item, "date": date, "index": index}
+            for date, items in sorted(service.get_all_expenses().items(), reverse=True)
+            for index, item in enumerate(items)
+        ]
+        assert expenses == expected
+        assert pages == max(1, -(-23 // limit))
+
+    def test_newest_first_respects_range(self, service):
+        """Test that newest-first paging stays within the requested dates."""
+        expenses, _ = collect(
+            service, 2, start_date="2025-01-11", end_date="2025-02-12", newest_first=True
+        )
+
+        dates = [exp["date"] for exp in expenses]
+        assert dates == sorted(dates, reverse=True)
+        assert all("2025-01-11" <= date <= "2025-02-12" for date in dates)
+        totals = service.get_range_totals("2025-01-11", "2025-02-12")
+        assert len(expenses) == totals["transaction_count"]
+
+    def test_offset_matches_cursor(self, service):
+        """Test that an offset page lines up with the cursor walk."""
+        walked, _ = collect(service, 5, newest_first=True)
+        page = service.get_expenses_page(limit=5, newest_first=True, offset=10)
+
+        assert page["expenses"] == walked[10:15]
+        assert service.get_expenses_page(limit=5, offset=23)["expenses"] == []
+
+    def test_pages_respect_range(self, service):
+        """Test that paging is limited to the requested dates."""
+        expenses, _ = collect(service, 3, start_date="2025-02-11", end_date="2025-03-10")
+
+        assert expenses
+        assert all("2025-02-11" <= exp["date"] <= "2025-03-10" for exp in expenses)
+        totals = service.get_range_totals("2025-02-11", "2025-03-10")
+        assert len(expenses) == totals["transaction_count"]
+
+    @pytest.mark.parametrize("newest_first", [False, True])
+    @pytest.mark.parametrize("victim", ["before", "anchor"])
+    def test_cursor_survives_deletes(self, repository, newest_first, victim):
+        """Test that deleting rows on the cursor's date neither skips nor repeats rows."""
+        repository.add_many(
+            [Expense.create(f"item {i}", 100 + i, "2025-01-10") for i in range(6)]
+            + [Expense.create("later", 1, "2025-01-11"), Expense.create("earlier", 1, "2025-01-09")]
+        )
+        service = ExpenseService(repository)
+        first = service.get_expenses_page(limit=4 if newest_first else 3, newest_first=newest_first)
+        anchor = first["expenses"][-1]
+        assert anchor["date"] == "2025-01-10"
+
+        # Drop a row already returned on the anchor's date, or the anchor itself
+        index = 0 if victim == "before" else anchor["index"]
+        repository.delete_expense("2025-01-10", index)
+        rest, _ = collect(service, 100, newest_first=newest_first)
+        rest_page = service.get_expenses_page(
+            cursor=first["next_cursor"], limit=100, newest_first=newest_first
+        )["expenses"]
+
+        returned = {exp["id"] for exp in first["expenses"]}
+        expected = [exp["id"] for exp in rest if exp["id"] not in returned]
+        assert [exp["id"] for exp in rest_page] == expected
+
+    def test_invalid_arguments(self, service):
+        """Test that bad cursors and limits are rejected."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            service.get_expenses_page(cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="Limit"):
+            service.get_expenses_page(limit=0)
+        with pytest.raises(ValueError, match="Offset"):
+            service.get_expenses_page(offset=-1)
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Test cases for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test that a cursor decodes to the position it encodes."""
+        assert decode_cursor(encode_cursor("2025-01-15", "20250115ABC", 7)) == (
+            "2025-01-15",
+            "20250115ABC",
+            7,
+        )
+
+    def test_rejects_position_only_cursor(self):
+        """Test that a cursor without an expense ID slot is rejected."""
+        legacy = base64.urlsafe_b64encode(b'["2025-01-15",7]').decode()
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(legacy)
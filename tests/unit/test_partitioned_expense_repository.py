@@ -0,0 +1,77 @@
+"""Unit tests for PartitionedExpenseRepository."""
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.repositories import ExpenseRepository, PartitionedExpenseRepository
+
+
+@pytest.fixture
+def partitioned_repository(test_settings):
+    """Create a partitioned expense repository instance."""
+    return PartitionedExpenseRepository()
+
+
+@pytest.mark.unit
+class TestPartitionedExpenseRepository:
+    """Test cases for PartitionedExpenseRepository."""
+
+    def test_writes_only_touched_month(self, partitioned_repository, test_settings):
+        """Test that each month is stored in its own partition."""
+        partitioned_repository.add_expense(Expense.create("Lunch", 1500, "2025-01-15"))
+        partitioned_repository.add_expense(Expense.create("Taxi", 700, "2025-02-01"))
+
+        partition_dir = test_settings.ledger_partition_dir
+        assert sorted(p.name for p in partition_dir.glob("20*.json")) == [
+            "2025-01.json",
+            "2025-02.json",
+        ]
+        january = (partition_dir / "2025-01.json").stat().st_mtime_ns
+
+        partitioned_repository.add_expense(Expense.create("Bus", 200, "2025-02-02"))
+        assert (partition_dir / "2025-01.json").stat().st_mtime_ns == january
+
+    def test_range_reads_only_overlapping_partitions(self, partitioned_repository, mocker):
+        """Test that range queries skip partitions outside the range."""
+        for date in ["2024-12-31", "2025-01-15", "2025-03-01"]:
+            partitioned_repository.add_expense(Expense.create("Lunch", 100, date))
+
+        load_month = mocker.spy(partitioned_repository, "_load_month")
+        result = partitioned_repository.get_expenses_by_range("2025-01-01", "2025-02-28")
+
+        assert list(result) == ["2025-01-15"]
+        assert [call.args[0] for call in load_month.call_args_list] == ["2025-01"]
+
+    def test_delete_last_expense_removes_partition(self, partitioned_repository, test_settings):
+        """Test that emptied months are dropped from disk and manifest."""
+        partitioned_repository.add_expense(Expense.create("Lunch", 100, "2025-01-15"))
+        partitioned_repository.delete_expense("2025-01-15", 0)
+
+        assert not (test_settings.ledger_partition_dir / "2025-01.json").exists()
+        assert partitioned_repository.load_all() == {}
+
+    def test_version_changes_on_write(self, partitioned_repository, monkeypatch):
+        """Test that every write changes the ledger version, even with equal file stamps."""
+        monkeypatch.setattr(partitioned_repository.aggregates, "stamp", lambda: [None])
+        before = partitioned_repository.get_version()
+        partitioned_repository.add_expense(Expense.create("Lunch", 1500, "2025-01-15"))
+        after_add = partitioned_repository.get_version()
+        partitioned_repository.delete_expense("2025-01-15", 0)
+
+        assert before != after_add != partitioned_repository.get_version()
+        assert partitioned_repository.get_version()[0] == before[0] + 2
+
+    def test_migrates_single_file_ledger(self, test_settings, sample_expenses):
+        """Test splitting an existing ledger.json into partitions."""
+        ExpenseRepository().save_all(sample_expenses)
+
+        repository = PartitionedExpenseRepository()
+
+        migrated = repository.get_expenses_by_month("2025-01")
+        assert {
+            date: [(e["expense"], e["amount"]) for e in expenses]
+            for date, expenses in migrated.items()
+        } == {
+            date: [(e["expense"], e["amount"]) for e in expenses]
+            for date, expenses in sample_expenses.items()
+        }
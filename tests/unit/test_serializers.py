@@ -0,0 +1,41 @@
+"""Unit tests for storage serializers."""
+
+import pytest
+
+from src.ledger.repositories import FileManager
+from src.ledger.repositories.serializers import SERIALIZERS, get_serializer
+
+
+DATA = {"2025-01-15": [{"expense": "Moi-Moi ₦", "amount": 1500.5, "id": "x"}]}
+
+
+@pytest.mark.unit
+class TestSerializers:
+    """Test cases for serializer selection and format detection."""
+
+    @pytest.mark.parametrize("name", sorted(SERIALIZERS))
+    def test_round_trip_with_auto_detection(self, name, test_settings, temp_dir, monkeypatch):
+        """Test that files written by any serializer load with the default one."""
+        if name in ("orjson", "msgpack"):
+            pytest.importorskip(name)
+        path = temp_dir / "data.json"
+
+        monkeypatch.setattr(test_settings, "serializer", name)
+        FileManager(test_settings).save_json(path, DATA, create_backup=False)
+        monkeypatch.setattr(test_settings, "serializer", "json")
+
+        assert FileManager(test_settings).load_json(path) == DATA
+
+    def test_compact_json_is_smaller(self, temp_dir, test_settings, monkeypatch):
+        """Test that compact JSON drops pretty-printing whitespace."""
+        pretty, compact = temp_dir / "pretty.json", temp_dir / "compact.json"
+        FileManager(test_settings).save_json(pretty, DATA, create_backup=False)
+        monkeypatch.setattr(test_settings, "serializer", "json-compact")
+        FileManager(test_settings).save_json(compact, DATA, create_backup=False)
+
+        assert compact.stat().st_size < pretty.stat().st_size
+
+    def test_unknown_serializer(self):
+        """Test that unknown serializer names are rejected."""
+        with pytest.raises(ValueError, match="Unknown serializer"):
+            get_serializer("yaml")
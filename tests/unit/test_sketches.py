@@ -0,0 +1,101 @@
+"""Unit tests for approximate analytics sketches."""
+
+import bisect
+import random
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.domain.sketches import CountMinSketch, HyperLogLog, KLLSketch
+from src.ledger.services import AnalyticsService
+
+
+@pytest.mark.unit
+class TestSketches:
+    """Test cases for the sketch data structures."""
+
+    def test_kll_merged_quantiles_within_rank_error(self):
+        """Test that quantiles of merged partial sketches stay within rank error."""
+        rng = random.Random(3)
+        values = [rng.lognormvariate(7, 1.2) for _ in range(50_000)]
+        parts = [KLLSketch() for _ in range(6)]
+        for i, value in enumerate(values):
+            parts[i % 6].add(value)
+
+        merged = KLLSketch()
+        for part in parts:
+            merged.merge(KLLSketch.from_dict(part.to_dict()))
+
+        ordered = sorted(values)
+        assert merged.n == len(values)
+        for q in (0.5, 0.9, 0.99):
+            rank = bisect.bisect(ordered, merged.quantile(q)) / len(ordered)
+            assert abs(rank - q) < 0.02
+        assert KLLSketch().quantile(0.5) is None
+
+    def test_hyperloglog_estimate_and_merge(self):
+        """Test distinct-count accuracy, including across merged sketches."""
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(30_000):
+            first.add(f"name {i}")
+            second.add(f"name {i + 15_000}")
+        first.merge(HyperLogLog.from_dict(second.to_dict()))
+
+        assert abs(first.count() - 45_000) / 45_000 < 0.05
+        small = HyperLogLog()
+        for name in ["rice", "fuel", "rice", "data"]:
+            small.add(name)
+        assert small.count() == 3
+
+    def test_count_min_heavy_hitters(self):
+        """Test that counts never undercount and frequent names surface."""
+        sketch, other = CountMinSketch(), CountMinSketch()
+        counts = {"rice": 500, "fuel": 300, "data": 200}
+        counts.update({f"rare {i}": 1 for i in range(1000)})
+        for i, (name, count) in enumerate(counts.items()):
+            (sketch if i % 2 else other).add(name, count)
+        sketch.merge(CountMinSketch.from_dict(other.to_dict()))
+
+        assert all(sketch.estimate(name) >= count for name, count in counts.items())
+        assert [name for name, _ in sketch.heavy_hitters(3)] == ["rice", "fuel", "data"]
+
+
+@pytest.mark.unit
+class TestApproximateStats:
+    """Test cases for the approximate tier of AnalyticsService."""
+
+    def test_matches_scan_and_reuses_clean_months(
+        self, repository, category_service, monkeypatch, test_settings
+    ):
+        """Test persisted month sketches against a direct scan and their reuse."""
+        repository.add_many(
+            [
+                Expense.create(name, amount, date)
+                for date in ("2025-01-05", "2025-01-20", "2025-02-03", "2025-03-15")
+                for name, amount in (("Rice", 1000), ("Fuel", 2500), ("Airtime", 300))
+            ]
+        )
+        analytics = AnalyticsService(repository, category_service)
+        built = []
+        original = analytics.sketches._build
+        monkeypatch.setattr(
+            analytics.sketches, "_build", lambda lo, hi: built.append((lo, hi)) or original(lo, hi)
+        )
+
+        first = analytics.calculate_comprehensive_stats(approximate=True)["approximate"]
+        assert len(built) == 3
+
+        built.clear()
+        repository.add_expense(Expense.create("Rice", 900, "2025-03-16"))
+        ranged = analytics.calculate_comprehensive_stats("2025-01-10", None, approximate=True)
+        # Only the written month is rebuilt; the partial edge month is sketched directly
+        assert built == [("2025-03-01", "2025-03-31"), ("2025-01-10", "2025-01-31")]
+
+        assert first["distinct_expenses"] == 3
+        assert first["amount_quantiles"] == {"p50": 1000.0, "p90": 2500.0, "p99": 2500.0}
+        assert first["frequent_expenses"][0]["count"] == 4
+
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        scanned = analytics.calculate_comprehensive_stats("2025-01-10", None, approximate=True)
+        assert ranged["approximate"] == scanned["approximate"]
+        assert ranged["approximate"]["frequent_expenses"][0] == {"name": "Rice", "count": 4}
@@ -0,0 +1,97 @@
+"""Unit tests for SqliteExpenseRepository."""
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.repositories import (
+    ExpenseRepository,
+    SqliteExpenseRepository,
+    create_expense_repository,
+)
+
+
+@pytest.fixture
+def sqlite_repository(test_settings):
+    """Create a SQLite expense repository instance."""
+    repository = SqliteExpenseRepository()
+    yield repository
+    repository.close()
+
+
+@pytest.mark.unit
+class TestSqliteExpenseRepository:
+    """Test cases for SqliteExpenseRepository."""
+
+    def test_add_and_query(self, sqlite_repository, sample_expenses):
+        """Test point and range queries."""
+        for date, expenses in sample_expenses.items():
+            for exp in expenses:
+                sqlite_repository.add_expense(Expense.create(exp["expense"], exp["amount"], date))
+
+        assert [e["expense"] for e in sqlite_repository.get_expenses_by_date("2025-01-15")] == [
+            "Lunch",
+            "Transport",
+        ]
+        assert list(sqlite_repository.get_expenses_by_range("2025-01-16", "2025-01-31")) == [
+            "2025-01-16"
+        ]
+
+    def test_index_addressing_matches_json_repository(self, sqlite_repository):
+        """Test that (date, index) addressing behaves like the JSON backend."""
+        for name in ["Coffee", "Lunch", "Taxi"]:
+            sqlite_repository.add_expense(Expense.create(name, 100.0, "2025-01-15"))
+
+        assert sqlite_repository.find_expense_by_name("2025-01-15", "taxi") == 2
+
+        sqlite_repository.delete_expense("2025-01-15", 0)
+        sqlite_repository.update_expense("2025-01-15", 1, expense="bus", amount=50.0)
+
+        expenses = sqlite_repository.get_expenses_by_date("2025-01-15")
+        assert [(e["expense"], e["amount"]) for e in expenses] == [
+            ("Lunch", 100.0),
+            ("Bus", 50.0),
+        ]
+        with pytest.raises(ValueError):
+            sqlite_repository.delete_expense("2025-01-15", 5)
+
+    def test_migrates_json_ledger_once(self, test_settings, sample_expenses):
+        """Test the one-shot migration from ledger.json."""
+        ExpenseRepository().save_all(sample_expenses)
+
+        repository = SqliteExpenseRepository()
+        migrated = repository.load_all()
+        assert {
+            date: [(e["expense"], e["amount"]) for e in expenses]
+            for date, expenses in migrated.items()
+        } == {
+            date: [(e["expense"], float(e["amount"])) for e in expenses]
+            for date, expenses in sample_expenses.items()
+        }
+        assert all(e["id"] for expenses in migrated.values() for e in expenses)
+        repository.delete_all()
+        repository.close()
+
+        reopened = SqliteExpenseRepository()
+        assert reopened.load_all() == {}
+        reopened.close()
+
+    def test_version_increases_on_every_write(self, sqlite_repository):
+        """Test that the ledger version advances for writes from any connection."""
+        start = sqlite_repository.get_version()[0]
+        sqlite_repository.add_expense(Expense.create("Lunch", 1500, "2025-01-15"))
+        sqlite_repository.update_expense("2025-01-15", 0, amount=1600)
+        assert sqlite_repository.get_version()[0] == start + 2
+
+        other = SqliteExpenseRepository()
+        other.delete_expense("2025-01-15", 0)
+        other.close()
+        assert sqlite_repository.get_version()[0] == start + 3
+
+    def test_factory_selects_backend(self, test_settings, monkeypatch):
+        """Test backend selection through settings."""
+        assert isinstance(create_expense_repository(), ExpenseRepository)
+
+        monkeypatch.setattr(test_settings, "storage_backend", "sqlite")
+        repository = create_expense_repository()
+        assert isinstance(repository, SqliteExpenseRepository)
+        repository.close()
@@ -0,0 +1,67 @@
+"""Unit tests for top-K selection."""
+
+import random
+
+import pytest
+
+from src.ledger.domain.expense import Expense
+from src.ledger.services import AnalyticsService
+from src.ledger.services.topk import top_k, top_k_buckets
+
+
+@pytest.mark.unit
+class TestTopK:
+    """Test cases for the heap-based selection helpers."""
+
+    def test_matches_full_sort(self):
+        """Test that heap selection equals sorting everything and slicing."""
+        rng = random.Random(7)
+        items = [(f"key {i}", float(rng.randint(0, 50))) for i in range(500)]
+
+        for k in (1, 5, 10, 499, 500, 600):
+            assert top_k(items, k) == sorted(items, key=lambda x: (-x[1], x[0]))[:k]
+        assert top_k(items, 0) == []
+
+    def test_buckets_by_amount_and_count(self):
+        """Test ranking (total, count) buckets on either field."""
+        buckets = {"rice": (300.0, 1), "taxi": (100.0, 5), "data": (100.0, 2)}
+
+        assert top_k_buckets(buckets, 2) == [("rice", 300.0), ("data", 100.0)]
+        assert top_k_buckets(buckets, 2, by="count") == [("taxi", 5), ("data", 2)]
+        with pytest.raises(ValueError, match="Unknown ranking"):
+            top_k_buckets(buckets, 2, by="median")
+
+
+@pytest.mark.unit
+class TestGetTop:
+    """Test cases for AnalyticsService.get_top."""
+
+    @pytest.mark.parametrize("dimension", ["name", "category", "day"])
+    @pytest.mark.parametrize("by", ["amount", "count"])
+    def test_aggregates_match_scan(
+        self, repository, category_service, monkeypatch, test_settings, dimension, by
+    ):
+        """Test that rankings from aggregates equal rankings from a scan."""
+        repository.add_many(
+            [
+                Expense.create("Rice", 1000, "2025-01-15"),
+                Expense.create("Fuel", 2500, "2025-01-15"),
+                Expense.create("Rice", 1200, "2025-01-20"),
+                Expense.create("Taxi", 300, "2025-02-01"),
+                Expense.create("Taxi", 400, "2025-02-02"),
+                Expense.create("Taxi", 500, "2025-02-02"),
+            ]
+        )
+        analytics = AnalyticsService(repository, category_service)
+
+        from_aggregates = analytics.get_top(by, dimension, 2, "2025-01-16", None)
+        monkeypatch.setattr(test_settings, "aggregates_enabled", False)
+        from_scan = analytics.get_top(by, dimension, 2, "2025-01-16", None)
+
+        assert from_aggregates == from_scan
+        assert len(from_aggregates["items"]) == 2
+
+    def test_unknown_dimension(self, analytics_service):
+        """Test that an unknown dimension is rejected."""
+        with pytest.raises(ValueError, match="Unknown dimension"):
+            analytics_service.get_top(dimension="vendor")